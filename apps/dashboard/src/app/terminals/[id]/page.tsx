@@ -100,11 +100,17 @@ export default function TerminalDetail({ params }: { params: Promise<{ id: strin
           });
         });
 
-        // Set up WebSocket
+        // Set up WebSocket, passing the initial size so the PTY starts out matching xterm
+        try {
+          fitAddon.fit();
+        } catch (error) {
+          console.warn('Fit failed:', error);
+        }
         const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
-        const wsUrl = `${protocol}//${window.location.host}/api/terminals/${id}/ws`;
+        const wsUrl = `${protocol}//${window.location.host}/api/terminals/${id}/ws?cols=${term.cols}&rows=${term.rows}`;
 
         const ws = new WebSocket(wsUrl);
+        ws.binaryType = "arraybuffer";
         wsRef.current = ws;
 
         ws.onopen = () => {
@@ -122,7 +128,10 @@ export default function TerminalDetail({ params }: { params: Promise<{ id: strin
         };
 
         ws.onmessage = (event) => {
-          term.write(event.data);
+          // PTY output arrives as raw bytes; xterm.js decodes UTF-8 incrementally
+          term.write(
+            typeof event.data === "string" ? event.data : new Uint8Array(event.data)
+          );
         };
 
         ws.onclose = (ev) => {
@@ -1,38 +1,44 @@
 """Single FastAPI entry point for all HTTP routes."""
 
 import asyncio
-import fcntl
+import codecs
 import json
 import logging
 import os
-import pty
-import select
-import struct
-import subprocess
-import termios
+import random
+import shutil
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from importlib import resources
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
 import aiofiles
-import requests
+import anyio
+import httpx
+import orjson
 
 from fastapi import (
     FastAPI,
     HTTPException,
     Path as PathParam,
     Query,
+    Request,
+    Response,
     status,
     WebSocket,
     WebSocketDisconnect,
 )
 from pydantic import BaseModel, Field, field_validator
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 from watchdog.observers.polling import PollingObserver
 
 from cli_agent_orchestrator.clients.database import (
     assign_workflow_to_session as db_assign_workflow,
-    create_inbox_message,
+    create_inbox_messages_bulk,
     create_task,
     create_terminal_state,
     create_workflow,
@@ -47,6 +53,7 @@ from cli_agent_orchestrator.clients.database import (
     get_workflow,
     init_db,
     list_tasks,
+    list_terminals_by_session,
     list_workflows,
     update_task_assignment,
     update_task_status,
@@ -54,9 +61,16 @@ from cli_agent_orchestrator.clients.database import (
     update_workflow,
 )
 from cli_agent_orchestrator.clients.tmux import tmux_client
+from cli_agent_orchestrator.clients.tmux_view import tmux_views
 from cli_agent_orchestrator.constants import (
     AGENT_CONTEXT_DIR,
-    INBOX_POLLING_INTERVAL,
+    AGENT_DOWNLOAD_MAX_BYTES,
+    FLOW_DAEMON_MAX_SLEEP,
+    FLOW_EXECUTION_CONCURRENCY,
+    INBOX_DELIVERY_DEBOUNCE,
+    INBOX_FALLBACK_POLLING_INTERVAL,
+    INBOX_WRITE_BATCH_SIZE,
+    INBOX_WRITE_BATCH_WINDOW,
     KIRO_AGENTS_DIR,
     LOCAL_AGENT_STORE_DIR,
     Q_AGENTS_DIR,
@@ -65,16 +79,27 @@ from cli_agent_orchestrator.constants import (
     SERVER_VERSION,
     SESSION_PREFIX,
     TERMINAL_LOG_DIR,
+    WEBHOOK_BREAKER_FAIL_MAX,
+    WEBHOOK_BREAKER_RESET_TIMEOUT,
+    WEBHOOK_DEADLINE,
+    WEBHOOK_HOST_CONCURRENCY,
+    WEBHOOK_RETRY_ATTEMPTS,
+    WEBHOOK_RETRY_BACKOFF,
+    WEBHOOK_RETRY_MAX_DELAY,
 )
+from cli_agent_orchestrator.models.agent_profile import AgentProfile
 from cli_agent_orchestrator.models.kiro_agent import KiroAgentConfig
 from cli_agent_orchestrator.models.provider import ProviderType
 from cli_agent_orchestrator.models.q_agent import QAgentConfig
+from cli_agent_orchestrator.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from cli_agent_orchestrator.utils.agent_profiles import (
+    invalidate_agent_list,
     load_agent_profile,
     list_installed_agents,
+    read_agent_content,
 )
 
-from cli_agent_orchestrator.models.inbox import MessageStatus
+from cli_agent_orchestrator.models.inbox import InboxMessage, MessageStatus
 from cli_agent_orchestrator.models.terminal import Terminal, TerminalId, TerminalStatus
 from cli_agent_orchestrator.providers.manager import provider_manager
 from cli_agent_orchestrator.services import (
@@ -89,6 +114,7 @@ from cli_agent_orchestrator.services.inbox_service import LogFileHandler
 from cli_agent_orchestrator.services.terminal_service import OutputMode
 from cli_agent_orchestrator.utils.logging import setup_logging
 from cli_agent_orchestrator.utils.terminal import generate_session_name
+from cli_agent_orchestrator.api.responses import ORJSONResponse
 from cli_agent_orchestrator.api.task_endpoints import register_task_routes
 
 logger = logging.getLogger(__name__)
@@ -103,6 +129,15 @@ class WebhookExecuteRequest(BaseModel):
     headers: Optional[Dict[str, str]] = Field(
         default=None, description="Optional HTTP headers"
     )
+    max_body_bytes: int = Field(
+        default=65536,
+        ge=0,
+        description="Maximum number of response body bytes to read and return",
+    )
+    passthrough: bool = Field(
+        default=False,
+        description="Relay the upstream status, content type and raw body instead of wrapping them",
+    )
 
     @field_validator("method")
     @classmethod
@@ -117,6 +152,7 @@ class WebhookExecuteResponse(BaseModel):
     status_code: int
     response_body: str
     success: bool
+    truncated: bool = False  # response_body was cut at max_body_bytes
 
 
 class PromptOptimizeRequest(BaseModel):
@@ -135,25 +171,53 @@ class PromptSubmitRequest(BaseModel):
     prompt: str = Field(..., description="The prompt to submit to the session")
 
 
-async def flow_daemon():
-    """Background task to check and execute flows."""
+async def flow_daemon(wakeup: asyncio.Event):
+    """Background task to check and execute flows.
+
+    Sleeps until the earliest scheduled flow is due (capped at
+    FLOW_DAEMON_MAX_SLEEP), or until ``wakeup`` is set. Code that adds or
+    changes flows in-process should set ``app.state.flow_wakeup``.
+    """
     logger.info("Flow daemon started")
+    # Flow scripts, DB access and terminal startup all block, so they run in
+    # worker threads; due flows run side by side up to the concurrency limit
+    semaphore = asyncio.Semaphore(FLOW_EXECUTION_CONCURRENCY)
+
+    async def run_flow(name: str) -> None:
+        async with semaphore:
+            try:
+                executed = await asyncio.to_thread(flow_service.execute_flow, name)
+                if executed:
+                    logger.info(f"Flow '{name}' executed successfully")
+                else:
+                    logger.info(f"Flow '{name}' skipped (execute=false)")
+            except Exception as e:
+                logger.error(f"Flow '{name}' failed: {e}")
+
     while True:
         try:
-            flows = flow_service.get_flows_to_run()
-            for flow in flows:
-                try:
-                    executed = flow_service.execute_flow(flow.name)
-                    if executed:
-                        logger.info(f"Flow '{flow.name}' executed successfully")
-                    else:
-                        logger.info(f"Flow '{flow.name}' skipped (execute=false)")
-                except Exception as e:
-                    logger.error(f"Flow '{flow.name}' failed: {e}")
+            flows = await asyncio.to_thread(flow_service.get_flows_to_run)
+            await asyncio.gather(*(run_flow(flow.name) for flow in flows))
         except Exception as e:
             logger.error(f"Flow daemon error: {e}")
 
-        await asyncio.sleep(60)
+        sleep_seconds = float(FLOW_DAEMON_MAX_SLEEP)
+        try:
+            next_run = await asyncio.to_thread(flow_service.get_next_run_time)
+            if next_run is not None:
+                delay = (next_run - datetime.now()).total_seconds()
+                # A flow that is still due just failed; retry on the regular cadence
+                if delay > 0:
+                    sleep_seconds = min(delay, sleep_seconds)
+        except Exception as e:
+            logger.error(f"Flow daemon error: {e}")
+
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=sleep_seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            wakeup.clear()
 
 
 # Response Models
@@ -174,6 +238,41 @@ class InstallAgentRequest(BaseModel):
     provider: str = Field(..., description="Provider to install for")
 
 
+# Filesystem types where inotify/FSEvents do not see remote writes
+REMOTE_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "fuse.sshfs", "afs"}
+
+
+def _get_mount_fs_type(path: Path) -> Optional[str]:
+    """Return the filesystem type of the mount containing path (Linux only)."""
+    try:
+        mounts = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return None
+
+    resolved = str(path.resolve())
+    best_match = ""
+    fs_type = None
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace("\\040", " ")
+        if resolved == mount_point or resolved.startswith(mount_point.rstrip("/") + "/"):
+            if len(mount_point) > len(best_match):
+                best_match = mount_point
+                fs_type = fields[2]
+    return fs_type
+
+
+def _create_inbox_observer(path: Path) -> BaseObserver:
+    """Create a native observer for local paths, polling only for remote mounts."""
+    fs_type = _get_mount_fs_type(path)
+    if fs_type in REMOTE_FS_TYPES:
+        logger.info(f"{path} is on a remote filesystem ({fs_type}), using PollingObserver")
+        return PollingObserver(timeout=INBOX_FALLBACK_POLLING_INTERVAL)
+    return Observer()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -181,17 +280,30 @@ async def lifespan(app: FastAPI):
     setup_logging()
     init_db()
 
+    # Shared async HTTP client (pooled connections) for outbound requests made from handlers
+    # HTTP/2 is negotiated via ALPN on https hosts, multiplexing concurrent calls
+    # to the same webhook host over one connection; others stay on HTTP/1.1
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=32, keepalive_expiry=60
+        ),
+        follow_redirects=True,
+    )
+
     # Run cleanup in background
     asyncio.create_task(asyncio.to_thread(cleanup_old_data))
 
     # Start flow daemon as background task
-    daemon_task = asyncio.create_task(flow_daemon())
+    app.state.flow_wakeup = asyncio.Event()
+    daemon_task = asyncio.create_task(flow_daemon(app.state.flow_wakeup))
 
     # Start inbox watcher
-    inbox_observer = PollingObserver(timeout=INBOX_POLLING_INTERVAL)
+    inbox_observer = _create_inbox_observer(TERMINAL_LOG_DIR)
     inbox_observer.schedule(LogFileHandler(), str(TERMINAL_LOG_DIR), recursive=False)
     inbox_observer.start()
-    logger.info("Inbox watcher started (PollingObserver)")
+    logger.info(f"Inbox watcher started ({inbox_observer.__class__.__name__})")
 
     yield
 
@@ -200,6 +312,11 @@ async def lifespan(app: FastAPI):
     inbox_observer.join()
     logger.info("Inbox watcher stopped")
 
+    await app.state.http.aclose()
+    await _stop_inbox_writer()
+    await tmux_views.close_all()
+    tmux_client.close_all_control_clients()
+
     # Cancel daemon on shutdown
     daemon_task.cancel()
     try:
@@ -215,16 +332,36 @@ app = FastAPI(
     description="Simplified CLI Agent Orchestrator API",
     version=SERVER_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 register_task_routes(app)
 
 
-@app.get("/agents")
-async def list_agents() -> List[str]:
+# Short-lived cache for the agent listing, which UIs poll frequently
+AGENT_LIST_CACHE_TTL = 5.0
+_agent_list_cache: Optional[Tuple[float, List[str]]] = None
+_agent_list_lock = asyncio.Lock()
+
+
+def _invalidate_agent_list_cache() -> None:
+    global _agent_list_cache
+    _agent_list_cache = None
+    invalidate_agent_list()
+
+
+@app.get("/agents", response_model=List[str])
+async def list_agents() -> Response:
     """List all available agent profiles."""
+    global _agent_list_cache
     try:
-        return list_installed_agents()
+        async with _agent_list_lock:
+            now = time.monotonic()
+            if _agent_list_cache and now - _agent_list_cache[0] < AGENT_LIST_CACHE_TTL:
+                return ORJSONResponse(_agent_list_cache[1])
+            agents = list_installed_agents()
+            _agent_list_cache = (now, agents)
+            return ORJSONResponse(agents)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -232,23 +369,47 @@ async def list_agents() -> List[str]:
         )
 
 
-@app.get("/agents/{agent_name}/content")
-async def get_agent_content(agent_name: str) -> Dict[str, str]:
-    try:
-        local_profile = LOCAL_AGENT_STORE_DIR / f"{agent_name}.md"
-        if local_profile.exists():
-            return {"content": local_profile.read_text()}
+def _is_not_modified(request: Request, etag: str, last_modified: Optional[float]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the current validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as required for If-None-Match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
 
-        agent_store = resources.files("cli_agent_orchestrator.agent_store")
-        profile_file = agent_store / f"{agent_name}.md"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
 
-        if not profile_file.is_file():
+    return False
+
+
+@app.get("/agents/{agent_name}/content", response_model=Dict[str, str])
+async def get_agent_content(agent_name: str, request: Request) -> Response:
+    try:
+        agent = read_agent_content(agent_name)
+        if agent is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Agent '{agent_name}' not found",
             )
 
-        return {"content": profile_file.read_text()}
+        headers = {"ETag": agent.etag, "Cache-Control": "private, max-age=5"}
+        if agent.last_modified is not None:
+            headers["Last-Modified"] = formatdate(agent.last_modified, usegmt=True)
+
+        if _is_not_modified(request, agent.etag, agent.last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=orjson.dumps({"content": agent.content}),
+            media_type="application/json",
+            headers=headers,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -258,23 +419,116 @@ async def get_agent_content(agent_name: str) -> Dict[str, str]:
         )
 
 
-@app.get("/providers")
-async def list_providers() -> List[Dict[str, str]]:
+# Provider list is derived from an enum, so serialize it once at import time
+_PROVIDERS_PAYLOAD = [
+    {"value": provider.value, "label": provider.name.replace("_", " ").title()}
+    for provider in ProviderType
+]
+_PROVIDERS_JSON = orjson.dumps(_PROVIDERS_PAYLOAD)
+
+
+@app.get("/providers", response_model=List[Dict[str, str]])
+async def list_providers() -> Response:
     """List all available providers."""
+    return Response(content=_PROVIDERS_JSON, media_type="application/json")
+
+
+def _copy_file(source: Any, dest: Path) -> None:
+    """Byte-for-byte copy; uses the kernel fast path (sendfile) for real files."""
+    if isinstance(source, Path):
+        try:
+            shutil.copyfile(source, dest)
+        except shutil.SameFileError:
+            pass
+    else:
+        # Traversable from importlib.resources (e.g. zipped package data)
+        dest.write_bytes(source.read_bytes())
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hardlink dest to source, copying if linking fails (e.g. across filesystems)."""
+    dest.unlink(missing_ok=True)
     try:
-        return [
-            {"value": provider.value, "label": provider.name.replace("_", " ").title()}
-            for provider in ProviderType
-        ]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list providers: {str(e)}",
-        )
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
+async def _write_text(path: Path, content: str) -> None:
+    """Write a text file without blocking the event loop."""
+    async with aiofiles.open(path, "w") as f:
+        await f.write(content)
+
+
+async def _download_file(
+    http: httpx.AsyncClient, url: str, dest: Path, max_bytes: int
+) -> None:
+    """Stream url into dest, rejecting bodies larger than max_bytes.
+
+    The body is written to a sibling temp file and renamed into place, so a
+    failed or oversized download never leaves a partial dest behind.
+    """
+    partial = dest.with_name(dest.name + ".part")
+    try:
+        async with http.stream("GET", url) as response:
+            response.raise_for_status()
+            size = 0
+            async with aiofiles.open(partial, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ValueError(f"Download exceeds {max_bytes} bytes: {url}")
+                    await f.write(chunk)
+        await asyncio.to_thread(os.replace, partial, dest)
+    finally:
+        await asyncio.to_thread(partial.unlink, missing_ok=True)
+
+
+async def _write_if_changed(path: Path, payload: bytes) -> bool:
+    """Write payload to path unless the file already holds exactly these bytes."""
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            if await f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(payload)
+    return True
+
+
+async def _write_agent_config(
+    config_cls: Type[Union[QAgentConfig, KiroAgentConfig]],
+    agents_dir: Path,
+    profile: AgentProfile,
+    allowed_tools: List[str],
+    context_file: Path,
+) -> Path:
+    """Build a Q/Kiro CLI agent config from a profile and write it to agents_dir."""
+    await asyncio.to_thread(agents_dir.mkdir, parents=True, exist_ok=True)
+    agent_config = config_cls(
+        name=profile.name,
+        description=profile.description,
+        tools=profile.tools if profile.tools is not None else ["*"],
+        allowedTools=allowed_tools,
+        resources=[f"file://{context_file.absolute()}"],
+        prompt=profile.prompt,
+        mcpServers=profile.mcpServers,
+        toolAliases=profile.toolAliases,
+        toolsSettings=profile.toolsSettings,
+        hooks=profile.hooks,
+        model=profile.model,
+    )
+    # Same layout as `cao install`, so both install paths produce identical files
+    agent_file = agents_dir / f"{profile.name.replace('/', '__')}.json"
+    # Reinstalls usually produce an identical config; skip rewriting it
+    payload = agent_config.model_dump_json(indent=2, exclude_none=True).encode()
+    await _write_if_changed(agent_file, payload)
+    return agent_file
 
 
 @app.post("/agents/install")
-async def install_agent(request: InstallAgentRequest) -> Dict:
+async def install_agent(request: InstallAgentRequest, http_request: Request) -> Dict:
     """Install an agent."""
     try:
         agent_name = request.name
@@ -284,17 +538,14 @@ async def install_agent(request: InstallAgentRequest) -> Dict:
             if not request.path:
                 raise ValueError("Path (URL) is required for url source")
 
-            LOCAL_AGENT_STORE_DIR.mkdir(parents=True, exist_ok=True)
-            response = requests.get(request.path)
-            response.raise_for_status()
-            content = response.text
-
             filename = Path(request.path).name
             if not filename.endswith(".md"):
                 raise ValueError("URL must point to a .md file")
 
+            await asyncio.to_thread(LOCAL_AGENT_STORE_DIR.mkdir, parents=True, exist_ok=True)
             dest_file = LOCAL_AGENT_STORE_DIR / filename
-            dest_file.write_text(content)
+            http: httpx.AsyncClient = http_request.app.state.http
+            await _download_file(http, request.path, dest_file, AGENT_DOWNLOAD_MAX_BYTES)
             agent_name = dest_file.stem
 
         elif request.source_type == "file":
@@ -307,9 +558,9 @@ async def install_agent(request: InstallAgentRequest) -> Dict:
             if not source_path.suffix == ".md":
                 raise ValueError("File must be a .md file")
 
-            LOCAL_AGENT_STORE_DIR.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(LOCAL_AGENT_STORE_DIR.mkdir, parents=True, exist_ok=True)
             dest_file = LOCAL_AGENT_STORE_DIR / source_path.name
-            dest_file.write_text(source_path.read_text())
+            await asyncio.to_thread(_copy_file, source_path, dest_file)
             agent_name = dest_file.stem
 
         elif request.source_type == "built-in":
@@ -323,22 +574,24 @@ async def install_agent(request: InstallAgentRequest) -> Dict:
             if not request.name:
                 raise ValueError("Name is required for content source")
 
-            LOCAL_AGENT_STORE_DIR.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(LOCAL_AGENT_STORE_DIR.mkdir, parents=True, exist_ok=True)
             dest_file = LOCAL_AGENT_STORE_DIR / f"{request.name}.md"
-            dest_file.write_text(request.content)
+            await _write_text(dest_file, request.content)
             agent_name = request.name
 
         else:
             raise ValueError(f"Invalid source type: {request.source_type}")
 
+        _invalidate_agent_list_cache()
+
         # Load agent profile
         try:
-            profile = load_agent_profile(agent_name)
+            profile = await asyncio.to_thread(load_agent_profile, agent_name)
         except Exception as e:
             raise ValueError(f"Failed to load agent profile '{agent_name}': {e}")
 
         # Ensure directories exist
-        AGENT_CONTEXT_DIR.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(AGENT_CONTEXT_DIR.mkdir, parents=True, exist_ok=True)
 
         # Determine source for context file
         local_profile = LOCAL_AGENT_STORE_DIR / f"{agent_name}.md"
@@ -350,10 +603,17 @@ async def install_agent(request: InstallAgentRequest) -> Dict:
             if not source_file.is_file():  # Check if built-in exists
                 raise FileNotFoundError(f"Built-in agent '{agent_name}' not found")
 
-        # Copy markdown file to agent-context directory
+        # Link (or copy) markdown file into the agent-context directory. Only
+        # user-owned local profiles are linked, so edits to the context file
+        # can never reach the installed package's built-in profiles.
         dest_file = AGENT_CONTEXT_DIR / f"{profile.name}.md"
-        with open(source_file, "r") as src:
-            dest_file.write_text(src.read())
+        if source_file is local_profile:
+            await asyncio.to_thread(_link_or_copy, local_profile, dest_file)
+        else:
+            # dest may still be a hardlink to a local profile installed under this name;
+            # copying through it would overwrite that user file with the built-in
+            await asyncio.to_thread(dest_file.unlink, missing_ok=True)
+            await asyncio.to_thread(_copy_file, source_file, dest_file)
 
         # Build allowedTools
         allowed_tools = profile.allowedTools
@@ -366,44 +626,13 @@ async def install_agent(request: InstallAgentRequest) -> Dict:
         # Create agent config based on provider
         agent_file = None
         if request.provider == ProviderType.Q_CLI.value:
-            Q_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
-            agent_config = QAgentConfig(
-                name=profile.name,
-                description=profile.description,
-                tools=profile.tools if profile.tools is not None else ["*"],
-                allowedTools=allowed_tools,
-                resources=[f"file://{dest_file.absolute()}"],
-                prompt=profile.prompt,
-                mcpServers=profile.mcpServers,
-                toolAliases=profile.toolAliases,
-                toolsSettings=profile.toolsSettings,
-                hooks=profile.hooks,
-                model=profile.model,
+            agent_file = await _write_agent_config(
+                QAgentConfig, Q_AGENTS_DIR, profile, allowed_tools, dest_file
             )
-            safe_filename = profile.name.replace("/", "__")
-            agent_file = Q_AGENTS_DIR / f"{safe_filename}.json"
-            with open(agent_file, "w") as f:
-                f.write(agent_config.model_dump_json(indent=2, exclude_none=True))
-
         elif request.provider == ProviderType.KIRO_CLI.value:
-            KIRO_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
-            agent_config = KiroAgentConfig(
-                name=profile.name,
-                description=profile.description,
-                tools=profile.tools if profile.tools is not None else ["*"],
-                allowedTools=allowed_tools,
-                resources=[f"file://{dest_file.absolute()}"],
-                prompt=profile.prompt,
-                mcpServers=profile.mcpServers,
-                toolAliases=profile.toolAliases,
-                toolsSettings=profile.toolsSettings,
-                hooks=profile.hooks,
-                model=profile.model,
+            agent_file = await _write_agent_config(
+                KiroAgentConfig, KIRO_AGENTS_DIR, profile, allowed_tools, dest_file
             )
-            safe_filename = profile.name.replace("/", "__")
-            agent_file = KIRO_AGENTS_DIR / f"{safe_filename}.json"
-            with open(agent_file, "w") as f:
-                f.write(agent_config.model_dump_json(indent=2, exclude_none=True))
 
         return {
             "success": True,
@@ -426,6 +655,17 @@ async def health_check():
     return {"status": "ok", "service": "cli-agent-orchestrator"}
 
 
+def _create_workflow_session(session_name: str, workflow_id: str) -> None:
+    """Ensure a tmux session exists for a workflow and record the assignment."""
+    if not tmux_client.session_exists(session_name):
+        tmux_client.create_session(
+            session_name=session_name,
+            window_name="workflow-init",
+            terminal_id="workflow-placeholder",
+        )
+    session_service.assign_workflow_to_session(session_name, workflow_id)
+
+
 @app.post("/sessions", response_model=Terminal, status_code=status.HTTP_201_CREATED)
 async def create_session(
     provider: str,
@@ -444,13 +684,7 @@ async def create_session(
                 )
             else:
                 session_name_to_use = generate_session_name()
-            if not tmux_client.session_exists(session_name_to_use):
-                tmux_client.create_session(
-                    session_name=session_name_to_use,
-                    window_name="workflow-init",
-                    terminal_id="workflow-placeholder",
-                )
-            session_service.assign_workflow_to_session(session_name_to_use, workflow_id)
+            await asyncio.to_thread(_create_workflow_session, session_name_to_use, workflow_id)
             return Terminal(
                 id="workflow-placeholder",
                 name="workflow-init",
@@ -460,7 +694,8 @@ async def create_session(
                 status=TerminalStatus.IDLE,
             )
         else:
-            result = terminal_service.create_terminal(
+            result = await asyncio.to_thread(
+                terminal_service.create_terminal,
                 provider=provider,
                 agent_profile=agent_profile,
                 session_name=session_name,
@@ -477,10 +712,10 @@ async def create_session(
         )
 
 
-@app.get("/sessions")
-async def list_sessions() -> List[Dict]:
+@app.get("/sessions", response_model=List[Dict])
+async def list_sessions() -> Response:
     try:
-        return session_service.list_sessions()
+        return ORJSONResponse(await asyncio.to_thread(session_service.list_sessions))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -491,7 +726,7 @@ async def list_sessions() -> List[Dict]:
 @app.get("/sessions/{session_name}")
 async def get_session(session_name: str) -> Dict:
     try:
-        return session_service.get_session(session_name)
+        return await asyncio.to_thread(session_service.get_session, session_name)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -504,7 +739,7 @@ async def get_session(session_name: str) -> Dict:
 @app.delete("/sessions/{session_name}")
 async def delete_session(session_name: str) -> Dict:
     try:
-        success = session_service.delete_session(session_name)
+        success = await asyncio.to_thread(session_service.delete_session, session_name)
         return {"success": success}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -525,7 +760,8 @@ async def create_terminal_in_session(
 ) -> Terminal:
     """Create additional terminal in existing session."""
     try:
-        result = terminal_service.create_terminal(
+        result = await asyncio.to_thread(
+            terminal_service.create_terminal,
             provider=provider,
             agent_profile=agent_profile,
             session_name=session_name,
@@ -541,13 +777,13 @@ async def create_terminal_in_session(
         )
 
 
-@app.get("/sessions/{session_name}/terminals")
-async def list_terminals_in_session(session_name: str) -> List[Dict]:
+@app.get("/sessions/{session_name}/terminals", response_model=List[Dict])
+async def list_terminals_in_session(session_name: str) -> Response:
     """List all terminals in a session."""
     try:
-        from cli_agent_orchestrator.clients.database import list_terminals_by_session
-
-        return list_terminals_by_session(session_name)
+        return ORJSONResponse(
+            await asyncio.to_thread(list_terminals_by_session, session_name)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -633,189 +869,236 @@ async def delete_terminal(terminal_id: TerminalId) -> Dict:
         )
 
 
+def _terminal_window(terminal_id: str) -> Tuple[str, str]:
+    """Return a terminal's (tmux_session, tmux_window).
+
+    get_terminal_metadata is served from the database lookup cache, which expires
+    entries, so terminals deleted by another process stop resolving here too.
+    Raises ValueError for unknown terminals.
+    """
+    metadata = get_terminal_metadata(terminal_id)
+    if not metadata:
+        raise ValueError(f"Terminal '{terminal_id}' not found")
+    return metadata["tmux_session"], metadata["tmux_window"]
+
+
 @app.websocket("/terminals/{terminal_id}/ws")
-async def websocket_endpoint(websocket: WebSocket, terminal_id: str):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    terminal_id: str,
+    cols: int = Query(default=80, ge=1, le=1000),
+    rows: int = Query(default=24, ge=1, le=1000),
+):
     """Clean PTY-Bridge WebSocket endpoint for xterm.js.
 
     Architecture:
-    - Creates own PTY (master/slave) for isolation
-    - Spawns 'tmux attach' in the slave PTY
+    - One 'tmux attach' per window runs in its own PTY, shared by every
+      WebSocket viewing that window (see clients/tmux_view.py)
+    - The PTY starts at the first client's cols/rows so tmux renders once
+      at the right size
     - Input: WebSocket → write to PTY master
-    - Output: read from PTY master → WebSocket
+    - Output: read from PTY master once → each WebSocket (binary frames)
     - No file polling, 0ms latency
     """
     await websocket.accept()
     logger.info(f"WebSocket connected: {terminal_id}")
 
-    # Get terminal metadata
+    # Get terminal metadata and attach to the window's shared view
     try:
-        metadata = get_terminal_metadata(terminal_id)
-        if not metadata:
+        try:
+            tmux_session, tmux_window = _terminal_window(terminal_id)
+        except ValueError:
             logger.error(f"Terminal {terminal_id} not found")
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
-        session_name = metadata["tmux_session"]
-        window_name = metadata["tmux_window"]
+        view = await tmux_views.get_or_create_view(tmux_session, tmux_window, cols, rows)
 
     except Exception as e:
         logger.error(f"WebSocket setup failed: {e}")
         await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
         return
 
-    # Create PTY for tmux attach subprocess
-    master_fd, slave_fd = pty.openpty()
-
-    # Start tmux attach (WITHOUT -r flag, we need full interaction)
-    target = f"{session_name}:{window_name}"
-    proc = subprocess.Popen(
-        ["tmux", "attach-session", "-t", target],
-        stdin=slave_fd,
-        stdout=slave_fd,
-        stderr=slave_fd,
-        preexec_fn=os.setsid,  # New session for clean process management
-        close_fds=True,
-    )
-    os.close(slave_fd)  # Close slave in parent
-    logger.info(f"PTY created for {target}, master_fd={master_fd}, pid={proc.pid}")
-
-    # Make master_fd non-blocking for asyncio compatibility
-    flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-    fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    # Output frames for this client; bounded, a lagging client is resynced by a repaint
+    frames = view.subscribe()
 
-    # Output reader: PTY Master → WebSocket
-    async def pty_to_websocket():
-        loop = asyncio.get_running_loop()
+    async def websocket_sender():
         try:
             while True:
-                try:
-                    # Use select in executor for non-blocking read
-                    readable, _, _ = await loop.run_in_executor(
-                        None, select.select, [master_fd], [], [], 0.1
-                    )
-
-                    if not readable:
-                        # Check if process died
-                        if proc.poll() is not None:
-                            logger.info(
-                                f"PTY process exited with code {proc.returncode}"
-                            )
-                            break
-                        continue
-
-                    # Read available data
-                    data = os.read(master_fd, 4096)
-                    if not data:
-                        logger.info("PTY closed (EOF)")
-                        break
+                frame = await frames.get()
+                if frame is None:
+                    # The shared PTY is gone; end the session instead of leaving it silent
+                    await websocket.close()
+                    break
+                # Raw bytes: the client decodes, so split UTF-8 sequences survive
+                await websocket.send_bytes(frame)
+        except Exception as e:
+            logger.error(f"WebSocket send error: {e}")
 
-                    # Send to WebSocket
-                    await websocket.send_text(data.decode("utf-8", errors="replace"))
+    sender_task = asyncio.create_task(websocket_sender())
 
-                except OSError as e:
-                    logger.error(f"PTY read error: {e}")
-                    break
-                except Exception as e:
-                    logger.error(f"Unexpected error in PTY reader: {e}")
-                    break
-        finally:
-            logger.info("PTY reader shutting down")
-            if proc.poll() is None:
-                proc.terminate()
-                try:
-                    proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
+    def handle_input(message: Dict) -> None:
+        view.write(message["data"].encode("utf-8"))
+
+    def handle_resize(message: Dict) -> None:
+        view.resize(int(message.get("cols", 80)), int(message.get("rows", 24)))
 
-    reader_task = asyncio.create_task(pty_to_websocket())
+    handlers = {"input": handle_input, "resize": handle_resize}
 
     # Input handler: WebSocket → PTY Master
     try:
         while True:
-            data = await websocket.receive_text()
+            event = await websocket.receive()
+            if event["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(event.get("code", 1000))
+
+            # Binary frames are raw keystrokes and go to the PTY undecoded
+            if event.get("bytes") is not None:
+                view.write(event["bytes"])
+                continue
+            data = event.get("text") or ""
+
+            # Control messages are JSON objects; anything else is raw input
+            if data[:1] != "{":
+                view.write(data.encode("utf-8"))
+                continue
 
             try:
-                message = json.loads(data)
-
-                if isinstance(message, dict) and "type" in message:
-                    if message["type"] == "input":
-                        # Write input to PTY master
-                        input_data = message["data"].encode("utf-8")
-                        os.write(master_fd, input_data)
-
-                    elif message["type"] == "resize":
-                        cols = int(message.get("cols", 80))
-                        rows = int(message.get("rows", 24))
-
-                        winsize = struct.pack("HHHH", rows, cols, 0, 0)
-                        fcntl.ioctl(master_fd, termios.TIOCSWINSZ, winsize)
-
-                        try:
-                            subprocess.run(
-                                [
-                                    "tmux",
-                                    "refresh-client",
-                                    "-t",
-                                    f"{session_name}:{window_name}",
-                                ],
-                                check=False,
-                                timeout=1,
-                            )
-
-                            await asyncio.sleep(0.05)
-
-                            tmux_client.resize_window(
-                                session_name, window_name, cols, rows
-                            )
-                            logger.info(f"Resized PTY and tmux window to {cols}x{rows}")
-                        except Exception as e:
-                            logger.error(f"Failed to resize tmux window: {e}")
-                            logger.info(
-                                f"PTY resized to {cols}x{rows} (tmux resize failed)"
-                            )
-                else:
-                    # Fallback: treat as raw input
-                    os.write(master_fd, data.encode("utf-8"))
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                view.write(data.encode("utf-8"))
+                continue
 
-            except json.JSONDecodeError:
-                # Not JSON, treat as raw input
-                os.write(master_fd, data.encode("utf-8"))
+            handler = handlers.get(message.get("type"))
+            if handler:
+                handler(message)
+            elif "type" not in message:
+                view.write(data.encode("utf-8"))
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected: {terminal_id}")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
-        # Cleanup
-        logger.info("Cleaning up PTY resources")
-        reader_task.cancel()
-
+        view.unsubscribe(frames)
+        sender_task.cancel()
         try:
-            os.close(master_fd)
-        except:
+            await sender_task
+        except asyncio.CancelledError:
             pass
 
-        if proc.poll() is None:
-            proc.terminate()
+
+# Debounced inbox delivery: a burst of messages to one receiver triggers a single drain
+_pending_deliveries: Dict[str, asyncio.TimerHandle] = {}
+_background_tasks: set = set()
+
+
+def _deliver_pending_messages(receiver_id: str) -> None:
+    """Run inbox delivery for a receiver in a worker thread."""
+    _pending_deliveries.pop(receiver_id, None)
+
+    async def deliver() -> None:
+        try:
+            await asyncio.to_thread(
+                inbox_service.check_and_send_pending_messages, receiver_id
+            )
+        except Exception as e:
+            logger.error(f"Inbox delivery to {receiver_id} failed: {e}")
+
+    task = asyncio.create_task(deliver())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+# Group commit for new inbox messages: concurrent POSTs share one transaction
+_inbox_write_queue: Optional[asyncio.Queue] = None
+_inbox_writer_task: Optional[asyncio.Task] = None
+
+
+async def _inbox_writer(queue: asyncio.Queue) -> None:
+    """Insert queued inbox messages in batches and resolve each caller's future."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + INBOX_WRITE_BATCH_WINDOW
+        while len(batch) < INBOX_WRITE_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
             try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
 
+        rows = [(sender_id, receiver_id, message) for sender_id, receiver_id, message, _ in batch]
         try:
-            await reader_task
+            created = await asyncio.to_thread(create_inbox_messages_bulk, rows)
         except asyncio.CancelledError:
-            pass
+            for *_, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Failed to insert {len(batch)} inbox message(s): {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+
+        for (*_, future), inbox_msg in zip(batch, created):
+            if not future.done():
+                future.set_result(inbox_msg)
+
+
+async def _queue_inbox_message(sender_id: str, receiver_id: str, message: str) -> InboxMessage:
+    """Hand a new message to the batching writer and wait for the stored row."""
+    global _inbox_write_queue, _inbox_writer_task
+    loop = asyncio.get_running_loop()
+    if (
+        _inbox_writer_task is None
+        or _inbox_writer_task.done()
+        or _inbox_writer_task.get_loop() is not loop
+    ):
+        _inbox_write_queue = asyncio.Queue()
+        _inbox_writer_task = asyncio.create_task(_inbox_writer(_inbox_write_queue))
+
+    future = loop.create_future()
+    _inbox_write_queue.put_nowait((sender_id, receiver_id, message, future))
+    return await future
+
+
+async def _stop_inbox_writer() -> None:
+    global _inbox_writer_task
+    if _inbox_writer_task is None:
+        return
+    _inbox_writer_task.cancel()
+    try:
+        await _inbox_writer_task
+    except asyncio.CancelledError:
+        pass
+    _inbox_writer_task = None
+
+
+def _schedule_inbox_delivery(receiver_id: str) -> None:
+    """(Re)arm the delivery timer for a receiver."""
+    handle = _pending_deliveries.pop(receiver_id, None)
+    if handle:
+        handle.cancel()
+    loop = asyncio.get_running_loop()
+    _pending_deliveries[receiver_id] = loop.call_later(
+        INBOX_DELIVERY_DEBOUNCE, _deliver_pending_messages, receiver_id
+    )
 
 
-@app.post("/terminals/{receiver_id}/inbox/messages")
+@app.post(
+    "/terminals/{receiver_id}/inbox/messages", status_code=status.HTTP_202_ACCEPTED
+)
 async def create_inbox_message_endpoint(
     receiver_id: TerminalId, sender_id: str, message: str
 ) -> Dict:
-    """Create inbox message and attempt immediate delivery."""
+    """Create inbox message and schedule delivery."""
     try:
-        inbox_msg = create_inbox_message(sender_id, receiver_id, message)
-        inbox_service.check_and_send_pending_messages(receiver_id)
+        inbox_msg = await _queue_inbox_message(sender_id, receiver_id, message)
+        _schedule_inbox_delivery(receiver_id)
 
         return {
             "success": True,
@@ -833,14 +1116,14 @@ async def create_inbox_message_endpoint(
         )
 
 
-@app.get("/terminals/{terminal_id}/inbox/messages")
+@app.get("/terminals/{terminal_id}/inbox/messages", response_model=List[Dict])
 async def get_inbox_messages_endpoint(
     terminal_id: TerminalId,
     limit: int = Query(
         default=10, le=100, description="Maximum number of messages to retrieve"
     ),
     status: Optional[str] = Query(default=None, description="Filter by message status"),
-) -> List[Dict]:
+) -> Response:
     """Get inbox messages for a terminal.
 
     Args:
@@ -864,7 +1147,9 @@ async def get_inbox_messages_endpoint(
                 )
 
         # Get messages using existing database function
-        messages = get_inbox_messages(terminal_id, limit=limit, status=status_filter)
+        messages = await asyncio.to_thread(
+            get_inbox_messages, terminal_id, limit=limit, status=status_filter
+        )
 
         # Convert to response format
         result = []
@@ -876,13 +1161,11 @@ async def get_inbox_messages_endpoint(
                     "receiver_id": msg.receiver_id,
                     "message": msg.message,
                     "status": msg.status.value,
-                    "created_at": msg.created_at.isoformat()
-                    if msg.created_at
-                    else None,
+                    "created_at": msg.created_at,
                 }
             )
 
-        return result
+        return ORJSONResponse(result)
 
     except HTTPException:
         # Re-raise HTTPException (validation errors)
@@ -896,48 +1179,184 @@ async def get_inbox_messages_endpoint(
         )
 
 
+# Per-host isolation for outbound calls: one dead or overloaded host fails fast
+# and cannot tie up more than WEBHOOK_HOST_CONCURRENCY requests
+_host_breakers: Dict[str, CircuitBreaker] = {}
+_host_bulkheads: Dict[str, asyncio.Semaphore] = {}
+
+
+@asynccontextmanager
+async def _guard_host(url: str) -> AsyncIterator[None]:
+    """Apply the destination host's circuit breaker and concurrency limit to a call.
+
+    Raises CircuitOpenError without calling out if the host's circuit is open.
+    Connection errors and timeouts count as failures.
+    """
+    host = httpx.URL(url).netloc.decode()
+    breaker = _host_breakers.get(host)
+    if breaker is None:
+        breaker = _host_breakers[host] = CircuitBreaker(
+            WEBHOOK_BREAKER_FAIL_MAX, WEBHOOK_BREAKER_RESET_TIMEOUT
+        )
+    breaker.before_call()
+
+    bulkhead = _host_bulkheads.get(host)
+    if bulkhead is None:
+        bulkhead = _host_bulkheads[host] = asyncio.Semaphore(WEBHOOK_HOST_CONCURRENCY)
+
+    async with bulkhead:
+        try:
+            yield
+        except httpx.RequestError:
+            breaker.record_failure()
+            raise
+    breaker.record_success()
+
+
+# Upstream statuses that mean "not handled, try again"; other 4xx/5xx are final
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# A 502/504 or a lost response may come after the upstream already acted, so
+# non-idempotent requests are only retried when they were never processed
+_NON_IDEMPOTENT_RETRY_STATUS_CODES = frozenset({429, 503})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Raised before the request was sent, so retrying cannot repeat it
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+async def _send_with_retry(
+    http: httpx.AsyncClient, request: httpx.Request, stream: bool = False
+) -> httpx.Response:
+    """Send a request, retrying transient failures with exponential backoff and full jitter.
+
+    Idempotent methods retry timeouts, dropped connections and 429/502/503/504
+    responses; others (e.g. POST) only retry connection failures and 429/503, so
+    a webhook is never run twice. Up to WEBHOOK_RETRY_ATTEMPTS in total; the last
+    response or error is returned or raised. With stream=True the caller must
+    close the returned response.
+    """
+    if request.method in _IDEMPOTENT_METHODS:
+        retry_errors: Tuple[Type[Exception], ...] = (
+            httpx.TimeoutException,
+            httpx.RemoteProtocolError,
+            *_CONNECT_ERRORS,
+        )
+        retry_statuses = _RETRY_STATUS_CODES
+    else:
+        retry_errors = _CONNECT_ERRORS
+        retry_statuses = _NON_IDEMPOTENT_RETRY_STATUS_CODES
+
+    async def attempt() -> httpx.Response:
+        # Never let one attempt wait past the caller's deadline
+        remaining = anyio.current_effective_deadline() - anyio.current_time()
+        request.extensions["timeout"] = {
+            phase: remaining if limit is None else min(limit, remaining)
+            for phase, limit in http.timeout.as_dict().items()
+        }
+        async with _guard_host(str(request.url)):
+            return await http.send(request, stream=stream)
+
+    for retry in range(WEBHOOK_RETRY_ATTEMPTS - 1):
+        try:
+            response = await attempt()
+        except retry_errors:
+            pass
+        else:
+            if response.status_code not in retry_statuses:
+                return response
+            await response.aclose()
+
+        delay = min(WEBHOOK_RETRY_MAX_DELAY, WEBHOOK_RETRY_BACKOFF * 2**retry)
+        await asyncio.sleep(random.uniform(0, delay))
+
+    return await attempt()
+
+
 @app.post("/webhooks/execute", response_model=WebhookExecuteResponse)
-async def execute_webhook(request: WebhookExecuteRequest) -> WebhookExecuteResponse:
+async def execute_webhook(request: WebhookExecuteRequest, http_request: Request) -> Response:
     """Execute a webhook request with the provided configuration.
 
     Args:
         request: Webhook configuration including URL, method, payload, and headers
 
     Returns:
-        WebhookExecuteResponse with status code, response body, and success flag
+        JSON matching WebhookExecuteResponse: status code, response body, success and
+        truncated flags;
+        with passthrough, the upstream response itself (body capped at max_body_bytes,
+        with an 'X-Body-Truncated: true' header when the cap cut it short)
 
     Raises:
         HTTPException: If webhook execution fails
     """
     try:
-        headers = request.headers or {}
-        headers.setdefault("Content-Type", "text/plain")
+        # Bounds the whole call, retries and response handling included
+        with anyio.fail_after(WEBHOOK_DEADLINE):
+            headers = request.headers or {}
+            headers.setdefault("Content-Type", "text/plain")
+
+            http: httpx.AsyncClient = http_request.app.state.http
+            outbound = http.build_request(
+                method=request.method,
+                url=request.webhookUrl,
+                content=request.payload,
+                headers=headers,
+            )
+            response = await _send_with_retry(http, outbound, stream=True)
+            try:
+                # Read only as much of the body as the caller asked for, plus enough
+                # to tell whether anything was left over
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > request.max_body_bytes:
+                        break
+                truncated = len(body) > request.max_body_bytes
+                del body[request.max_body_bytes :]
+            finally:
+                await response.aclose()
+
+            if request.passthrough:
+                # A cut body may no longer parse as its content type; tell the caller
+                return Response(
+                    content=bytes(body),
+                    status_code=response.status_code,
+                    media_type=response.headers.get("content-type", "application/octet-stream"),
+                    headers={"X-Body-Truncated": "true"} if truncated else None,
+                )
 
-        response = requests.request(
-            method=request.method,
-            url=request.webhookUrl,
-            data=request.payload,
-            headers=headers,
-            timeout=30,
-        )
+            # A cut-off multi-byte character at the end is dropped rather than garbled
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            response_body = decoder.decode(bytes(body), final=not truncated)
 
-        return WebhookExecuteResponse(
-            status_code=response.status_code,
-            response_body=response.text,
-            success=200 <= response.status_code < 300,
+            # Fields are already typed; response_model only documents the shape
+            return ORJSONResponse(
+                {
+                    "status_code": response.status_code,
+                    "response_body": response_body,
+                    "success": 200 <= response.status_code < 300,
+                    "truncated": truncated,
+                }
+            )
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Webhook request exceeded the {WEBHOOK_DEADLINE:g} second deadline",
         )
-
-    except requests.exceptions.Timeout:
+    except CircuitOpenError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Circuit open for host {httpx.URL(request.webhookUrl).host}",
+        )
+    except httpx.TimeoutException:
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="Webhook request timed out after 30 seconds",
         )
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Failed to connect to webhook URL",
         )
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Webhook execution failed: {str(e)}",
@@ -945,64 +1364,83 @@ async def execute_webhook(request: WebhookExecuteRequest) -> WebhookExecuteRespo
 
 
 @app.post("/prompt/optimize", response_model=PromptOptimizeResponse)
-async def optimize_prompt(request: PromptOptimizeRequest) -> PromptOptimizeResponse:
+async def optimize_prompt(request: PromptOptimizeRequest, http_request: Request) -> Response:
     """Optimize a prompt using n8n webhook.
 
     Args:
         request: Prompt optimization request with webhook_url
 
     Returns:
-        PromptOptimizeResponse with optimized and original prompts
+        JSON matching PromptOptimizeResponse: optimized and original prompts
     """
     try:
-        payload = {"prompt": request.prompt}
+        # Bounds the whole call, retries and response handling included
+        with anyio.fail_after(WEBHOOK_DEADLINE):
+            payload = {"prompt": request.prompt}
+
+            http: httpx.AsyncClient = http_request.app.state.http
+            response = await _send_with_retry(
+                http,
+                http.build_request(
+                    "POST",
+                    request.webhook_url,
+                    json=payload,
+                    headers={"Content-Type": "application/json"},
+                ),
+            )
 
-        response = requests.post(
-            request.webhook_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30,
-        )
+            if not response.is_success:
+                error_detail = f"Webhook returned status {response.status_code}"
+                try:
+                    error_body = orjson.loads(response.content)
+                    if "message" in error_body:
+                        error_detail = error_body["message"]
+                    if "hint" in error_body:
+                        error_detail += f" - {error_body['hint']}"
+                except Exception:
+                    error_detail += f" - {response.text[:200]}"
 
-        if not response.ok:
-            error_detail = f"Webhook returned status {response.status_code}"
-            try:
-                error_body = response.json()
-                if "message" in error_body:
-                    error_detail = error_body["message"]
-                if "hint" in error_body:
-                    error_detail += f" - {error_body['hint']}"
-            except Exception:
-                error_detail += f" - {response.text[:200]}"
+                raise Exception(error_detail)
 
-            raise Exception(error_detail)
+            try:
+                result = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                raise Exception(
+                    f"Webhook returned invalid JSON. Response: {response.text[:200]}"
+                )
 
-        try:
-            result = response.json()
-        except ValueError as e:
-            raise Exception(
-                f"Webhook returned invalid JSON. Response: {response.text[:200]}"
+            if isinstance(result, list) and result:
+                result = result[0]
+
+            # n8n answers with {"optimized_prompt": ...} or echoes {"body": {"prompt": ...}}
+            optimized_prompt = None
+            if isinstance(result, dict):
+                optimized_prompt = result.get("optimized_prompt")
+                if not optimized_prompt:
+                    body = result.get("body")
+                    if isinstance(body, dict):
+                        optimized_prompt = body.get("prompt")
+            optimized_prompt = optimized_prompt or request.prompt
+
+            return ORJSONResponse(
+                {"optimized_prompt": optimized_prompt, "original_prompt": request.prompt}
             )
-
-        if isinstance(result, list) and len(result) > 0:
-            result = result[0]
-
-        optimized_prompt = result.get("optimized_prompt")
-        if not optimized_prompt:
-            if "body" in result and "prompt" in result.get("body", {}):
-                optimized_prompt = result["body"]["prompt"]
-            else:
-                optimized_prompt = request.prompt
-
-        return PromptOptimizeResponse(
-            optimized_prompt=optimized_prompt, original_prompt=request.prompt
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Prompt optimization exceeded the {WEBHOOK_DEADLINE:g} second deadline",
+        )
+    except CircuitOpenError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Circuit open for host {httpx.URL(request.webhook_url).host}",
         )
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="Prompt optimization timed out after 30 seconds",
         )
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Failed to connect to n8n webhook. Is n8n running?",
@@ -1014,10 +1452,10 @@ async def optimize_prompt(request: PromptOptimizeRequest) -> PromptOptimizeRespo
         )
 
 
-@app.post("/sessions/{session_name}/prompt")
+@app.post("/sessions/{session_name}/prompt", response_model=Dict)
 async def submit_session_prompt(
     session_name: str, request: PromptSubmitRequest
-) -> Dict:
+) -> Response:
     """Submit a prompt to a session for execution.
 
     Args:
@@ -1035,15 +1473,18 @@ async def submit_session_prompt(
                 detail=f"Session '{session_name}' not found",
             )
 
+        # Lazy formatting: the prompt is only truncated and copied if INFO is enabled
         logger.info(
-            f"Prompt submitted to session '{session_name}': {request.prompt[:100]}..."
+            "Prompt submitted to session '%s': %.100s...", session_name, request.prompt
         )
 
-        return {
-            "success": True,
-            "session_name": session_name,
-            "message": "Prompt submitted successfully",
-        }
+        return ORJSONResponse(
+            {
+                "success": True,
+                "session_name": session_name,
+                "message": "Prompt submitted successfully",
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -1058,12 +1499,13 @@ class WorkflowAssignRequest(BaseModel):
     workflow_data: dict = Field(..., description="Complete workflow definition")
 
 
-@app.post("/sessions/{session_name}/workflow/assign")
+@app.post("/sessions/{session_name}/workflow/assign", response_model=Dict)
 async def assign_workflow_to_session(
     session_name: str, request: WorkflowAssignRequest
-) -> Dict:
+) -> Response:
     try:
-        if not tmux_client.session_exists(session_name):
+        # session_exists shells out to tmux
+        if not await asyncio.to_thread(tmux_client.session_exists, session_name):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Session '{session_name}' not found",
@@ -1073,12 +1515,14 @@ async def assign_workflow_to_session(
             session_name, request.workflow_id
         )
 
-        return {
-            "success": True,
-            "session_name": session_name,
-            "workflow_id": request.workflow_id,
-            "execution_state": state.to_dict(),
-        }
+        return ORJSONResponse(
+            {
+                "success": True,
+                "session_name": session_name,
+                "workflow_id": request.workflow_id,
+                "execution_state": state.to_dict(),
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -1088,8 +1532,8 @@ async def assign_workflow_to_session(
         )
 
 
-@app.get("/sessions/{session_name}/workflow/state")
-async def get_workflow_execution_state(session_name: str) -> Dict:
+@app.get("/sessions/{session_name}/workflow/state", response_model=Dict)
+async def get_workflow_execution_state(session_name: str, request: Request) -> Response:
     try:
         state = workflow_execution_service.get_execution_state(session_name)
         if not state:
@@ -1098,7 +1542,12 @@ async def get_workflow_execution_state(session_name: str) -> Dict:
                 detail=f"No workflow assigned to session '{session_name}'",
             )
 
-        return state.to_dict()
+        # Pollers holding the current version get an empty 304
+        etag = f'"{state.version:x}"'
+        if _is_not_modified(request, etag, None):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return ORJSONResponse(state.to_dict(), headers={"ETag": etag})
     except HTTPException:
         raise
     except Exception as e:
@@ -1108,8 +1557,8 @@ async def get_workflow_execution_state(session_name: str) -> Dict:
         )
 
 
-@app.post("/sessions/{session_name}/workflow/start")
-async def start_workflow_execution(session_name: str, workflow_data: dict) -> Dict:
+@app.post("/sessions/{session_name}/workflow/start", response_model=Dict)
+async def start_workflow_execution(session_name: str, workflow_data: dict) -> Response:
     try:
         state = workflow_execution_service.get_execution_state(session_name)
         if not state:
@@ -1124,14 +1573,28 @@ async def start_workflow_execution(session_name: str, workflow_data: dict) -> Di
             session_name, workflow_data
         )
 
+        # Terminal creation blocks until each agent is ready; run the nodes in
+        # parallel worker threads so neither they nor the event loop wait in turn
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    terminal_service.create_terminal,
+                    provider=node_info["provider"],
+                    agent_profile=node_info["agent_profile"],
+                    session_name=session_name,
+                    new_session=False,
+                )
+                for node_info in nodes_to_spawn
+            ),
+            return_exceptions=True,
+        )
+
+        # Record every terminal that did start before reporting a failure, so
+        # none of them is left running untracked
         spawned_agents = []
-        for node_info in nodes_to_spawn:
-            result = terminal_service.create_terminal(
-                provider=node_info["provider"],
-                agent_profile=node_info["agent_profile"],
-                session_name=session_name,
-                new_session=False,
-            )
+        for node_info, result in zip(nodes_to_spawn, results):
+            if isinstance(result, BaseException):
+                continue
 
             workflow_execution_service.update_node_state(
                 session_name,
@@ -1148,11 +1611,17 @@ async def start_workflow_execution(session_name: str, workflow_data: dict) -> Di
                 }
             )
 
-        return {
-            "success": True,
-            "status": state.status.value,
-            "spawned_agents": spawned_agents,
-        }
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return ORJSONResponse(
+            {
+                "success": True,
+                "status": state.status.value,
+                "spawned_agents": spawned_agents,
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
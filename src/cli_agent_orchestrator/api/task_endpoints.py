@@ -1,26 +1,102 @@
 """Task management API endpoints for CAO server."""
 
-import json
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi import HTTPException, Path as PathParam, Query, status
+import orjson
+from fastapi import HTTPException, Path as PathParam, Query, Response, status
 from pydantic import BaseModel, Field
 
+from cli_agent_orchestrator.api.responses import ORJSONResponse
 from cli_agent_orchestrator.clients.database import (
-    create_task,
-    create_terminal_state,
     delete_terminal_state,
     get_task,
-    get_task_assignments,
     get_terminal_state,
     list_tasks,
     update_task_status,
-    update_terminal_state,
+    upsert_terminal_state,
 )
+from cli_agent_orchestrator.constants import TASK_READ_CACHE_MAX_ENTRIES, TASK_READ_CACHE_TTL
+from cli_agent_orchestrator.services import task_service
 
 logger = logging.getLogger(__name__)
 
+# (endpoint, args) -> (fetched_at, value); entries past the TTL are kept as a
+# fallback for when the database cannot be read
+_read_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+# Bumped on every invalidation; a read only caches its result if no write
+# finished while it was in flight, so a pre-write value cannot outlive the clear
+_read_cache_generation = 0
+
+
+def _invalidate_read_cache() -> None:
+    global _read_cache_generation
+    _read_cache_generation += 1
+    _read_cache.clear()
+
+
+async def _cached_read(
+    key: Tuple[Any, ...], func: Callable[..., Any], *args: Any
+) -> Tuple[Any, Dict[str, str]]:
+    """Serve func(*args) from the read cache, refreshing it once the TTL has passed.
+
+    Returns the value and the headers to send with it. If the refresh fails and
+    an older value exists, that value is returned with 'X-Cache: stale' instead
+    of an error.
+    """
+    now = time.monotonic()
+    entry = _read_cache.get(key)
+    if entry and now - entry[0] < TASK_READ_CACHE_TTL:
+        return entry[1], {}
+    generation = _read_cache_generation
+    try:
+        value = await asyncio.to_thread(func, *args)
+    except Exception:
+        if entry is None:
+            raise
+        logger.warning("Serving stale %s after a failed read", key, exc_info=True)
+        return entry[1], {"X-Cache": "stale"}
+    if generation != _read_cache_generation:
+        return value, {}
+    if len(_read_cache) >= TASK_READ_CACHE_MAX_ENTRIES:
+        _read_cache.clear()
+    _read_cache[key] = (now, value)
+    return value, {}
+
+
+def _endpoint(action: str, invalidates_cache: bool = False):
+    """Turn unexpected errors in a route into a 500 'Failed to {action}: ...'.
+
+    HTTPExceptions raised by the route pass through unchanged. Routes that write
+    set invalidates_cache, which clears the read cache once they finish, even
+    when they fail partway.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                ids = {k: v for k, v in kwargs.items() if isinstance(v, (str, int))}
+                logger.exception("Failed to %s %s", action, ids)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to {action}: {str(e)}",
+                )
+            finally:
+                if invalidates_cache:
+                    _invalidate_read_cache()
+
+        return wrapper
+
+    return decorator
+
 
 class CreateTaskRequest(BaseModel):
     title: str = Field(..., description="Task title")
@@ -88,400 +164,246 @@ def register_task_routes(app):
     """Register task management routes with FastAPI app."""
 
     @app.post("/tasks", status_code=status.HTTP_201_CREATED)
+    @_endpoint("create task", invalidates_cache=True)
     async def create_task_endpoint(request: CreateTaskRequest) -> Dict[str, Any]:
-        try:
-            from cli_agent_orchestrator.services import task_service
-
-            task = task_service.create_task(
-                title=request.title,
-                description=request.description,
-                task_type=request.task_type,
-                workflow_id=request.workflow_id,
-                priority=request.priority,
-                dependencies=request.dependencies,
-                metadata=request.metadata,
-            )
-            return task
-        except Exception as e:
-            logger.exception("Failed to create task")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create task: {str(e)}",
-            )
-
-    @app.get("/tasks")
+        return await asyncio.to_thread(
+            task_service.create_task,
+            title=request.title,
+            description=request.description,
+            task_type=request.task_type,
+            workflow_id=request.workflow_id,
+            priority=request.priority,
+            dependencies=request.dependencies,
+            metadata=request.metadata,
+        )
+
+    @app.get("/tasks", response_model=List[Dict[str, Any]])
+    @_endpoint("list tasks")
     async def list_tasks_endpoint(
         workflow_id: Optional[str] = Query(None, description="Filter by workflow ID"),
         task_status: Optional[str] = Query(None, description="Filter by status"),
         task_type: Optional[str] = Query(None, description="Filter by task type"),
-    ) -> List[Dict[str, Any]]:
-        try:
-            tasks = list_tasks(
-                workflow_id=workflow_id,
-                status=task_status,
-                task_type=task_type,
-            )
-            return tasks
-        except Exception as e:
-            logger.exception("Failed to list tasks")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to list tasks: {str(e)}",
-            )
-
-    @app.get("/tasks/{task_id}")
+    ) -> Response:
+        tasks, headers = await _cached_read(
+            ("tasks", workflow_id, task_status, task_type),
+            list_tasks,
+            workflow_id,
+            task_status,
+            task_type,
+        )
+        return ORJSONResponse(tasks, headers=headers)
+
+    @app.get("/tasks/{task_id}", response_model=Dict[str, Any])
+    @_endpoint("get task")
     async def get_task_endpoint(
         task_id: str = PathParam(..., description="Task ID"),
-    ) -> Dict[str, Any]:
-        try:
-            task = get_task(task_id)
-            if not task:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Task {task_id} not found",
-                )
-            return task
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to get task {task_id}")
+    ) -> Response:
+        task, headers = await _cached_read(("task", task_id), get_task, task_id)
+        if not task:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to get task: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task {task_id} not found",
             )
+        return ORJSONResponse(task, headers=headers)
 
     @app.put("/tasks/{task_id}/status")
+    @_endpoint("update task status", invalidates_cache=True)
     async def update_task_status_endpoint(
         *,
         task_id: str = PathParam(..., description="Task ID"),
         request: UpdateTaskStatusRequest,
     ) -> Dict[str, Any]:
-        try:
-            success = update_task_status(
-                task_id=task_id,
-                status=request.status,
-            )
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Task {task_id} not found",
-                )
-
-            task = get_task(task_id)
-            if not task:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Task was updated but could not be retrieved",
-                )
-            return task
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to update task {task_id} status")
+        task = await asyncio.to_thread(
+            update_task_status,
+            task_id=task_id,
+            status=request.status,
+        )
+        if not task:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to update task status: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task {task_id} not found",
             )
+        return task
 
     @app.delete("/tasks/{task_id}")
+    @_endpoint("delete task", invalidates_cache=True)
     async def delete_task_endpoint(
         *,
         task_id: str = PathParam(..., description="Task ID"),
     ) -> Dict[str, str]:
-        try:
-            success = update_task_status(task_id=task_id, status="CANCELLED")
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Task {task_id} not found",
-                )
-            return {"message": f"Task {task_id} cancelled successfully"}
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to delete task {task_id}")
+        success = await asyncio.to_thread(
+            update_task_status, task_id=task_id, status="CANCELLED"
+        )
+        if not success:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to delete task: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task {task_id} not found",
             )
+        return {"message": f"Task {task_id} cancelled successfully"}
 
     @app.post("/tasks/{task_id}/assign", status_code=status.HTTP_201_CREATED)
+    @_endpoint("assign task", invalidates_cache=True)
     async def assign_task_endpoint(
         *,
         task_id: str = PathParam(..., description="Task ID"),
         request: AssignTaskRequest,
     ) -> Dict[str, Any]:
         try:
-            from cli_agent_orchestrator.services import task_service
-
-            assignment = task_service.assign_task_to_terminal(
+            return await asyncio.to_thread(
+                task_service.assign_task_to_terminal,
                 task_id=task_id,
                 terminal_id=request.terminal_id,
                 initial_prompt=request.initial_prompt,
             )
-            return assignment
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e),
             )
-        except Exception as e:
-            logger.exception(f"Failed to assign task {task_id}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to assign task: {str(e)}",
-            )
 
     @app.put("/assignments/{assignment_id}/start")
+    @_endpoint("start assignment", invalidates_cache=True)
     async def start_assignment_endpoint(assignment_id: int) -> Dict[str, Any]:
-        try:
-            from cli_agent_orchestrator.services import task_service
-
-            success = task_service.start_task(assignment_id)
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Assignment {assignment_id} not found",
-                )
-
-            assignments = get_task_assignments()
-            assignment = next(
-                (a for a in assignments if a["id"] == assignment_id), None
-            )
-            if not assignment:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Assignment was updated but could not be retrieved",
-                )
-            return assignment
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to start assignment {assignment_id}")
+        assignment = await asyncio.to_thread(task_service.start_task, assignment_id)
+        if not assignment:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to start assignment: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Assignment {assignment_id} not found",
             )
+        return assignment
 
     @app.put("/assignments/{assignment_id}/complete")
+    @_endpoint("complete assignment", invalidates_cache=True)
     async def complete_assignment_endpoint(
         assignment_id: int,
         request: CompleteAssignmentRequest,
     ) -> Dict[str, Any]:
-        try:
-            from cli_agent_orchestrator.services import task_service
-
-            success = task_service.complete_task(
-                assignment_id=assignment_id,
-                result=request.result,
-            )
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Assignment {assignment_id} not found",
-                )
-
-            assignments = get_task_assignments()
-            assignment = next(
-                (a for a in assignments if a["id"] == assignment_id), None
-            )
-            if not assignment:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Assignment was updated but could not be retrieved",
-                )
-            return assignment
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to complete assignment {assignment_id}")
+        assignment = await asyncio.to_thread(
+            task_service.complete_task,
+            assignment_id=assignment_id,
+            result=request.result,
+        )
+        if not assignment:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to complete assignment: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Assignment {assignment_id} not found",
             )
+        return assignment
 
     @app.put("/assignments/{assignment_id}/fail")
+    @_endpoint("mark assignment as failed", invalidates_cache=True)
     async def fail_assignment_endpoint(
         assignment_id: int,
         request: FailAssignmentRequest,
     ) -> Dict[str, Any]:
-        try:
-            from cli_agent_orchestrator.services import task_service
-
-            success = task_service.fail_task(
-                assignment_id=assignment_id,
-                error_message=request.error_message,
-            )
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Assignment {assignment_id} not found",
-                )
-
-            assignments = get_task_assignments()
-            assignment = next(
-                (a for a in assignments if a["id"] == assignment_id), None
-            )
-            if not assignment:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Assignment was updated but could not be retrieved",
-                )
-            return assignment
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to mark assignment {assignment_id} as failed")
+        assignment = await asyncio.to_thread(
+            task_service.fail_task,
+            assignment_id=assignment_id,
+            error_message=request.error_message,
+        )
+        if not assignment:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to mark assignment as failed: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Assignment {assignment_id} not found",
             )
+        return assignment
 
     @app.get("/terminals/{terminal_id}/task")
+    @_endpoint("get terminal task")
     async def get_terminal_task_endpoint(
+        response: Response,
         terminal_id: str = PathParam(..., description="Terminal ID"),
     ) -> Dict[str, Any]:
-        try:
-            from cli_agent_orchestrator.services import task_service
-
-            assignment = task_service.get_terminal_current_task(terminal_id)
-            if not assignment:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"No active task found for terminal {terminal_id}",
-                )
-            return assignment
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to get task for terminal {terminal_id}")
+        assignment, headers = await _cached_read(
+            ("terminal_task", terminal_id),
+            task_service.get_terminal_current_task,
+            terminal_id,
+        )
+        response.headers.update(headers)
+        if not assignment:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to get terminal task: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No active task found for terminal {terminal_id}",
             )
+        return assignment
 
     @app.post("/terminals/{terminal_id}/state", status_code=status.HTTP_201_CREATED)
+    @_endpoint("create/update terminal state", invalidates_cache=True)
     async def create_or_update_terminal_state_endpoint(
         *,
         terminal_id: str = PathParam(..., description="Terminal ID"),
         request: TerminalStateRequest,
     ) -> Dict[str, Any]:
-        try:
-            existing_state = get_terminal_state(terminal_id)
-
-            merged_context = request.context_data or {}
-            if request.current_task_id is not None:
-                merged_context["current_task_id"] = request.current_task_id
-            if request.checkpoints is not None:
-                merged_context["checkpoints"] = request.checkpoints
-
-            context_json = json.dumps(merged_context) if merged_context else None
-            variables_json = (
-                json.dumps(request.variables) if request.variables else None
-            )
-            last_checkpoint_json = (
-                json.dumps(request.checkpoints[-1]) if request.checkpoints else None
-            )
-
-            if existing_state:
-                success = update_terminal_state(
-                    terminal_id=terminal_id,
-                    context_data=context_json,
-                    variables=variables_json,
-                    initial_prompt=request.initial_prompt,
-                    last_checkpoint=last_checkpoint_json,
-                )
-                if not success:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to update terminal state",
-                    )
-                state = get_terminal_state(terminal_id)
-                if not state:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Terminal state was updated but could not be retrieved",
-                    )
-            else:
-                state = create_terminal_state(
-                    terminal_id=terminal_id,
-                    context_data=context_json,
-                    variables=variables_json,
-                    initial_prompt=request.initial_prompt,
-                    last_checkpoint=last_checkpoint_json,
-                )
-
-            return state
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(
-                f"Failed to create/update terminal state for {terminal_id}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create/update terminal state: {str(e)}",
-            )
+        merged_context = request.context_data or {}
+        if request.current_task_id is not None:
+            merged_context["current_task_id"] = request.current_task_id
+        if request.checkpoints is not None:
+            merged_context["checkpoints"] = request.checkpoints
+
+        context_json = orjson.dumps(merged_context).decode() if merged_context else None
+        variables_json = (
+            orjson.dumps(request.variables).decode() if request.variables else None
+        )
+        last_checkpoint_json = (
+            orjson.dumps(request.checkpoints[-1]).decode() if request.checkpoints else None
+        )
+
+        return await asyncio.to_thread(
+            upsert_terminal_state,
+            terminal_id=terminal_id,
+            context_data=context_json,
+            variables=variables_json,
+            initial_prompt=request.initial_prompt,
+            last_checkpoint=last_checkpoint_json,
+        )
 
     @app.get("/terminals/{terminal_id}/state")
+    @_endpoint("get terminal state")
     async def get_terminal_state_endpoint(
+        response: Response,
         terminal_id: str = PathParam(..., description="Terminal ID"),
     ) -> Dict[str, Any]:
-        try:
-            state = get_terminal_state(terminal_id)
-            if not state:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Terminal state for {terminal_id} not found",
-                )
-
-            expanded_state = dict(state)
-            if state.get("context_data"):
-                try:
-                    context = json.loads(state["context_data"])
-                    expanded_state["current_task_id"] = context.get("current_task_id")
-                    expanded_state["checkpoints"] = context.get("checkpoints", [])
-                    expanded_state["context_data"] = {
-                        k: v
-                        for k, v in context.items()
-                        if k not in ("current_task_id", "checkpoints")
-                    }
-                except json.JSONDecodeError:
-                    pass
-
-            if state.get("variables"):
-                try:
-                    expanded_state["variables"] = json.loads(state["variables"])
-                except json.JSONDecodeError:
-                    pass
-
-            return expanded_state
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to get terminal state for {terminal_id}")
+        state, headers = await _cached_read(
+            ("terminal_state", terminal_id), get_terminal_state, terminal_id
+        )
+        response.headers.update(headers)
+        if not state:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to get terminal state: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Terminal state for {terminal_id} not found",
             )
 
+        expanded_state = dict(state)
+        if state.get("context_data"):
+            try:
+                context = orjson.loads(state["context_data"])
+                expanded_state["current_task_id"] = context.get("current_task_id")
+                expanded_state["checkpoints"] = context.get("checkpoints", [])
+                expanded_state["context_data"] = {
+                    k: v
+                    for k, v in context.items()
+                    if k not in ("current_task_id", "checkpoints")
+                }
+            except orjson.JSONDecodeError:
+                pass
+
+        if state.get("variables"):
+            try:
+                expanded_state["variables"] = orjson.loads(state["variables"])
+            except orjson.JSONDecodeError:
+                pass
+
+        return expanded_state
+
     @app.delete("/terminals/{terminal_id}/state")
+    @_endpoint("delete terminal state", invalidates_cache=True)
     async def delete_terminal_state_endpoint(
         terminal_id: str = PathParam(..., description="Terminal ID"),
     ) -> Dict[str, str]:
-        try:
-            success = delete_terminal_state(terminal_id)
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Terminal state for {terminal_id} not found",
-                )
-            return {"message": f"Terminal state for {terminal_id} deleted successfully"}
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to delete terminal state for {terminal_id}")
+        success = await asyncio.to_thread(delete_terminal_state, terminal_id)
+        if not success:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to delete terminal state: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Terminal state for {terminal_id} not found",
             )
+        return {"message": f"Terminal state for {terminal_id} deleted successfully"}
@@ -103,6 +103,9 @@ def install(agent_source: str, provider: str):
 
         # Copy markdown file to agent-context directory
         dest_file = AGENT_CONTEXT_DIR / f"{profile.name}.md"
+        # An API install may have left dest hardlinked to another local profile;
+        # writing through that link would overwrite the user's file
+        dest_file.unlink(missing_ok=True)
         with open(source_file, "r") as src:
             dest_file.write_text(src.read())
 
@@ -2,25 +2,71 @@
 
 import json
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, create_engine
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    create_engine,
+    event,
+    func,
+    insert,
+    inspect,
+    lambda_stmt,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import DeclarativeBase, declarative_base, sessionmaker
-
-from cli_agent_orchestrator.constants import DATABASE_URL, DB_DIR, DEFAULT_PROVIDER
+from sqlalchemy.pool import QueuePool
+
+from cli_agent_orchestrator.constants import (
+    DATABASE_LOOKUP_CACHE_MAX_ENTRIES,
+    DATABASE_LOOKUP_CACHE_TTL,
+    DATABASE_POOL_OVERFLOW,
+    DATABASE_POOL_SIZE,
+    DATABASE_URL,
+    DB_DIR,
+    DEFAULT_PROVIDER,
+)
 from cli_agent_orchestrator.models.flow import Flow
 from cli_agent_orchestrator.models.inbox import InboxMessage, MessageStatus
 
 logger = logging.getLogger(__name__)
 
-Base: Any = declarative_base()
+
+@lru_cache(maxsize=None)
+def _column_keys(model: type) -> Tuple[str, ...]:
+    return tuple(column.key for column in model.__table__.columns)
+
+
+class _ModelBase:
+    """Behaviour shared by every mapped model."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row's columns as a dict keyed by attribute name."""
+        return {key: getattr(self, key) for key in _column_keys(type(self))}
+
+
+Base: Any = declarative_base(cls=_ModelBase)
 
 
 class TerminalModel(Base):
     """SQLAlchemy model for terminal metadata only."""
 
     __tablename__ = "terminals"
+    __table_args__ = (Index("ix_terminals_session", "tmux_session"),)
 
     id = Column(String, primary_key=True)  # "abc123ef"
     tmux_session = Column(String, nullable=False)  # "cao-session-name"
@@ -34,6 +80,10 @@ class InboxModel(Base):
     """SQLAlchemy model for inbox messages."""
 
     __tablename__ = "inbox"
+    __table_args__ = (
+        # Matches get_inbox_messages: WHERE receiver_id [AND status] ORDER BY created_at
+        Index("ix_inbox_receiver_status_created", "receiver_id", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     sender_id = Column(String, nullable=False)
@@ -47,6 +97,7 @@ class FlowModel(Base):
     """SQLAlchemy model for flow metadata."""
 
     __tablename__ = "flows"
+    __table_args__ = (Index("ix_flows_enabled_next_run", "enabled", "next_run"),)
 
     name = Column(String, primary_key=True)
     file_path = Column(String, nullable=False)
@@ -77,9 +128,12 @@ class WorkflowNodeModel(Base):
     """SQLAlchemy model for workflow nodes."""
 
     __tablename__ = "workflow_nodes"
+    __table_args__ = (Index("ix_workflow_nodes_workflow", "workflow_id"),)
 
     id = Column(String, primary_key=True)
-    workflow_id = Column(String, nullable=False)
+    workflow_id = Column(
+        String, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False
+    )
     node_data = Column(String, nullable=False)  # JSON string containing all node data
     position_x = Column(Integer, nullable=False, default=0)
     position_y = Column(Integer, nullable=False, default=0)
@@ -89,9 +143,12 @@ class WorkflowEdgeModel(Base):
     """SQLAlchemy model for workflow edges."""
 
     __tablename__ = "workflow_edges"
+    __table_args__ = (Index("ix_workflow_edges_workflow", "workflow_id"),)
 
     id = Column(String, primary_key=True)
-    workflow_id = Column(String, nullable=False)
+    workflow_id = Column(
+        String, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False
+    )
     source = Column(String, nullable=False)
     target = Column(String, nullable=False)
     edge_data = Column(String, nullable=True)  # JSON string containing edge metadata
@@ -127,6 +184,12 @@ class TaskModel(Base):
     """SQLAlchemy model for task management."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Filters used by list_tasks; the composite also serves workflow_id alone
+        Index("ix_tasks_workflow_status", "workflow_id", "status"),
+        Index("ix_tasks_status", "status"),
+        Index("ix_tasks_task_type", "task_type"),
+    )
 
     id = Column(String, primary_key=True)  # T-001, T-002, etc.
     workflow_id = Column(String, nullable=True)  # Links to workflows.id (optional)
@@ -148,6 +211,7 @@ class TaskAssignmentModel(Base):
     """SQLAlchemy model for task assignments."""
 
     __tablename__ = "task_assignments"
+    __table_args__ = (Index("ix_task_assignments_task", "task_id"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     task_id = Column(String, nullable=False)  # Links to tasks.id
@@ -202,13 +266,114 @@ class WorkflowExecutionModel(Base):
 
 # Module-level singletons
 DB_DIR.mkdir(parents=True, exist_ok=True)
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_POOL_OVERFLOW,
+    # Reuse the most recently returned connection so its page cache stays warm
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# WAL lets readers (API handlers, the MCP server, the CLI) run while another
+# connection writes; NORMAL sync is durable across app crashes in WAL mode
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache per connection
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply SQLITE_PRAGMAS to each new pooled connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _add_workflow_foreign_keys() -> None:
+    """Rebuild workflow node/edge tables created before they cascaded from workflows.
+
+    SQLite cannot add a foreign key to an existing table, so the table is renamed,
+    recreated from the model and refilled. Rows of already-deleted workflows are dropped.
+    """
+    inspector = inspect(engine)
+    for model in (WorkflowNodeModel, WorkflowEdgeModel):
+        table = model.__table__
+        if inspector.get_foreign_keys(table.name):
+            continue
+        columns = ", ".join(column.name for column in table.columns)
+        with engine.begin() as conn:
+            for index in table.indexes:
+                index.drop(conn, checkfirst=True)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {table.name}_old")
+            table.create(conn)
+            conn.exec_driver_sql(
+                f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {table.name}_old "
+                "WHERE workflow_id IN (SELECT id FROM workflows)"
+            )
+            conn.exec_driver_sql(f"DROP TABLE {table.name}_old")
+
 
 def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     Base.metadata.create_all(bind=engine)
+    _add_workflow_foreign_keys()
+    # create_all skips tables that already exist, so add indexes declared after they were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+# Point lookups that are read far more often than written, keyed by (kind, key).
+# Writes made here evict their entry; writes from other processes (e.g. the cao CLI)
+# show up once DATABASE_LOOKUP_CACHE_TTL has passed. Misses are never cached.
+_lookup_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_lookup_cache_lock = threading.Lock()
+# Bumped on every eviction. Readers capture it before querying and _cache_put drops
+# their result if it changed, so a read racing a delete cannot re-insert the old row.
+_lookup_cache_generation = 0
+
+
+def _cache_get(kind: str, key: str) -> Any:
+    """Return the cached value for (kind, key), or None if absent or expired."""
+    with _lookup_cache_lock:
+        entry = _lookup_cache.get((kind, key))
+    if entry and time.monotonic() - entry[0] < DATABASE_LOOKUP_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_put(kind: str, key: str, value: Any, generation: int) -> None:
+    """Cache value unless an eviction happened since generation was read."""
+    with _lookup_cache_lock:
+        if generation != _lookup_cache_generation:
+            return
+        if len(_lookup_cache) >= DATABASE_LOOKUP_CACHE_MAX_ENTRIES:
+            _lookup_cache.clear()
+        _lookup_cache[(kind, key)] = (time.monotonic(), value)
+
+
+def _cache_evict(kind: str, key: Optional[str] = None) -> None:
+    """Drop one cached entry, or every entry of kind when key is None."""
+    global _lookup_cache_generation
+    with _lookup_cache_lock:
+        _lookup_cache_generation += 1
+        if key is not None:
+            _lookup_cache.pop((kind, key), None)
+            return
+        for cached in [k for k in _lookup_cache if k[0] == kind]:
+            del _lookup_cache[cached]
 
 
 def create_terminal(
@@ -228,22 +393,23 @@ def create_terminal(
             agent_profile=agent_profile,
         )
         db.add(terminal)
+        db.flush()
+        created = terminal.to_dict()
         db.commit()
-        return {
-            "id": terminal.id,
-            "tmux_session": terminal.tmux_session,
-            "tmux_window": terminal.tmux_window,
-            "provider": terminal.provider,
-            "agent_profile": terminal.agent_profile,
-        }
+    _cache_evict("terminal", terminal_id)
+    return created
 
 
 def get_terminal_metadata(terminal_id: str) -> Optional[Dict[str, Any]]:
     """Get terminal metadata by ID."""
+    cached = _cache_get("terminal", terminal_id)
+    if cached is not None:
+        return dict(cached)
+    generation = _lookup_cache_generation
     with SessionLocal() as db:
-        terminal = (
-            db.query(TerminalModel).filter(TerminalModel.id == terminal_id).first()
-        )
+        terminal = db.scalars(
+            lambda_stmt(lambda: select(TerminalModel).where(TerminalModel.id == terminal_id))
+        ).first()
         if not terminal:
             logger.warning(
                 f"Terminal metadata not found for terminal_id: {terminal_id}"
@@ -252,48 +418,45 @@ def get_terminal_metadata(terminal_id: str) -> Optional[Dict[str, Any]]:
         logger.debug(
             f"Retrieved terminal metadata for {terminal_id}: provider={terminal.provider}, session={terminal.tmux_session}"
         )
-        return {
-            "id": terminal.id,
-            "tmux_session": terminal.tmux_session,
-            "tmux_window": terminal.tmux_window,
-            "provider": terminal.provider,
-            "agent_profile": terminal.agent_profile,
-            "last_active": terminal.last_active,
-        }
+        metadata = terminal.to_dict()
+    _cache_put("terminal", terminal_id, metadata, generation)
+    return dict(metadata)
 
 
 def list_terminals_by_session(tmux_session: str) -> List[Dict[str, Any]]:
     """List all terminals in a tmux session."""
     with SessionLocal() as db:
-        terminals = (
-            db.query(TerminalModel)
-            .filter(TerminalModel.tmux_session == tmux_session)
-            .all()
-        )
-        return [
-            {
-                "id": t.id,
-                "tmux_session": t.tmux_session,
-                "tmux_window": t.tmux_window,
-                "provider": t.provider,
-                "agent_profile": t.agent_profile,
-                "last_active": t.last_active,
-            }
-            for t in terminals
-        ]
+        rows = db.execute(
+            lambda_stmt(
+                lambda: select(
+                    TerminalModel.id,
+                    TerminalModel.tmux_session,
+                    TerminalModel.tmux_window,
+                    TerminalModel.provider,
+                    TerminalModel.agent_profile,
+                    TerminalModel.last_active,
+                ).where(TerminalModel.tmux_session == tmux_session)
+            )
+        ).all()
+        return [dict(row._mapping) for row in rows]
 
 
 def update_last_active(terminal_id: str) -> bool:
     """Update last active timestamp."""
+    now = datetime.now()
     with SessionLocal() as db:
-        terminal = (
-            db.query(TerminalModel).filter(TerminalModel.id == terminal_id).first()
+        updated = (
+            db.query(TerminalModel)
+            .filter(TerminalModel.id == terminal_id)
+            .update({TerminalModel.last_active: now}, synchronize_session=False)
         )
-        if terminal:
-            terminal.last_active = datetime.now()
-            db.commit()
-            return True
-        return False
+        db.commit()
+    # Refresh the cached entry in place rather than evicting it; this runs on every input
+    with _lookup_cache_lock:
+        entry = _lookup_cache.get(("terminal", terminal_id))
+        if entry:
+            entry[1]["last_active"] = now
+    return updated > 0
 
 
 def delete_terminal(terminal_id: str) -> bool:
@@ -303,7 +466,8 @@ def delete_terminal(terminal_id: str) -> bool:
             db.query(TerminalModel).filter(TerminalModel.id == terminal_id).delete()
         )
         db.commit()
-        return deleted > 0
+    _cache_evict("terminal", terminal_id)
+    return deleted > 0
 
 
 def delete_terminals_by_session(tmux_session: str) -> int:
@@ -315,31 +479,52 @@ def delete_terminals_by_session(tmux_session: str) -> int:
             .delete()
         )
         db.commit()
-        return deleted
+    _cache_evict("terminal")
+    return deleted
 
 
 def create_inbox_message(
     sender_id: str, receiver_id: str, message: str
 ) -> InboxMessage:
     """Create inbox message with status=MessageStatus.PENDING."""
+    return create_inbox_messages_bulk([(sender_id, receiver_id, message)])[0]
+
+
+def create_inbox_messages_bulk(rows: List[Tuple[str, str, str]]) -> List[InboxMessage]:
+    """Create several PENDING inbox messages in a single transaction.
+
+    Args:
+        rows: (sender_id, receiver_id, message) tuples
+
+    Returns:
+        Created messages, in the same order as rows
+    """
     with SessionLocal() as db:
-        inbox_msg = InboxModel(
-            sender_id=sender_id,
-            receiver_id=receiver_id,
-            message=message,
-            status=MessageStatus.PENDING.value,
-        )
-        db.add(inbox_msg)
+        inbox_msgs = [
+            InboxModel(
+                sender_id=sender_id,
+                receiver_id=receiver_id,
+                message=message,
+                status=MessageStatus.PENDING.value,
+            )
+            for sender_id, receiver_id, message in rows
+        ]
+        db.add_all(inbox_msgs)
+        # Flush assigns ids and created_at; read them before commit expires the instances
+        db.flush()
+        created = [
+            InboxMessage(
+                id=inbox_msg.id,
+                sender_id=inbox_msg.sender_id,
+                receiver_id=inbox_msg.receiver_id,
+                message=inbox_msg.message,
+                status=MessageStatus(inbox_msg.status),
+                created_at=inbox_msg.created_at,
+            )
+            for inbox_msg in inbox_msgs
+        ]
         db.commit()
-        db.refresh(inbox_msg)
-        return InboxMessage(
-            id=inbox_msg.id,
-            sender_id=inbox_msg.sender_id,
-            receiver_id=inbox_msg.receiver_id,
-            message=inbox_msg.message,
-            status=MessageStatus(inbox_msg.status),
-            created_at=inbox_msg.created_at,
-        )
+        return created
 
 
 def get_pending_messages(receiver_id: str, limit: int = 1) -> List[InboxMessage]:
@@ -366,7 +551,11 @@ def get_inbox_messages(
         if status is not None:
             query = query.filter(InboxModel.status == status.value)
 
-        messages = query.order_by(InboxModel.created_at.asc()).limit(limit).all()
+        messages = (
+            query.order_by(InboxModel.created_at.asc(), InboxModel.id.asc())
+            .limit(limit)
+            .all()
+        )
 
         return [
             InboxMessage(
@@ -381,15 +570,21 @@ def get_inbox_messages(
         ]
 
 
-def update_message_status(message_id: int, status: MessageStatus) -> bool:
-    """Update message status to MessageStatus.DELIVERED or MessageStatus.FAILED."""
+def update_message_status(
+    message_id: int, status: MessageStatus, from_status: Optional[MessageStatus] = None
+) -> bool:
+    """Update message status to MessageStatus.DELIVERED or MessageStatus.FAILED.
+
+    With from_status, the update only applies while the message still has that status,
+    so concurrent callers can use it to claim a message: exactly one of them gets True.
+    """
     with SessionLocal() as db:
-        message = db.query(InboxModel).filter(InboxModel.id == message_id).first()
-        if message:
-            message.status = status.value
-            db.commit()
-            return True
-        return False
+        query = db.query(InboxModel).filter(InboxModel.id == message_id)
+        if from_status is not None:
+            query = query.filter(InboxModel.status == from_status.value)
+        updated = query.update({InboxModel.status: status.value}, synchronize_session=False)
+        db.commit()
+        return updated > 0
 
 
 # Flow database functions
@@ -416,85 +611,70 @@ def create_flow(
             next_run=next_run,
         )
         db.add(flow)
+        # Flush fills in the column defaults; read them before commit expires the instance
+        db.flush()
+        created = Flow(**flow.to_dict())
         db.commit()
-        db.refresh(flow)
-        return Flow(
-            name=flow.name,
-            file_path=flow.file_path,
-            schedule=flow.schedule,
-            agent_profile=flow.agent_profile,
-            provider=flow.provider,
-            script=flow.script,
-            last_run=flow.last_run,
-            next_run=flow.next_run,
-            enabled=flow.enabled,
-        )
+    _cache_evict("flow", name)
+    return created
 
 
 def get_flow(name: str) -> Optional[Flow]:
     """Get flow by name."""
+    cached = _cache_get("flow", name)
+    if cached is not None:
+        return cached.model_copy()
+    generation = _lookup_cache_generation
     with SessionLocal() as db:
-        flow = db.query(FlowModel).filter(FlowModel.name == name).first()
+        flow = db.scalars(
+            lambda_stmt(lambda: select(FlowModel).where(FlowModel.name == name))
+        ).first()
         if not flow:
             return None
-        return Flow(
-            name=flow.name,
-            file_path=flow.file_path,
-            schedule=flow.schedule,
-            agent_profile=flow.agent_profile,
-            provider=flow.provider,
-            script=flow.script,
-            last_run=flow.last_run,
-            next_run=flow.next_run,
-            enabled=flow.enabled,
-        )
+        result = Flow(**flow.to_dict())
+    _cache_put("flow", name, result, generation)
+    return result.model_copy()
 
 
 def list_flows() -> List[Flow]:
     """List all flows."""
     with SessionLocal() as db:
         flows = db.query(FlowModel).order_by(FlowModel.next_run).all()
-        return [
-            Flow(
-                name=f.name,
-                file_path=f.file_path,
-                schedule=f.schedule,
-                agent_profile=f.agent_profile,
-                provider=f.provider,
-                script=f.script,
-                last_run=f.last_run,
-                next_run=f.next_run,
-                enabled=f.enabled,
-            )
-            for f in flows
-        ]
+        return [Flow(**f.to_dict()) for f in flows]
 
 
 def update_flow_run_times(name: str, last_run: datetime, next_run: datetime) -> bool:
     """Update flow run times after execution."""
     with SessionLocal() as db:
-        flow = db.query(FlowModel).filter(FlowModel.name == name).first()
-        if flow:
-            flow.last_run = last_run
-            flow.next_run = next_run
-            db.commit()
-            return True
-        return False
+        updated = (
+            db.query(FlowModel)
+            .filter(FlowModel.name == name)
+            .update(
+                {FlowModel.last_run: last_run, FlowModel.next_run: next_run},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+    _cache_evict("flow", name)
+    return updated > 0
 
 
 def update_flow_enabled(
     name: str, enabled: bool, next_run: Optional[datetime] = None
 ) -> bool:
     """Update flow enabled status and optionally next_run."""
+    values: Dict[Any, Any] = {FlowModel.enabled: enabled}
+    if next_run is not None:
+        values[FlowModel.next_run] = next_run
     with SessionLocal() as db:
-        flow = db.query(FlowModel).filter(FlowModel.name == name).first()
-        if flow:
-            flow.enabled = enabled
-            if next_run is not None:
-                flow.next_run = next_run
-            db.commit()
-            return True
-        return False
+        updated = (
+            db.query(FlowModel)
+            .filter(FlowModel.name == name)
+            .update(values, synchronize_session=False)
+        )
+        db.commit()
+    _cache_evict("flow", name)
+    return updated > 0
 
 
 def delete_flow(name: str) -> bool:
@@ -502,7 +682,8 @@ def delete_flow(name: str) -> bool:
     with SessionLocal() as db:
         deleted = db.query(FlowModel).filter(FlowModel.name == name).delete()
         db.commit()
-        return deleted > 0
+    _cache_evict("flow", name)
+    return deleted > 0
 
 
 def get_flows_to_run() -> List[Flow]:
@@ -514,20 +695,55 @@ def get_flows_to_run() -> List[Flow]:
             .filter(FlowModel.enabled == True, FlowModel.next_run <= now)
             .all()
         )
-        return [
-            Flow(
-                name=f.name,
-                file_path=f.file_path,
-                schedule=f.schedule,
-                agent_profile=f.agent_profile,
-                provider=f.provider,
-                script=f.script,
-                last_run=f.last_run,
-                next_run=f.next_run,
-                enabled=f.enabled,
-            )
-            for f in flows
-        ]
+        return [Flow(**f.to_dict()) for f in flows]
+
+
+def get_next_flow_run_time() -> Optional[datetime]:
+    """Get the earliest next_run among enabled flows."""
+    with SessionLocal() as db:
+        return (
+            db.query(func.min(FlowModel.next_run))
+            .filter(FlowModel.enabled == True)
+            .scalar()
+        )
+
+
+def _insert_nodes(db: Any, workflow_id: str, nodes: List[Dict[str, Any]]) -> None:
+    """Insert a workflow's nodes with one executemany."""
+    if not nodes:
+        return
+    db.execute(
+        insert(WorkflowNodeModel),
+        [
+            {
+                "id": node["id"],
+                "workflow_id": workflow_id,
+                "node_data": node["data"],
+                "position_x": node.get("position_x", 0),
+                "position_y": node.get("position_y", 0),
+            }
+            for node in nodes
+        ],
+    )
+
+
+def _insert_edges(db: Any, workflow_id: str, edges: List[Dict[str, Any]]) -> None:
+    """Insert a workflow's edges with one executemany."""
+    if not edges:
+        return
+    db.execute(
+        insert(WorkflowEdgeModel),
+        [
+            {
+                "id": edge["id"],
+                "workflow_id": workflow_id,
+                "source": edge["source"],
+                "target": edge["target"],
+                "edge_data": edge.get("data"),
+            }
+            for edge in edges
+        ],
+    )
 
 
 def create_workflow(
@@ -548,116 +764,96 @@ def create_workflow(
             version=1,
         )
         db.add(workflow)
-
-        for node in nodes:
-            node_model = WorkflowNodeModel(
-                id=node["id"],
-                workflow_id=workflow_id,
-                node_data=node["data"],
-                position_x=node.get("position_x", 0),
-                position_y=node.get("position_y", 0),
-            )
-            db.add(node_model)
-
-        for edge in edges:
-            edge_model = WorkflowEdgeModel(
-                id=edge["id"],
-                workflow_id=workflow_id,
-                source=edge["source"],
-                target=edge["target"],
-                edge_data=edge.get("data"),
-            )
-            db.add(edge_model)
-
+        # The session does not autoflush, and the node/edge rows reference this one
+        db.flush()
+        _insert_nodes(db, workflow_id, nodes)
+        _insert_edges(db, workflow_id, edges)
+        created = workflow.to_dict()
         db.commit()
-        db.refresh(workflow)
-
-        return {
-            "id": workflow.id,
-            "name": workflow.name,
-            "description": workflow.description,
-            "config": workflow.config,
-            "created_at": workflow.created_at,
-            "updated_at": workflow.updated_at,
-            "version": workflow.version,
-        }
+        return created
 
 
 def get_workflow(workflow_id: str) -> Optional[Dict[str, Any]]:
     """Get complete workflow with nodes and edges."""
-    with SessionLocal() as db:
-        workflow = (
-            db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).first()
-        )
-        if not workflow:
-            return None
-
-        nodes = (
-            db.query(WorkflowNodeModel)
-            .filter(WorkflowNodeModel.workflow_id == workflow_id)
-            .all()
-        )
-        edges = (
-            db.query(WorkflowEdgeModel)
-            .filter(WorkflowEdgeModel.workflow_id == workflow_id)
-            .all()
+    # One UNION ALL of the workflow, node and edge rows, tagged by kind. Columns line up
+    # positionally; the workflow select comes first so its types apply to the compound.
+    stmt = lambda_stmt(
+        lambda: union_all(
+            select(
+                literal("w"),
+                WorkflowModel.id,
+                WorkflowModel.name,
+                WorkflowModel.description,
+                WorkflowModel.config,
+                WorkflowModel.created_at,
+                WorkflowModel.updated_at,
+                WorkflowModel.version,
+                null(),
+            ).where(WorkflowModel.id == workflow_id),
+            select(
+                literal("n"),
+                WorkflowNodeModel.id,
+                WorkflowNodeModel.node_data,
+                null(),
+                null(),
+                null(),
+                null(),
+                WorkflowNodeModel.position_x,
+                WorkflowNodeModel.position_y,
+            ).where(WorkflowNodeModel.workflow_id == workflow_id),
+            select(
+                literal("e"),
+                WorkflowEdgeModel.id,
+                WorkflowEdgeModel.source,
+                WorkflowEdgeModel.target,
+                WorkflowEdgeModel.edge_data,
+                null(),
+                null(),
+                null(),
+                null(),
+            ).where(WorkflowEdgeModel.workflow_id == workflow_id),
         )
+    )
+    with SessionLocal() as db:
+        rows = db.execute(stmt).all()
+
+    workflow: Optional[Dict[str, Any]] = None
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Dict[str, Any]] = []
+    for kind, row_id, a, b, c, created_at, updated_at, x, y in rows:
+        if kind == "w":
+            workflow = {
+                "id": row_id,
+                "name": a,
+                "description": b,
+                "config": c,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "version": x,
+            }
+        elif kind == "n":
+            nodes.append({"id": row_id, "data": a, "position_x": x, "position_y": y})
+        else:
+            edges.append({"id": row_id, "source": a, "target": b, "data": c})
 
-        return {
-            "id": workflow.id,
-            "name": workflow.name,
-            "description": workflow.description,
-            "config": workflow.config,
-            "created_at": workflow.created_at,
-            "updated_at": workflow.updated_at,
-            "version": workflow.version,
-            "nodes": [
-                {
-                    "id": n.id,
-                    "data": n.node_data,
-                    "position_x": n.position_x,
-                    "position_y": n.position_y,
-                }
-                for n in nodes
-            ],
-            "edges": [
-                {
-                    "id": e.id,
-                    "source": e.source,
-                    "target": e.target,
-                    "data": e.edge_data,
-                }
-                for e in edges
-            ],
-        }
+    if workflow is None:
+        return None
+    workflow["nodes"] = nodes
+    workflow["edges"] = edges
+    return workflow
 
 
 def list_workflows() -> List[Dict[str, Any]]:
     """List all workflows (metadata only, without nodes/edges)."""
     with SessionLocal() as db:
-        workflows = (
-            db.query(WorkflowModel).order_by(WorkflowModel.updated_at.desc()).all()
+        rows = (
+            db.query(WorkflowModel, func.count(WorkflowNodeModel.id))
+            .outerjoin(WorkflowNodeModel, WorkflowNodeModel.workflow_id == WorkflowModel.id)
+            .group_by(WorkflowModel.id)
+            .order_by(WorkflowModel.updated_at.desc())
+            .all()
         )
-        result = []
-        for w in workflows:
-            node_count = (
-                db.query(WorkflowNodeModel)
-                .filter(WorkflowNodeModel.workflow_id == w.id)
-                .count()
-            )
-            result.append(
-                {
-                    "id": w.id,
-                    "name": w.name,
-                    "description": w.description,
-                    "config": w.config,
-                    "created_at": w.created_at,
-                    "updated_at": w.updated_at,
-                    "version": w.version,
-                    "node_count": node_count,
-                }
-            )
-        return result
+        return [{**w.to_dict(), "node_count": node_count} for w, node_count in rows]
 
 
 def update_workflow(
@@ -670,9 +866,9 @@ def update_workflow(
 ) -> bool:
     """Update workflow and optionally its nodes/edges."""
     with SessionLocal() as db:
-        workflow = (
-            db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).first()
-        )
+        workflow = db.scalars(
+            lambda_stmt(lambda: select(WorkflowModel).where(WorkflowModel.id == workflow_id))
+        ).first()
         if not workflow:
             return False
 
@@ -690,29 +886,13 @@ def update_workflow(
             db.query(WorkflowNodeModel).filter(
                 WorkflowNodeModel.workflow_id == workflow_id
             ).delete()
-            for node in nodes:
-                node_model = WorkflowNodeModel(
-                    id=node["id"],
-                    workflow_id=workflow_id,
-                    node_data=node["data"],
-                    position_x=node.get("position_x", 0),
-                    position_y=node.get("position_y", 0),
-                )
-                db.add(node_model)
+            _insert_nodes(db, workflow_id, nodes)
 
         if edges is not None:
             db.query(WorkflowEdgeModel).filter(
                 WorkflowEdgeModel.workflow_id == workflow_id
             ).delete()
-            for edge in edges:
-                edge_model = WorkflowEdgeModel(
-                    id=edge["id"],
-                    workflow_id=workflow_id,
-                    source=edge["source"],
-                    target=edge["target"],
-                    edge_data=edge.get("data"),
-                )
-                db.add(edge_model)
+            _insert_edges(db, workflow_id, edges)
 
         db.commit()
         return True
@@ -721,12 +901,8 @@ def update_workflow(
 def delete_workflow(workflow_id: str) -> bool:
     """Delete workflow and all associated nodes/edges."""
     with SessionLocal() as db:
-        db.query(WorkflowNodeModel).filter(
-            WorkflowNodeModel.workflow_id == workflow_id
-        ).delete()
-        db.query(WorkflowEdgeModel).filter(
-            WorkflowEdgeModel.workflow_id == workflow_id
-        ).delete()
+        # Nodes and edges are removed by ON DELETE CASCADE; session assignments have no
+        # foreign key since sessions may reference workflows that were never saved here
         db.query(SessionWorkflowModel).filter(
             SessionWorkflowModel.workflow_id == workflow_id
         ).delete()
@@ -735,17 +911,20 @@ def delete_workflow(workflow_id: str) -> bool:
             db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).delete()
         )
         db.commit()
-        return deleted > 0
+    _cache_evict("session_workflow")
+    return deleted > 0
 
 
 def assign_workflow_to_session(session_name: str, workflow_id: str) -> bool:
     """Assign workflow to session."""
     with SessionLocal() as db:
-        existing = (
-            db.query(SessionWorkflowModel)
-            .filter(SessionWorkflowModel.session_name == session_name)
-            .first()
-        )
+        existing = db.scalars(
+            lambda_stmt(
+                lambda: select(SessionWorkflowModel).where(
+                    SessionWorkflowModel.session_name == session_name
+                )
+            )
+        ).first()
 
         if existing:
             existing.workflow_id = workflow_id
@@ -758,21 +937,27 @@ def assign_workflow_to_session(session_name: str, workflow_id: str) -> bool:
             db.add(mapping)
 
         db.commit()
-        return True
+    _cache_evict("session_workflow", session_name)
+    return True
 
 
 def get_session_workflow(session_name: str) -> Optional[str]:
     """Get workflow ID assigned to session."""
+    cached = _cache_get("session_workflow", session_name)
+    if cached is not None:
+        return cached
+    generation = _lookup_cache_generation
     with SessionLocal() as db:
-        mapping = (
-            db.query(SessionWorkflowModel)
-            .filter(SessionWorkflowModel.session_name == session_name)
-            .first()
-        )
-
-        if mapping:
-            return mapping.workflow_id
-        return None
+        workflow_id = db.execute(
+            lambda_stmt(
+                lambda: select(SessionWorkflowModel.workflow_id).where(
+                    SessionWorkflowModel.session_name == session_name
+                )
+            )
+        ).scalar_one_or_none()
+    if workflow_id is not None:
+        _cache_put("session_workflow", session_name, workflow_id, generation)
+    return workflow_id
 
 
 def unassign_workflow_from_session(session_name: str) -> bool:
@@ -784,7 +969,8 @@ def unassign_workflow_from_session(session_name: str) -> bool:
             .delete()
         )
         db.commit()
-        return deleted > 0
+    _cache_evict("session_workflow", session_name)
+    return deleted > 0
 
 
 def create_terminal_state(
@@ -804,38 +990,25 @@ def create_terminal_state(
             last_checkpoint=last_checkpoint,
         )
         db.add(state)
+        db.flush()
+        created = state.to_dict()
         db.commit()
-        db.refresh(state)
-        return {
-            "terminal_id": state.terminal_id,
-            "context_data": state.context_data,
-            "variables": state.variables,
-            "initial_prompt": state.initial_prompt,
-            "last_checkpoint": state.last_checkpoint,
-            "created_at": state.created_at,
-            "updated_at": state.updated_at,
-        }
+        return created
 
 
 def get_terminal_state(terminal_id: str) -> Optional[Dict[str, Any]]:
     """Get terminal state by terminal ID."""
     with SessionLocal() as db:
-        state = (
-            db.query(TerminalStateModel)
-            .filter(TerminalStateModel.terminal_id == terminal_id)
-            .first()
-        )
+        state = db.scalars(
+            lambda_stmt(
+                lambda: select(TerminalStateModel).where(
+                    TerminalStateModel.terminal_id == terminal_id
+                )
+            )
+        ).first()
         if not state:
             return None
-        return {
-            "terminal_id": state.terminal_id,
-            "context_data": state.context_data,
-            "variables": state.variables,
-            "initial_prompt": state.initial_prompt,
-            "last_checkpoint": state.last_checkpoint,
-            "created_at": state.created_at,
-            "updated_at": state.updated_at,
-        }
+        return state.to_dict()
 
 
 def update_terminal_state(
@@ -844,16 +1017,18 @@ def update_terminal_state(
     variables: Optional[str] = None,
     initial_prompt: Optional[str] = None,
     last_checkpoint: Optional[str] = None,
-) -> bool:
-    """Update terminal state."""
+) -> Optional[Dict[str, Any]]:
+    """Update terminal state and return it, or None if the terminal has no state."""
     with SessionLocal() as db:
-        state = (
-            db.query(TerminalStateModel)
-            .filter(TerminalStateModel.terminal_id == terminal_id)
-            .first()
-        )
+        state = db.scalars(
+            lambda_stmt(
+                lambda: select(TerminalStateModel).where(
+                    TerminalStateModel.terminal_id == terminal_id
+                )
+            )
+        ).first()
         if not state:
-            return False
+            return None
 
         if context_data is not None:
             state.context_data = context_data
@@ -865,8 +1040,44 @@ def update_terminal_state(
             state.last_checkpoint = last_checkpoint
 
         state.updated_at = datetime.now()
+        # Every column is set client-side, so the row can be returned without re-reading it
+        db.flush()
+        updated = state.to_dict()
         db.commit()
-        return True
+        return updated
+
+
+def upsert_terminal_state(
+    terminal_id: str,
+    context_data: Optional[str] = None,
+    variables: Optional[str] = None,
+    initial_prompt: Optional[str] = None,
+    last_checkpoint: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Create terminal state, or update the given (non-None) fields if it exists."""
+    fields = {
+        "context_data": context_data,
+        "variables": variables,
+        "initial_prompt": initial_prompt,
+        "last_checkpoint": last_checkpoint,
+    }
+    now = datetime.now()
+    stmt = sqlite_insert(TerminalStateModel).values(
+        terminal_id=terminal_id, created_at=now, updated_at=now, **fields
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TerminalStateModel.terminal_id],
+        set_={
+            **{name: stmt.excluded[name] for name, value in fields.items() if value is not None},
+            "updated_at": now,
+        },
+    )
+    with SessionLocal() as db:
+        db.execute(stmt)
+        state = db.get(TerminalStateModel, terminal_id)
+        result = state.to_dict()
+        db.commit()
+        return result
 
 
 def delete_terminal_state(terminal_id: str) -> bool:
@@ -906,60 +1117,41 @@ def create_task(
             task_metadata=task_metadata,
         )
         db.add(task)
+        db.flush()
+        created = task.to_dict()
         db.commit()
-        db.refresh(task)
-        return {
-            "id": task.id,
-            "workflow_id": task.workflow_id,
-            "title": task.title,
-            "description": task.description,
-            "task_type": task.task_type,
-            "priority": task.priority,
-            "status": task.status,
-            "dependencies": task.dependencies,
-            "task_metadata": task.task_metadata,
-            "created_at": task.created_at,
-            "updated_at": task.updated_at,
-            "completed_at": task.completed_at,
-        }
+        return created
 
 
 def get_task(task_id: str) -> Optional[Dict[str, Any]]:
     """Get task by ID."""
     with SessionLocal() as db:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = db.scalars(
+            lambda_stmt(lambda: select(TaskModel).where(TaskModel.id == task_id))
+        ).first()
         if not task:
             return None
-        return {
-            "id": task.id,
-            "workflow_id": task.workflow_id,
-            "title": task.title,
-            "description": task.description,
-            "task_type": task.task_type,
-            "priority": task.priority,
-            "status": task.status,
-            "dependencies": task.dependencies,
-            "task_metadata": task.task_metadata,
-            "created_at": task.created_at,
-            "updated_at": task.updated_at,
-            "completed_at": task.completed_at,
-        }
+        return task.to_dict()
 
 
 def update_task_status(
     task_id: str, status: str, completed_at: Optional[datetime] = None
-) -> bool:
-    """Update task status."""
+) -> Optional[Dict[str, Any]]:
+    """Update task status and return the task, or None if it does not exist."""
     with SessionLocal() as db:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = db.scalars(
+            lambda_stmt(lambda: select(TaskModel).where(TaskModel.id == task_id))
+        ).first()
         if not task:
-            return False
+            return None
         task.status = status
         task.updated_at = datetime.now()
         if completed_at:
             task.completed_at = completed_at
+        db.flush()
+        updated = task.to_dict()
         db.commit()
-        return True
+        return updated
 
 
 def list_tasks(
@@ -979,49 +1171,58 @@ def list_tasks(
             query = query.filter(TaskModel.task_type == task_type)
 
         tasks = query.order_by(TaskModel.priority.desc(), TaskModel.created_at).all()
-        return [
-            {
-                "id": t.id,
-                "workflow_id": t.workflow_id,
-                "title": t.title,
-                "description": t.description,
-                "task_type": t.task_type,
-                "priority": t.priority,
-                "status": t.status,
-                "dependencies": t.dependencies,
-                "task_metadata": t.task_metadata,
-                "created_at": t.created_at,
-                "updated_at": t.updated_at,
-                "completed_at": t.completed_at,
-            }
-            for t in tasks
-        ]
+        return [t.to_dict() for t in tasks]
 
 
 def assign_task(
-    task_id: str, terminal_id: str, status: str = "ASSIGNED"
-) -> Dict[str, Any]:
-    """Assign task to terminal."""
+    task_id: str,
+    terminal_id: str,
+    status: str = "ASSIGNED",
+    from_statuses: Optional[Sequence[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Assign task to terminal.
+
+    With from_statuses, the task itself is moved to status in the same
+    transaction, but only while it is in one of from_statuses. Otherwise
+    nothing is written and None is returned, so two concurrent callers can
+    never both assign the same task.
+    """
     with SessionLocal() as db:
+        if from_statuses is not None:
+            claimed = (
+                db.query(TaskModel)
+                .filter(TaskModel.id == task_id, TaskModel.status.in_(from_statuses))
+                .update(
+                    {TaskModel.status: status, TaskModel.updated_at: datetime.now()},
+                    synchronize_session=False,
+                )
+            )
+            if not claimed:
+                return None
+
         assignment = TaskAssignmentModel(
             task_id=task_id,
             terminal_id=terminal_id,
             status=status,
         )
         db.add(assignment)
+        db.flush()
+        created = assignment.to_dict()
         db.commit()
-        db.refresh(assignment)
-        return {
-            "id": assignment.id,
-            "task_id": assignment.task_id,
-            "terminal_id": assignment.terminal_id,
-            "assigned_at": assignment.assigned_at,
-            "started_at": assignment.started_at,
-            "completed_at": assignment.completed_at,
-            "status": assignment.status,
-            "result": assignment.result,
-            "error_message": assignment.error_message,
-        }
+        return created
+
+
+def _assignment_to_dict(a: TaskAssignmentModel) -> Dict[str, Any]:
+    """Convert an assignment row to a dict, decoding its JSON result."""
+    data = a.to_dict()
+    result = data.pop("result")
+    data["result_data"] = None
+    if result:
+        try:
+            data["result_data"] = json.loads(result)
+        except json.JSONDecodeError:
+            data["result_data"] = result
+    return data
 
 
 def update_task_assignment(
@@ -1031,16 +1232,16 @@ def update_task_assignment(
     completed_at: Optional[datetime] = None,
     result: Optional[str] = None,
     error_message: Optional[str] = None,
-) -> bool:
-    """Update task assignment."""
+) -> Optional[Dict[str, Any]]:
+    """Update task assignment and return it, or None if it does not exist."""
     with SessionLocal() as db:
-        assignment = (
-            db.query(TaskAssignmentModel)
-            .filter(TaskAssignmentModel.id == assignment_id)
-            .first()
-        )
+        assignment = db.scalars(
+            lambda_stmt(
+                lambda: select(TaskAssignmentModel).where(TaskAssignmentModel.id == assignment_id)
+            )
+        ).first()
         if not assignment:
-            return False
+            return None
 
         if status is not None:
             assignment.status = status
@@ -1053,8 +1254,10 @@ def update_task_assignment(
         if error_message is not None:
             assignment.error_message = error_message
 
+        db.flush()
+        updated = _assignment_to_dict(assignment)
         db.commit()
-        return True
+        return updated
 
 
 def get_task_assignments(
@@ -1070,26 +1273,4 @@ def get_task_assignments(
             query = query.filter(TaskAssignmentModel.terminal_id == terminal_id)
 
         assignments = query.order_by(TaskAssignmentModel.assigned_at.desc()).all()
-        result_list = []
-        for a in assignments:
-            result_data = None
-            if a.result:
-                try:
-                    result_data = json.loads(a.result)
-                except json.JSONDecodeError:
-                    result_data = a.result
-
-            result_list.append(
-                {
-                    "id": a.id,
-                    "task_id": a.task_id,
-                    "terminal_id": a.terminal_id,
-                    "assigned_at": a.assigned_at,
-                    "started_at": a.started_at,
-                    "completed_at": a.completed_at,
-                    "status": a.status,
-                    "result_data": result_data,
-                    "error_message": a.error_message,
-                }
-            )
-        return result_list
+        return [_assignment_to_dict(a) for a in assignments]
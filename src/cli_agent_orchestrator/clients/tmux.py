@@ -3,6 +3,9 @@
 import logging
 import os
 import re
+import shlex
+import subprocess
+import threading
 import time
 from typing import Dict, List, Optional
 
@@ -21,6 +24,9 @@ class TmuxClient:
 
     def __init__(self) -> None:
         self.server = libtmux.Server()
+        # Persistent control-mode (tmux -C) clients, one per session
+        self._control_clients: Dict[str, subprocess.Popen] = {}
+        self._control_lock = threading.Lock()
 
     def create_session(self, session_name: str, window_name: str, terminal_id: str) -> str:
         """Create detached tmux session with initial window and return window name."""
@@ -183,6 +189,7 @@ class TmuxClient:
 
     def kill_session(self, session_name: str) -> bool:
         """Kill tmux session."""
+        self.close_control_client(session_name)
         try:
             session = self.server.sessions.get(session_name=session_name)
             if session:
@@ -272,6 +279,85 @@ class TmuxClient:
         except Exception as e:
             logger.error(f"Failed to resize window {session_name}:{window_name}: {e}")
 
+    def _get_control_client(self, session_name: str) -> subprocess.Popen:
+        """Return a live control-mode client for the session, starting one if needed."""
+        proc = self._control_clients.get(session_name)
+        if proc is None or proc.poll() is not None:
+            # ignore-size keeps this client from constraining window sizes,
+            # no-output stops tmux from streaming pane output to it
+            proc = subprocess.Popen(
+                [
+                    "tmux",
+                    "-C",
+                    "attach-session",
+                    "-t",
+                    session_name,
+                    "-f",
+                    "ignore-size,no-output",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            self._control_clients[session_name] = proc
+            logger.debug(f"Started tmux control client for {session_name} (pid={proc.pid})")
+        return proc
+
+    def send_control_commands(self, session_name: str, *commands: str) -> None:
+        """Write tmux commands to the session's control-mode client in one flush.
+
+        Avoids a fork/exec per command. Retries once with a fresh client if the
+        cached one has gone away.
+        """
+        payload = "".join(f"{command}\n" for command in commands).encode()
+        with self._control_lock:
+            for attempt in range(2):
+                proc = self._get_control_client(session_name)
+                try:
+                    assert proc.stdin is not None
+                    proc.stdin.write(payload)
+                    proc.stdin.flush()
+                    return
+                except (BrokenPipeError, OSError):
+                    self._control_clients.pop(session_name, None)
+                    if attempt:
+                        raise
+
+    def close_control_client(self, session_name: str) -> None:
+        """Detach and reap the control-mode client for a session, if any."""
+        with self._control_lock:
+            proc = self._control_clients.pop(session_name, None)
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.terminate()
+            proc.wait(timeout=1)
+        except Exception as e:
+            logger.debug(f"Failed to close tmux control client for {session_name}: {e}")
+
+    def close_all_control_clients(self) -> None:
+        """Close every control-mode client (called on server shutdown)."""
+        for session_name in list(self._control_clients):
+            self.close_control_client(session_name)
+
+    def resize(self, session_name: str, window_name: str, cols: int, rows: int) -> None:
+        """Resize a window through the control-mode client (no subprocess per call).
+
+        Falls back to resize_window if the control client cannot be used.
+        """
+        target = shlex.quote(f"{session_name}:{window_name}")
+        try:
+            self.send_control_commands(
+                session_name, f"resize-window -t {target} -x {cols} -y {rows}"
+            )
+            logger.debug(f"Resized {session_name}:{window_name} to {cols}x{rows}")
+        except Exception as e:
+            logger.warning(f"tmux control client unavailable for {session_name}: {e}")
+            self.resize_window(session_name, window_name, cols, rows)
+
     def get_pane_tty(self, session_name: str, window_name: str) -> Optional[str]:
         """Get the TTY path for the active pane in a window."""
         try:
@@ -0,0 +1,391 @@
+"""Shared 'tmux attach' PTYs, fanned out to every WebSocket viewing the same window."""
+
+import asyncio
+import errno
+import fcntl
+import logging
+import os
+import pty
+import shlex
+import struct
+import termios
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from cli_agent_orchestrator.clients.tmux import tmux_client
+from cli_agent_orchestrator.constants import (
+    PTY_FLUSH_BYTES,
+    PTY_FLUSH_INTERVAL,
+    PTY_READ_SIZE,
+    TMUX_VIEW_LINGER,
+    WS_RESIZE_DEBOUNCE,
+    WS_SEND_QUEUE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# TIOCSWINSZ payload: rows, cols, xpixel, ypixel
+_WINSZ = struct.Struct("HHHH")
+
+
+async def _terminate_process(proc: asyncio.subprocess.Process, timeout: float = 2) -> None:
+    """Terminate a child process without blocking the event loop."""
+    if proc.returncode is not None:
+        return
+    try:
+        proc.terminate()
+        await asyncio.wait_for(proc.wait(), timeout)
+    except ProcessLookupError:
+        pass
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+class TmuxView:
+    """One 'tmux attach' process on a PTY, shared by all viewers of a window.
+
+    Output is read once and published to a bounded queue per subscriber; a
+    None frame tells subscribers the view has closed.
+    """
+
+    def __init__(
+        self,
+        session_name: str,
+        window_name: str,
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.session_name = session_name
+        self.window_name = window_name
+        self.target = f"{session_name}:{window_name}"
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._master_fd = -1
+        self._tty_name = ""
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._write_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        # tmux control commands block on a pipe and a lock, so they run in worker threads
+        self._tmux_tasks: Set[asyncio.Task] = set()
+        self._redraw_pending = False
+        self._redraw_task: Optional[asyncio.Task] = None
+        self._resize_handle: Optional[asyncio.TimerHandle] = None
+        self._linger_handle: Optional[asyncio.TimerHandle] = None
+        # Called as soon as the view is marked closed, so it stops being handed out
+        self._on_close = on_close
+
+    async def start(self, cols: int, rows: int) -> None:
+        """Spawn 'tmux attach' on a fresh PTY sized to cols x rows."""
+        master_fd, slave_fd = pty.openpty()
+        try:
+            fcntl.ioctl(master_fd, termios.TIOCSWINSZ, _WINSZ.pack(rows, cols, 0, 0))
+            self._tty_name = os.ttyname(slave_fd)
+            # WITHOUT -r flag, viewers need full interaction
+            self._proc = await asyncio.create_subprocess_exec(
+                "tmux",
+                "attach-session",
+                "-t",
+                self.target,
+                stdin=slave_fd,
+                stdout=slave_fd,
+                stderr=slave_fd,
+                start_new_session=True,  # New session for clean process management
+            )
+        except Exception:
+            os.close(master_fd)
+            raise
+        finally:
+            os.close(slave_fd)  # Close slave in parent
+
+        # Make master_fd non-blocking for asyncio compatibility
+        flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
+        fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        self._master_fd = master_fd
+        self._tasks = [
+            asyncio.create_task(self._read_loop()),
+            asyncio.create_task(self._write_loop()),
+        ]
+        logger.info(f"PTY created for {self.target}, master_fd={master_fd}, pid={self._proc.pid}")
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a viewer and return the queue its output frames arrive on.
+
+        The new viewer has missed everything drawn so far, so tmux is asked
+        for a full repaint.
+        """
+        if self._linger_handle:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        self.request_redraw()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Drop a viewer; the PTY is closed once nobody has watched for TMUX_VIEW_LINGER."""
+        self.subscribers.discard(queue)
+        if not self.subscribers and not self.closed:
+            self._linger_handle = self.loop.call_later(TMUX_VIEW_LINGER, self._linger_expired)
+
+    def write(self, data: bytes) -> None:
+        """Queue input for the PTY."""
+        self._write_queue.put_nowait(data)
+
+    def resize(self, cols: int, rows: int) -> None:
+        """Resize the PTY now and the tmux window once resizing settles."""
+        fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, _WINSZ.pack(rows, cols, 0, 0))
+
+        # Debounce: only the last size of a drag reaches tmux
+        if self._resize_handle:
+            self._resize_handle.cancel()
+        self._resize_handle = self.loop.call_later(
+            WS_RESIZE_DEBOUNCE,
+            lambda: self._run_tmux_task(asyncio.to_thread(self._resize_tmux_window, cols, rows)),
+        )
+
+    def request_redraw(self) -> None:
+        """Ask tmux to repaint this view's client, e.g. for a viewer that just joined.
+
+        Requests made while a repaint is in flight are folded into one more repaint
+        after it, so every caller sees a repaint that started after its request.
+        """
+        self._redraw_pending = True
+        if self._redraw_task is None or self._redraw_task.done():
+            self._redraw_task = self._run_tmux_task(self._redraw_loop())
+
+    async def _redraw_loop(self) -> None:
+        while self._redraw_pending:
+            self._redraw_pending = False
+            try:
+                await asyncio.to_thread(
+                    tmux_client.send_control_commands,
+                    self.session_name,
+                    f"refresh-client -t {shlex.quote(self._tty_name)}",
+                )
+            except Exception as e:
+                logger.error(f"Failed to refresh tmux client for {self.target}: {e}")
+
+    def _run_tmux_task(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        # Hold a reference until done; the loop only keeps weak ones
+        task = asyncio.create_task(coro)
+        self._tmux_tasks.add(task)
+        task.add_done_callback(self._tmux_tasks.discard)
+        return task
+
+    async def close(self) -> None:
+        """Stop the PTY and tmux process and send the end-of-stream frame to viewers."""
+        if self._mark_closed():
+            await self._teardown()
+
+    def _mark_closed(self) -> bool:
+        """Flag the view closed and unregister it; False if it already was."""
+        if self.closed:
+            return False
+        self.closed = True
+        for handle in (self._resize_handle, self._linger_handle):
+            if handle:
+                handle.cancel()
+        if self._on_close:
+            self._on_close()
+        return True
+
+    async def _teardown(self) -> None:
+        current = asyncio.current_task()
+        tasks = [task for task in (*self._tasks, *self._tmux_tasks) if task is not current]
+        for task in tasks:
+            task.cancel()
+        # Let reader and writer unregister master_fd from the loop before closing it
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if self._master_fd >= 0:
+            os.close(self._master_fd)
+        if self._proc:
+            await _terminate_process(self._proc)
+
+        for queue in self.subscribers:
+            self._discard_backlog(queue)
+            queue.put_nowait(None)
+        logger.info(f"Closed shared PTY for {self.target}")
+
+    def _publish(self, frame: bytes) -> None:
+        lagging = False
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Partial output is useless to a viewer this far behind; drop its
+                # backlog and let a full repaint bring it back in sync
+                self._discard_backlog(queue)
+                lagging = True
+        if lagging:
+            self.request_redraw()
+
+    @staticmethod
+    def _discard_backlog(queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+
+    def _linger_expired(self) -> None:
+        self._linger_handle = None
+        # Closed synchronously so a viewer arriving before the teardown task runs
+        # gets a fresh view instead of subscribing to this dying one
+        if not self.subscribers and self._mark_closed():
+            self._tasks.append(asyncio.create_task(self._teardown()))
+
+    def _resize_tmux_window(self, cols: int, rows: int) -> None:
+        try:
+            tmux_client.resize(self.session_name, self.window_name, cols, rows)
+            logger.info(f"Resized PTY and tmux window to {cols}x{rows}")
+        except Exception as e:
+            logger.error(f"Failed to resize tmux window: {e}")
+
+    async def _read_loop(self) -> None:
+        """PTY master → subscribers, coalescing bursts into larger frames."""
+        master_fd = self._master_fd
+        readable = asyncio.Event()
+        self.loop.add_reader(master_fd, readable.set)
+        buffer = bytearray()
+
+        def drain() -> bool:
+            """Read everything currently available; return False on EOF."""
+            while len(buffer) < PTY_FLUSH_BYTES:
+                try:
+                    chunk = os.read(master_fd, PTY_READ_SIZE)
+                except BlockingIOError:
+                    return True
+                except OSError as e:
+                    # Linux reports EIO on the master once the slave side is closed
+                    if e.errno == errno.EIO:
+                        return False
+                    raise
+                if not chunk:
+                    return False
+                buffer.extend(chunk)
+            return True
+
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
+                alive = drain()
+
+                # Coalesce bursts: keep reading until the buffer fills or
+                # PTY_FLUSH_INTERVAL has passed since the first byte arrived
+                deadline = self.loop.time() + PTY_FLUSH_INTERVAL
+                while alive and len(buffer) < PTY_FLUSH_BYTES:
+                    remaining = deadline - self.loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(readable.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    readable.clear()
+                    alive = drain()
+
+                if buffer:
+                    self._publish(bytes(buffer))
+                    buffer.clear()
+
+                if not alive:
+                    logger.info(f"PTY closed (EOF) for {self.target}")
+                    break
+        except Exception as e:
+            logger.error(f"PTY read error: {e}")
+        finally:
+            self.loop.remove_reader(master_fd)
+
+        # Reached on EOF or read error, not on cancellation
+        await self.close()
+
+    async def _write_loop(self) -> None:
+        """Input queue → PTY master; a full PTY buffer holds input back instead of dropping keys."""
+        master_fd = self._master_fd
+        queue = self._write_queue
+        try:
+            while True:
+                chunks = [await queue.get()]
+                # A paste or IME burst arrives as many small messages; write
+                # everything already queued with one syscall
+                while not queue.empty():
+                    chunks.append(queue.get_nowait())
+                data = memoryview(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+                while data:
+                    try:
+                        written = os.write(master_fd, data)
+                    except BlockingIOError:
+                        writable = self.loop.create_future()
+                        self.loop.add_writer(master_fd, writable.set_result, None)
+                        try:
+                            await writable
+                        finally:
+                            self.loop.remove_writer(master_fd)
+                        continue
+                    data = data[written:]
+        except OSError as e:
+            logger.error(f"PTY write error: {e}")
+
+
+class TmuxViewRegistry:
+    """Module singleton mapping (session, window) → shared TmuxView."""
+
+    def __init__(self) -> None:
+        self._views: Dict[Tuple[str, str], TmuxView] = {}
+        self._starting: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def get_or_create_view(
+        self, session_name: str, window_name: str, cols: int, rows: int
+    ) -> TmuxView:
+        """Return the running view for a window, starting one if needed.
+
+        A viewer joining an existing view resizes it to its own size; as with
+        plain tmux clients, the last viewer to resize wins.
+        """
+        key = (session_name, window_name)
+        loop = asyncio.get_running_loop()
+
+        # Concurrent first viewers share a single startup
+        starting = self._starting.get(key)
+        if starting and starting.get_loop() is loop:
+            return await asyncio.shield(starting)
+
+        view = self._views.get(key)
+        if view and not view.closed and view.loop is loop:
+            view.resize(cols, rows)
+            return view
+
+        view = TmuxView(session_name, window_name, on_close=lambda: self._forget(key, view))
+        starting = asyncio.create_task(self._start_view(key, view, cols, rows))
+        self._starting[key] = starting
+        return await asyncio.shield(starting)
+
+    async def _start_view(
+        self, key: Tuple[str, str], view: TmuxView, cols: int, rows: int
+    ) -> TmuxView:
+        try:
+            await view.start(cols, rows)
+        finally:
+            self._starting.pop(key, None)
+        self._views[key] = view
+        return view
+
+    def _forget(self, key: Tuple[str, str], view: TmuxView) -> None:
+        if self._views.get(key) is view:
+            del self._views[key]
+
+    async def close_all(self) -> None:
+        """Close every view on the running loop (called on server shutdown)."""
+        loop = asyncio.get_running_loop()
+        views = list(self._views.values())
+        self._views.clear()
+        for view in views:
+            if view.loop is loop:
+                await view.close()
+
+
+# Module-level singleton
+tmux_views = TmuxViewRegistry()
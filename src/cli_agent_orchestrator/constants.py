@@ -1,5 +1,6 @@
 """Constants for CLI Agent Orchestrator application."""
 
+import os
 from pathlib import Path
 
 from cli_agent_orchestrator.models.provider import ProviderType
@@ -28,8 +29,38 @@ TERMINAL_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Terminal log configuration
 INBOX_POLLING_INTERVAL = 5  # Seconds between polling for log file changes
+# Polling interval when the log dir is on a remote mount; override with CAO_INBOX_POLLING_INTERVAL
+INBOX_FALLBACK_POLLING_INTERVAL = float(os.getenv("CAO_INBOX_POLLING_INTERVAL", "30"))
+INBOX_DELIVERY_DEBOUNCE = 0.02  # Seconds to coalesce new messages before attempting delivery
+INBOX_WRITE_BATCH_SIZE = 64  # Max new inbox messages inserted per transaction
+INBOX_WRITE_BATCH_WINDOW = 0.005  # Seconds to collect new inbox messages into one transaction
 INBOX_SERVICE_TAIL_LINES = 5  # Number of lines to check in get_status for inbox service
 
+# Flow daemon configuration
+FLOW_DAEMON_MAX_SLEEP = 60  # Max seconds between schedule checks
+FLOW_EXECUTION_CONCURRENCY = 8  # Max due flows executed in parallel per daemon tick
+
+# Terminal WebSocket bridge configuration
+PTY_READ_SIZE = 65536  # Bytes per os.read() on the PTY master
+PTY_FLUSH_BYTES = 16384  # Send a WebSocket frame once this much output is buffered
+PTY_FLUSH_INTERVAL = 0.005  # Max seconds to hold output before sending a frame
+WS_SEND_QUEUE_SIZE = 64  # Output frames buffered per WebSocket before the PTY reader waits
+WS_RESIZE_DEBOUNCE = 0.03  # Seconds to wait for resize events to settle before resizing tmux
+TMUX_VIEW_LINGER = 5.0  # Seconds a shared tmux attach PTY survives after its last viewer leaves
+
+# Outbound webhook configuration (per destination host)
+WEBHOOK_BREAKER_FAIL_MAX = 5  # Consecutive connection failures/timeouts before failing fast
+WEBHOOK_BREAKER_RESET_TIMEOUT = 30.0  # Seconds to fail fast before letting a trial call through
+WEBHOOK_HOST_CONCURRENCY = 50  # Max concurrent outbound calls to a single host
+WEBHOOK_RETRY_ATTEMPTS = 3  # Total attempts for timeouts, dropped connections and 429/502/503/504
+WEBHOOK_RETRY_BACKOFF = 0.1  # Base delay in seconds, doubled per attempt (full jitter)
+WEBHOOK_RETRY_MAX_DELAY = 2.0  # Upper bound in seconds for a single retry delay
+WEBHOOK_DEADLINE = 35.0  # End-to-end seconds per request, retries included
+
+# Task API read cache; every task or terminal-state write through the API clears it
+TASK_READ_CACHE_TTL = 5.0  # Seconds a cached task/terminal-state read is served
+TASK_READ_CACHE_MAX_ENTRIES = 1024  # Cache is emptied once it holds this many keys
+
 # Cleanup configuration
 RETENTION_DAYS = 14  # Days to keep terminals, messages, and logs
 
@@ -37,6 +68,7 @@ AGENT_CONTEXT_DIR = CAO_HOME_DIR / "agent-context"
 
 # Agent store directories
 LOCAL_AGENT_STORE_DIR = CAO_HOME_DIR / "agent-store"
+AGENT_DOWNLOAD_MAX_BYTES = 5 * 1024 * 1024  # Largest agent profile accepted from a URL install
 
 # Q CLI directories
 Q_AGENTS_DIR = Path.home() / ".aws" / "amazonq" / "cli-agents"
@@ -47,6 +79,14 @@ KIRO_AGENTS_DIR = Path.home() / ".kiro" / "agents"
 # Database configuration
 DATABASE_FILE = DB_DIR / "cli-agent-orchestrator.db"
 DATABASE_URL = f"sqlite:///{DATABASE_FILE}"
+DATABASE_POOL_SIZE = 8  # Connections kept open for reuse
+# Extra connections under load; size + overflow covers asyncio.to_thread's 32 workers
+DATABASE_POOL_OVERFLOW = 24
+# Seconds a cached terminal/flow/session-workflow lookup is served. The cache is
+# per process: rows changed or deleted by another process (e.g. `cao shutdown`
+# removing a session's terminals) can be served stale for up to this long.
+DATABASE_LOOKUP_CACHE_TTL = 5.0
+DATABASE_LOOKUP_CACHE_MAX_ENTRIES = 1024  # Cache is emptied once it holds this many keys
 
 # Server configuration
 SERVER_HOST = "localhost"
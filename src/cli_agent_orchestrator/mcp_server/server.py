@@ -9,12 +9,19 @@ from typing import Any, Dict, Tuple
 import requests
 from fastmcp import FastMCP
 from pydantic import Field
+from requests.adapters import HTTPAdapter
 
 from cli_agent_orchestrator.constants import API_BASE_URL, DEFAULT_PROVIDER
 from cli_agent_orchestrator.mcp_server.models import HandoffResult
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.utils.terminal import generate_session_name, wait_until_terminal_status
 
+# Keep-alive session for calls to the cao-server API; a handoff makes many calls to the same host
+_api_session = requests.Session()
+_api_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_api_session.mount("http://", _api_adapter)
+_api_session.mount("https://", _api_adapter)
+
 # Create MCP server
 mcp = FastMCP(
     "cao-mcp-server",
@@ -50,7 +57,7 @@ def _create_terminal(agent_profile: str) -> Tuple[str, str]:
     current_terminal_id = os.environ.get("CAO_TERMINAL_ID")
     if current_terminal_id:
         # Get terminal metadata via API
-        response = requests.get(f"{API_BASE_URL}/terminals/{current_terminal_id}")
+        response = _api_session.get(f"{API_BASE_URL}/terminals/{current_terminal_id}")
         response.raise_for_status()
         terminal_metadata = response.json()
 
@@ -58,7 +65,7 @@ def _create_terminal(agent_profile: str) -> Tuple[str, str]:
         session_name = terminal_metadata["session_name"]
 
         # Create new terminal in existing session
-        response = requests.post(
+        response = _api_session.post(
             f"{API_BASE_URL}/sessions/{session_name}/terminals",
             params={"provider": provider, "agent_profile": agent_profile},
         )
@@ -67,7 +74,7 @@ def _create_terminal(agent_profile: str) -> Tuple[str, str]:
     else:
         # Create new session with terminal
         session_name = generate_session_name()
-        response = requests.post(
+        response = _api_session.post(
             f"{API_BASE_URL}/sessions",
             params={
                 "provider": provider,
@@ -91,7 +98,7 @@ def _send_direct_input(terminal_id: str, message: str) -> None:
     Raises:
         Exception: If sending fails
     """
-    response = requests.post(
+    response = _api_session.post(
         f"{API_BASE_URL}/terminals/{terminal_id}/input", params={"message": message}
     )
     response.raise_for_status()
@@ -115,7 +122,7 @@ def _send_to_inbox(receiver_id: str, message: str) -> Dict[str, Any]:
     if not sender_id:
         raise ValueError("CAO_TERMINAL_ID not set - cannot determine sender")
 
-    response = requests.post(
+    response = _api_session.post(
         f"{API_BASE_URL}/terminals/{receiver_id}/inbox/messages",
         params={"sender_id": sender_id, "message": message},
     )
@@ -196,7 +203,7 @@ async def handoff(
             )
 
         # Get the response
-        response = requests.get(
+        response = _api_session.get(
             f"{API_BASE_URL}/terminals/{terminal_id}/output", params={"mode": "last"}
         )
         response.raise_for_status()
@@ -204,7 +211,7 @@ async def handoff(
         output = output_data["output"]
 
         # Send provider-specific exit command to cleanup terminal
-        response = requests.post(f"{API_BASE_URL}/terminals/{terminal_id}/exit")
+        response = _api_session.post(f"{API_BASE_URL}/terminals/{terminal_id}/exit")
         response.raise_for_status()
 
         execution_time = time.time() - start_time
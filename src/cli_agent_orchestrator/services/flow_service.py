@@ -5,7 +5,7 @@ import logging
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import frontmatter  # type: ignore
 from apscheduler.triggers.cron import CronTrigger  # type: ignore
@@ -14,6 +14,9 @@ from cli_agent_orchestrator.clients.database import create_flow as db_create_flo
 from cli_agent_orchestrator.clients.database import delete_flow as db_delete_flow
 from cli_agent_orchestrator.clients.database import get_flow as db_get_flow
 from cli_agent_orchestrator.clients.database import get_flows_to_run as db_get_flows_to_run
+from cli_agent_orchestrator.clients.database import (
+    get_next_flow_run_time as db_get_next_flow_run_time,
+)
 from cli_agent_orchestrator.clients.database import list_flows as db_list_flows
 from cli_agent_orchestrator.clients.database import update_flow_enabled as db_update_flow_enabled
 from cli_agent_orchestrator.clients.database import (
@@ -223,3 +226,8 @@ def execute_flow(name: str) -> bool:
 def get_flows_to_run() -> List[Flow]:
     """Get flows that should run now."""
     return db_get_flows_to_run()
+
+
+def get_next_run_time() -> Optional[datetime]:
+    """Get the earliest scheduled run across enabled flows."""
+    return db_get_next_flow_run_time()
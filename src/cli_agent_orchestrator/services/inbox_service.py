@@ -74,10 +74,19 @@ def check_and_send_pending_messages(terminal_id: str) -> bool:
         logger.debug(f"Terminal {terminal_id} not ready (status={status})")
         return False
 
+    # Claim the message before sending so a concurrent check cannot deliver it twice.
+    # This makes delivery at-most-once: if the process dies between the claim and
+    # send_input, the message stays DELIVERED without reaching the terminal. That is
+    # preferred over typing the same message into an agent twice.
+    if not update_message_status(
+        message.id, MessageStatus.DELIVERED, from_status=MessageStatus.PENDING
+    ):
+        logger.debug(f"Message {message.id} already claimed by another delivery")
+        return False
+
     # Send message
     try:
         terminal_service.send_input(terminal_id, message.message)
-        update_message_status(message.id, MessageStatus.DELIVERED)
         logger.info(f"Delivered message {message.id} to terminal {terminal_id}")
         return True
     except Exception as e:
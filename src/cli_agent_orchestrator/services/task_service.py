@@ -9,18 +9,19 @@ from typing import Any, Dict, List, Optional
 from cli_agent_orchestrator.clients.database import (
     assign_task as db_assign_task,
     create_task as db_create_task,
-    create_terminal_state,
     get_task,
-    get_task_assignments,
     get_terminal_state,
     list_tasks,
     update_task_assignment,
     update_task_status,
-    update_terminal_state,
+    upsert_terminal_state,
 )
 
 logger = logging.getLogger(__name__)
 
+# Task statuses from which a task may be (re)assigned
+ASSIGNABLE_STATUSES = ("PENDING", "FAILED")
+
 
 def generate_task_id() -> str:
     """Generate unique task ID."""
@@ -66,10 +67,15 @@ def assign_task_to_terminal(
     if not task:
         raise ValueError(f"Task {task_id} not found")
 
-    if task["status"] not in ["PENDING", "FAILED"]:
+    if task["status"] not in ASSIGNABLE_STATUSES:
         raise ValueError(f"Task {task_id} is already {task['status']}")
 
-    terminal_state = get_terminal_state(terminal_id)
+    # Claims the task and records the assignment in one transaction
+    assignment = db_assign_task(
+        task_id, terminal_id, status="ASSIGNED", from_statuses=ASSIGNABLE_STATUSES
+    )
+    if assignment is None:
+        raise ValueError(f"Task {task_id} was assigned concurrently")
 
     context_data = {
         "current_task_id": task_id,
@@ -78,85 +84,64 @@ def assign_task_to_terminal(
         "assigned_at": datetime.now().isoformat(),
     }
 
-    if terminal_state:
-        update_terminal_state(
-            terminal_id=terminal_id,
-            context_data=json.dumps(context_data),
-            initial_prompt=initial_prompt,
-        )
-    else:
-        create_terminal_state(
-            terminal_id=terminal_id,
-            context_data=json.dumps(context_data),
-            initial_prompt=initial_prompt,
-        )
-
-    assignment = db_assign_task(task_id, terminal_id, status="ASSIGNED")
-
-    update_task_status(task_id, "ASSIGNED")
+    upsert_terminal_state(
+        terminal_id=terminal_id,
+        context_data=json.dumps(context_data),
+        initial_prompt=initial_prompt,
+    )
 
     logger.info(f"Assigned task {task_id} to terminal {terminal_id}")
     return assignment
 
 
-def start_task(assignment_id: int) -> bool:
-    """Mark task assignment as started."""
-    success = update_task_assignment(
+def start_task(assignment_id: int) -> Optional[Dict[str, Any]]:
+    """Mark task assignment as started; returns the assignment, or None if not found."""
+    assignment = update_task_assignment(
         assignment_id=assignment_id,
         status="IN_PROGRESS",
         started_at=datetime.now(),
     )
 
-    if success:
-        assignments = get_task_assignments()
-        for a in assignments:
-            if a["id"] == assignment_id:
-                update_task_status(a["task_id"], "IN_PROGRESS")
-                break
+    if assignment:
+        update_task_status(assignment["task_id"], "IN_PROGRESS")
 
-    return success
+    return assignment
 
 
-def complete_task(assignment_id: int, result: Optional[Dict[str, Any]] = None) -> bool:
-    """Mark task assignment as completed."""
+def complete_task(
+    assignment_id: int, result: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Mark task assignment as completed; returns the assignment, or None if not found."""
     result_json = json.dumps(result) if result else None
 
-    success = update_task_assignment(
+    assignment = update_task_assignment(
         assignment_id=assignment_id,
         status="COMPLETED",
         completed_at=datetime.now(),
         result=result_json,
     )
 
-    if success:
-        assignments = get_task_assignments()
-        for a in assignments:
-            if a["id"] == assignment_id:
-                update_task_status(
-                    a["task_id"], "COMPLETED", completed_at=datetime.now()
-                )
-                break
+    if assignment:
+        update_task_status(
+            assignment["task_id"], "COMPLETED", completed_at=datetime.now()
+        )
 
-    return success
+    return assignment
 
 
-def fail_task(assignment_id: int, error_message: str) -> bool:
-    """Mark task assignment as failed."""
-    success = update_task_assignment(
+def fail_task(assignment_id: int, error_message: str) -> Optional[Dict[str, Any]]:
+    """Mark task assignment as failed; returns the assignment, or None if not found."""
+    assignment = update_task_assignment(
         assignment_id=assignment_id,
         status="FAILED",
         completed_at=datetime.now(),
         error_message=error_message,
     )
 
-    if success:
-        assignments = get_task_assignments()
-        for a in assignments:
-            if a["id"] == assignment_id:
-                update_task_status(a["task_id"], "FAILED")
-                break
+    if assignment:
+        update_task_status(assignment["task_id"], "FAILED")
 
-    return success
+    return assignment
 
 
 def get_pending_tasks(
@@ -1,9 +1,13 @@
+import itertools
 import logging
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Shared across states so a version never repeats, even for a re-created state
+_versions = itertools.count(1)
+
 
 class WorkflowExecutionStatus(str, Enum):
     IDLE = "idle"
@@ -22,6 +26,13 @@ class NodeExecutionStatus(str, Enum):
 
 
 class WorkflowExecutionState:
+    """Execution progress of a workflow in a session.
+
+    to_dict() is memoized for pollers. Assigning an attribute invalidates it
+    and bumps version; in-place changes to node_states or spawned_terminals
+    must call touch().
+    """
+
     def __init__(self, workflow_id: str, session_name: str):
         self.workflow_id = workflow_id
         self.session_name = session_name
@@ -30,15 +41,32 @@ class WorkflowExecutionState:
         self.node_states: Dict[str, Dict] = {}
         self.spawned_terminals: Dict[str, str] = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.touch()
+
+    def touch(self) -> None:
+        """Mark the state as changed."""
+        self._dict_cache: Optional[Dict] = None
+        self._version = next(_versions)
+
+    @property
+    def version(self) -> int:
+        """Changes on every mutation; usable as an ETag."""
+        return self._version
+
     def to_dict(self) -> Dict:
-        return {
-            "workflow_id": self.workflow_id,
-            "session_name": self.session_name,
-            "status": self.status.value,
-            "current_node_id": self.current_node_id,
-            "node_states": self.node_states,
-            "spawned_terminals": self.spawned_terminals,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "workflow_id": self.workflow_id,
+                "session_name": self.session_name,
+                "status": self.status.value,
+                "current_node_id": self.current_node_id,
+                "node_states": self.node_states,
+                "spawned_terminals": self.spawned_terminals,
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict) -> "WorkflowExecutionState":
@@ -90,6 +118,7 @@ def update_node_state(
 
     if terminal_id:
         state.spawned_terminals[node_id] = terminal_id
+    state.touch()
 
     logger.info(
         f"Updated node {node_id} state to {status.value} in session {session_name}"
@@ -1,7 +1,10 @@
 """Agent profile utilities."""
 
+import hashlib
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 import frontmatter
 
@@ -11,11 +14,26 @@ from cli_agent_orchestrator.models.agent_profile import AgentProfile
 
 def list_installed_agents() -> list[str]:
     """List all installed agent profiles (local and built-in)."""
+    try:
+        local_mtime_ns: Optional[int] = LOCAL_AGENT_STORE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        local_mtime_ns = None
+    return list(_list_agents(str(LOCAL_AGENT_STORE_DIR), local_mtime_ns))
+
+
+def invalidate_agent_list() -> None:
+    """Drop cached listings, for changes made within one directory mtime tick."""
+    _list_agents.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _list_agents(local_dir: str, local_mtime_ns: Optional[int]) -> tuple[str, ...]:
+    """List agents; keyed by the local store's mtime so adding or removing a file invalidates."""
     agents = set()
 
     # List local agents
-    if LOCAL_AGENT_STORE_DIR.exists():
-        for file in LOCAL_AGENT_STORE_DIR.glob("*.md"):
+    if local_mtime_ns is not None:
+        for file in Path(local_dir).glob("*.md"):
             agents.add(file.stem)
 
     # List built-in agents
@@ -24,34 +42,75 @@ def list_installed_agents() -> list[str]:
         if file.name.endswith(".md"):
             agents.add(file.name[:-3])  # Remove .md extension
 
-    return sorted(list(agents))
+    return tuple(sorted(agents))
 
 
-def load_agent_profile(agent_name: str) -> AgentProfile:
-    """Load agent profile from local or built-in agent store."""
+class AgentContent(NamedTuple):
+    """Raw agent profile markdown plus HTTP cache validators."""
+
+    content: str
+    etag: str
+    last_modified: Optional[float]  # None for built-in profiles
+
+
+@lru_cache(maxsize=256)
+def _read_local_profile(path: str, mtime_ns: int, size: int) -> AgentContent:
+    """Read a local profile; keyed by mtime/size so edits invalidate the entry."""
+    return AgentContent(
+        content=Path(path).read_text(),
+        etag=f'W/"{mtime_ns:x}-{size:x}"',
+        last_modified=mtime_ns / 1e9,
+    )
+
+
+@lru_cache(maxsize=256)
+def _read_builtin_profile(agent_name: str) -> Optional[AgentContent]:
+    """Read a built-in profile; package data does not change while running."""
+    profile_file = resources.files("cli_agent_orchestrator.agent_store") / f"{agent_name}.md"
+    if not profile_file.is_file():
+        return None
+    content = profile_file.read_text()
+    digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+    return AgentContent(content=content, etag=f'"{digest}"', last_modified=None)
+
+
+def read_agent_content(agent_name: str) -> Optional[AgentContent]:
+    """Return raw markdown for an agent profile, preferring the local store.
+
+    Returns:
+        AgentContent, or None if the agent does not exist
+    """
+    local_profile = LOCAL_AGENT_STORE_DIR / f"{agent_name}.md"
     try:
-        # Check local store first
-        local_profile = LOCAL_AGENT_STORE_DIR / f"{agent_name}.md"
-        if local_profile.exists():
-            profile_data = frontmatter.loads(local_profile.read_text())
-            profile_data.metadata["system_prompt"] = profile_data.content.strip()
-            return AgentProfile(**profile_data.metadata)
-
-        # Fall back to built-in store
-        agent_store = resources.files("cli_agent_orchestrator.agent_store")
-        profile_file = agent_store / f"{agent_name}.md"
-
-        if not profile_file.is_file():
-            raise FileNotFoundError(f"Agent profile not found: {agent_name}")
+        stat = local_profile.stat()
+    except FileNotFoundError:
+        return _read_builtin_profile(agent_name)
+    return _read_local_profile(str(local_profile), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _parse_agent_profile(agent: AgentContent) -> AgentProfile:
+    """Parse profile markdown; cached per AgentContent, so edits to the file re-parse."""
+    # Parse frontmatter
+    profile_data = frontmatter.loads(agent.content)
 
-        # Parse frontmatter
-        profile_data = frontmatter.loads(profile_file.read_text())
+    # Add system_prompt from markdown content
+    profile_data.metadata["system_prompt"] = profile_data.content.strip()
 
-        # Add system_prompt from markdown content
-        profile_data.metadata["system_prompt"] = profile_data.content.strip()
+    # Let Pydantic handle the nested object parsing including mcpServers
+    return AgentProfile(**profile_data.metadata)
 
-        # Let Pydantic handle the nested object parsing including mcpServers
-        return AgentProfile(**profile_data.metadata)
+
+def load_agent_profile(agent_name: str) -> AgentProfile:
+    """Load agent profile from local or built-in agent store.
+
+    The returned profile is shared between callers and must not be modified.
+    """
+    try:
+        agent = read_agent_content(agent_name)
+        if agent is None:
+            raise FileNotFoundError(f"Agent profile not found: {agent_name}")
+        return _parse_agent_profile(agent)
 
     except Exception as e:
         raise RuntimeError(f"Failed to load agent profile '{agent_name}': {e}")
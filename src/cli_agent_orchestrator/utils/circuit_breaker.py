@@ -0,0 +1,55 @@
+"""Circuit breaker for outbound calls to user-configured hosts."""
+
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """CLOSED → OPEN after fail_max consecutive failures → HALF_OPEN after reset_timeout.
+
+    While OPEN, calls fail fast with CircuitOpenError. Once reset_timeout has
+    passed a single trial call is let through: success closes the circuit,
+    failure opens it again for another reset_timeout.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def before_call(self) -> None:
+        """Admit or reject a call; raises CircuitOpenError when rejected."""
+        if self.state == CircuitState.CLOSED:
+            return
+        now = time.monotonic()
+        # Also re-admits a trial if the previous one never reported back
+        if now - self._opened_at >= self.reset_timeout:
+            self.state = CircuitState.HALF_OPEN
+            self._opened_at = now
+            return
+        # OPEN and still cooling down, or HALF_OPEN with the trial call in flight
+        raise CircuitOpenError("Circuit is open")
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == CircuitState.HALF_OPEN or self._failures >= self.fail_max:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -86,15 +86,17 @@ def wait_until_terminal_status(
 ) -> bool:
     """Wait until terminal reaches target status using API endpoint."""
     start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            response = httpx.get(f"{API_BASE_URL}/terminals/{terminal_id}", timeout=10.0)
-            logger.info(response)
-            if response.status_code == 200:
-                terminal_data = response.json()
-                if terminal_data["status"] == target_status.value:
-                    return True
-        except Exception:
-            pass
-        time.sleep(polling_interval)
+    # One client for the whole wait so polls reuse a keep-alive connection
+    with httpx.Client(timeout=10.0) as client:
+        while time.time() - start_time < timeout:
+            try:
+                response = client.get(f"{API_BASE_URL}/terminals/{terminal_id}")
+                logger.info(response)
+                if response.status_code == 200:
+                    terminal_data = response.json()
+                    if terminal_data["status"] == target_status.value:
+                        return True
+            except Exception:
+                pass
+            time.sleep(polling_interval)
     return False
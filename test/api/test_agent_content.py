@@ -0,0 +1,62 @@
+"""Tests for the GET /agents/{agent_name}/content endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cli_agent_orchestrator.api.main import app
+from cli_agent_orchestrator.utils import agent_profiles
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a test client with an empty local agent store."""
+    with patch.object(agent_profiles, "LOCAL_AGENT_STORE_DIR", tmp_path):
+        yield TestClient(app)
+
+
+class TestAgentContentCaching:
+    """Test conditional GET support on agent content."""
+
+    def test_builtin_returns_etag(self, client):
+        """Test that built-in profiles carry a strong ETag and no Last-Modified."""
+        response = client.get("/agents/developer/content")
+
+        assert response.status_code == 200
+        assert "name: developer" in response.json()["content"]
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" not in response.headers
+
+    def test_if_none_match_returns_304(self, client):
+        """Test that a matching If-None-Match short-circuits the body."""
+        etag = client.get("/agents/developer/content").headers["etag"]
+
+        response = client.get("/agents/developer/content", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_local_profile_if_modified_since(self, client, tmp_path):
+        """Test Last-Modified validation for local profiles."""
+        (tmp_path / "custom.md").write_text("custom")
+        first = client.get("/agents/custom/content")
+        assert first.headers["etag"].startswith('W/"')
+
+        response = client.get(
+            "/agents/custom/content",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+
+        assert response.status_code == 304
+
+    def test_stale_etag_returns_content(self, client):
+        """Test that a non-matching ETag returns the full body."""
+        response = client.get("/agents/developer/content", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert "content" in response.json()
+
+    def test_unknown_agent_returns_404(self, client):
+        """Test missing agents."""
+        assert client.get("/agents/nope/content").status_code == 404
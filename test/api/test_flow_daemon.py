@@ -0,0 +1,99 @@
+"""Tests for the flow daemon scheduling loop."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli_agent_orchestrator.api.main import flow_daemon
+
+
+class TestFlowDaemon:
+    """Test cases for flow_daemon wakeups."""
+
+    @pytest.mark.asyncio
+    async def test_wakeup_event_triggers_recheck(self):
+        """Test that setting the wakeup event re-runs the schedule check early."""
+        wakeup = asyncio.Event()
+        with (
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_flows_to_run", return_value=[]
+            ) as mock_get,
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_next_run_time", return_value=None
+            ),
+        ):
+            task = asyncio.create_task(flow_daemon(wakeup))
+            await asyncio.sleep(0.05)
+            assert mock_get.call_count == 1
+
+            wakeup.set()
+            await asyncio.sleep(0.05)
+            assert mock_get.call_count == 2
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_sleeps_until_next_scheduled_run(self):
+        """Test that the daemon wakes when the next flow is due instead of after 60s."""
+        wakeup = asyncio.Event()
+        next_run = datetime.now() + timedelta(seconds=0.1)
+        with (
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_flows_to_run", return_value=[]
+            ) as mock_get,
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_next_run_time",
+                return_value=next_run,
+            ),
+        ):
+            task = asyncio.create_task(flow_daemon(wakeup))
+            await asyncio.sleep(0.3)
+            assert mock_get.call_count >= 2
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_due_flows_run_concurrently(self):
+        """Test that due flows execute in parallel worker threads."""
+        wakeup = asyncio.Event()
+        flows = [MagicMock(), MagicMock()]
+        flows[0].name, flows[1].name = "first", "second"
+        both_running = threading.Barrier(2, timeout=2)
+
+        def execute_flow(name):
+            # Only returns if the other flow is running at the same time
+            both_running.wait()
+            return True
+
+        with (
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_flows_to_run",
+                side_effect=[flows, []],
+            ),
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.get_next_run_time", return_value=None
+            ),
+            patch(
+                "cli_agent_orchestrator.api.main.flow_service.execute_flow",
+                side_effect=execute_flow,
+            ) as mock_execute,
+        ):
+            task = asyncio.create_task(flow_daemon(wakeup))
+            await asyncio.sleep(0.2)
+
+            assert sorted(call.args[0] for call in mock_execute.call_args_list) == [
+                "first",
+                "second",
+            ]
+            assert not both_running.broken
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
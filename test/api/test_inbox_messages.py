@@ -1,9 +1,11 @@
-"""Tests for the new inbox messages GET endpoint."""
+"""Tests for the inbox messages endpoints."""
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -209,6 +211,59 @@ class TestGetInboxMessagesEndpoint:
                     assert msg_data["status"] == status_value
 
 
+class TestCreateInboxMessageEndpoint:
+    """Test cases for POST /terminals/{receiver_id}/inbox/messages endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_delivered_with_single_drain(self, sample_inbox_messages):
+        """Test that several messages in quick succession trigger one delivery attempt."""
+        with patch(
+            "cli_agent_orchestrator.api.main.create_inbox_messages_bulk",
+            side_effect=lambda rows: [sample_inbox_messages[0]] * len(rows),
+        ), patch(
+            "cli_agent_orchestrator.api.main.inbox_service.check_and_send_pending_messages"
+        ) as mock_check:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                for i in range(3):
+                    response = await ac.post(
+                        "/terminals/abcdef12/inbox/messages",
+                        params={"sender_id": "sender1", "message": f"msg {i}"},
+                    )
+                    assert response.status_code == 202
+                    assert response.json()["message_id"] == 1
+
+                await asyncio.sleep(0.2)
+
+            mock_check.assert_called_once_with("abcdef12")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_messages_share_one_insert(self, sample_inbox_messages):
+        """Test that concurrent POSTs are inserted in a single batch."""
+        with patch(
+            "cli_agent_orchestrator.api.main.create_inbox_messages_bulk",
+            side_effect=lambda rows: sample_inbox_messages[: len(rows)],
+        ) as mock_bulk, patch(
+            "cli_agent_orchestrator.api.main.inbox_service.check_and_send_pending_messages"
+        ):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+                responses = await asyncio.gather(
+                    *(
+                        ac.post(
+                            "/terminals/abcdef12/inbox/messages",
+                            params={"sender_id": "sender1", "message": f"msg {i}"},
+                        )
+                        for i in range(3)
+                    )
+                )
+
+            assert [r.json()["message_id"] for r in responses] == [1, 2, 3]
+            mock_bulk.assert_called_once_with(
+                [("sender1", "abcdef12", f"msg {i}") for i in range(3)]
+            )
+
+
 class TestDatabaseFunctionCompatibility:
     """Test compatibility with enhanced database functions."""
 
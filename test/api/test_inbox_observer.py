@@ -0,0 +1,36 @@
+"""Tests for inbox watcher observer selection."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from watchdog.observers.polling import PollingObserver
+
+from cli_agent_orchestrator.api.main import _create_inbox_observer, _get_mount_fs_type
+
+PROC_MOUNTS = """\
+/dev/sda1 / ext4 rw,relatime 0 0
+server:/export /mnt/nfs nfs4 rw,relatime 0 0
+"""
+
+
+class TestInboxObserver:
+    """Test cases for choosing native vs polling observers."""
+
+    def test_get_mount_fs_type_longest_prefix(self):
+        """Test that the most specific mount point wins."""
+        with patch.object(Path, "read_text", return_value=PROC_MOUNTS):
+            assert _get_mount_fs_type(Path("/mnt/nfs/logs")) == "nfs4"
+            assert _get_mount_fs_type(Path("/home/user/logs")) == "ext4"
+
+    def test_local_filesystem_uses_native_observer(self):
+        """Test that local mounts get the native observer."""
+        with patch("cli_agent_orchestrator.api.main._get_mount_fs_type", return_value="ext4"):
+            observer = _create_inbox_observer(Path("/tmp"))
+        assert not isinstance(observer, PollingObserver)
+
+    def test_remote_filesystem_falls_back_to_polling(self):
+        """Test that remote mounts fall back to PollingObserver."""
+        with patch("cli_agent_orchestrator.api.main._get_mount_fs_type", return_value="nfs"):
+            observer = _create_inbox_observer(Path("/mnt/nfs"))
+        assert isinstance(observer, PollingObserver)
+        assert observer.timeout == 30
@@ -0,0 +1,194 @@
+"""Tests for the POST /agents/install endpoint."""
+
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from cli_agent_orchestrator.api import main
+from cli_agent_orchestrator.api.main import app
+from cli_agent_orchestrator.utils import agent_profiles
+
+AGENT_MARKDOWN = """---
+name: tester
+description: Test agent
+---
+
+You are a test agent.
+"""
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    """Redirect every install destination into a temporary directory."""
+    paths = {
+        "LOCAL_AGENT_STORE_DIR": tmp_path / "agent-store",
+        "AGENT_CONTEXT_DIR": tmp_path / "agent-context",
+        "Q_AGENTS_DIR": tmp_path / "q-agents",
+        "KIRO_AGENTS_DIR": tmp_path / "kiro-agents",
+    }
+    with (
+        patch.multiple(main, **paths),
+        patch.object(agent_profiles, "LOCAL_AGENT_STORE_DIR", paths["LOCAL_AGENT_STORE_DIR"]),
+    ):
+        yield paths
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+class TestInstallAgentEndpoint:
+    """Test cases for POST /agents/install."""
+
+    def test_install_from_content_for_q_cli(self, client, dirs):
+        """Test installing inline markdown writes profile, context and agent JSON."""
+        response = client.post(
+            "/agents/install",
+            json={
+                "source_type": "content",
+                "name": "tester",
+                "content": AGENT_MARKDOWN,
+                "provider": "q_cli",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["agent_name"] == "tester"
+
+        assert (dirs["LOCAL_AGENT_STORE_DIR"] / "tester.md").read_text() == AGENT_MARKDOWN
+        context_file = dirs["AGENT_CONTEXT_DIR"] / "tester.md"
+        assert context_file.read_text() == AGENT_MARKDOWN
+
+        # The context file shares the local profile's inode instead of a second copy
+        assert context_file.samefile(dirs["LOCAL_AGENT_STORE_DIR"] / "tester.md")
+
+        agent_json = json.loads((dirs["Q_AGENTS_DIR"] / "tester.json").read_text())
+        assert agent_json["name"] == "tester"
+        assert agent_json["resources"] == [f"file://{context_file.absolute()}"]
+
+    def test_install_from_file_for_kiro_cli(self, client, dirs, tmp_path):
+        """Test installing from a local .md file."""
+        source = tmp_path / "tester.md"
+        source.write_text(AGENT_MARKDOWN)
+
+        response = client.post(
+            "/agents/install",
+            json={"source_type": "file", "path": str(source), "provider": "kiro_cli"},
+        )
+
+        assert response.status_code == 200
+        assert (dirs["KIRO_AGENTS_DIR"] / "tester.json").exists()
+        assert (dirs["AGENT_CONTEXT_DIR"] / "tester.md").read_text() == AGENT_MARKDOWN
+
+    def test_reinstall_leaves_unchanged_config_alone(self, client, dirs):
+        """Test that reinstalling an identical agent does not rewrite its JSON config."""
+        body = {
+            "source_type": "content",
+            "name": "tester",
+            "content": AGENT_MARKDOWN,
+            "provider": "q_cli",
+        }
+        assert client.post("/agents/install", json=body).status_code == 200
+        agent_file = dirs["Q_AGENTS_DIR"] / "tester.json"
+        first_write = agent_file.stat().st_mtime_ns
+        os.utime(agent_file, ns=(first_write - 10**9, first_write - 10**9))
+
+        assert client.post("/agents/install", json=body).status_code == 200
+        assert agent_file.stat().st_mtime_ns == first_write - 10**9
+
+        changed = {**body, "content": AGENT_MARKDOWN.replace("Test agent", "Changed")}
+        assert client.post("/agents/install", json=changed).status_code == 200
+        assert json.loads(agent_file.read_text())["description"] == "Changed"
+
+    def test_install_from_url_streams_to_store(self, client, dirs):
+        """Test that a URL profile is downloaded into the local agent store."""
+        app.state.http = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=AGENT_MARKDOWN))
+        )
+        try:
+            response = client.post(
+                "/agents/install",
+                json={
+                    "source_type": "url",
+                    "path": "https://example.com/agents/tester.md",
+                    "provider": "claude_code",
+                },
+            )
+        finally:
+            del app.state.http
+
+        assert response.status_code == 200
+        store = dirs["LOCAL_AGENT_STORE_DIR"]
+        assert (store / "tester.md").read_text() == AGENT_MARKDOWN
+        assert not (store / "tester.md.part").exists()
+
+    def test_install_from_url_rejects_oversized_download(self, client, dirs):
+        """Test that a download over the size limit is rejected and nothing is kept."""
+        app.state.http = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=AGENT_MARKDOWN))
+        )
+        try:
+            with patch.object(main, "AGENT_DOWNLOAD_MAX_BYTES", 16):
+                response = client.post(
+                    "/agents/install",
+                    json={
+                        "source_type": "url",
+                        "path": "https://example.com/agents/tester.md",
+                        "provider": "claude_code",
+                    },
+                )
+        finally:
+            del app.state.http
+
+        assert response.status_code == 400
+        assert "exceeds 16 bytes" in response.json()["detail"]
+        assert list(dirs["LOCAL_AGENT_STORE_DIR"].iterdir()) == []
+
+    def test_install_built_in(self, client, dirs):
+        """Test installing a built-in agent copies its markdown."""
+        response = client.post(
+            "/agents/install",
+            json={"source_type": "built-in", "name": "developer", "provider": "claude_code"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["file"] is None
+        assert "name: developer" in (dirs["AGENT_CONTEXT_DIR"] / "developer.md").read_text()
+
+    def test_built_in_does_not_overwrite_linked_local_profile(self, client, dirs, tmp_path):
+        """Test that a built-in install replaces, not writes through, a linked context file."""
+        local_markdown = AGENT_MARKDOWN.replace("name: tester", "name: developer")
+        source = tmp_path / "foo.md"
+        source.write_text(local_markdown)
+        client.post(
+            "/agents/install",
+            json={"source_type": "file", "path": str(source), "provider": "claude_code"},
+        )
+        context_file = dirs["AGENT_CONTEXT_DIR"] / "developer.md"
+        assert context_file.samefile(dirs["LOCAL_AGENT_STORE_DIR"] / "foo.md")
+
+        response = client.post(
+            "/agents/install",
+            json={"source_type": "built-in", "name": "developer", "provider": "claude_code"},
+        )
+
+        assert response.status_code == 200
+        assert (dirs["LOCAL_AGENT_STORE_DIR"] / "foo.md").read_text() == local_markdown
+        assert context_file.read_text() != local_markdown
+
+    def test_invalid_source_type(self, client, dirs):
+        """Test that unknown source types are rejected."""
+        response = client.post(
+            "/agents/install",
+            json={"source_type": "ftp", "name": "tester", "provider": "q_cli"},
+        )
+
+        assert response.status_code == 400
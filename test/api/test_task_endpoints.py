@@ -0,0 +1,153 @@
+"""Tests for the task management endpoints."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from cli_agent_orchestrator.api import task_endpoints
+from cli_agent_orchestrator.api.main import app
+from cli_agent_orchestrator.clients import database
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a test client backed by a fresh SQLite database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    database.Base.metadata.create_all(bind=engine)
+    task_endpoints._read_cache.clear()
+    with patch.object(database, "SessionLocal", sessionmaker(bind=engine)):
+        yield TestClient(app)
+    engine.dispose()
+
+
+def create_task(client, **overrides):
+    body = {"title": "Write tests", "description": "Cover the API", "task_type": "TEST"}
+    response = client.post("/tasks", json={**body, **overrides})
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestTaskEndpoints:
+    """Test cases for /tasks and /assignments."""
+
+    def test_create_list_and_get_task(self, client):
+        """Test that created tasks can be listed with filters and fetched by ID."""
+        task = create_task(client, workflow_id="wf-1")
+        create_task(client, task_type="CODE")
+
+        assert [t["id"] for t in client.get("/tasks?workflow_id=wf-1").json()] == [task["id"]]
+        assert len(client.get("/tasks").json()) == 2
+        assert client.get(f"/tasks/{task['id']}").json()["title"] == "Write tests"
+        assert client.get("/tasks/T-MISSING").status_code == 404
+
+    def test_assignment_lifecycle(self, client):
+        """Test assigning, starting and completing a task updates both records."""
+        task = create_task(client)
+        assignment = client.post(
+            f"/tasks/{task['id']}/assign", json={"terminal_id": "abcd1234"}
+        ).json()
+
+        started = client.put(f"/assignments/{assignment['id']}/start")
+        assert started.json()["status"] == "IN_PROGRESS"
+
+        completed = client.put(
+            f"/assignments/{assignment['id']}/complete", json={"result": {"ok": True}}
+        )
+        assert completed.json()["status"] == "COMPLETED"
+        assert completed.json()["result_data"] == {"ok": True}
+        assert client.get(f"/tasks/{task['id']}").json()["status"] == "COMPLETED"
+        assert client.get("/terminals/abcd1234/task").json()["id"] == task["id"]
+
+    def test_task_cannot_be_assigned_twice(self, client):
+        """Test that a second assignment fails even if it raced past the status check."""
+        task = create_task(client)
+        pending = task_endpoints.task_service.get_task(task["id"])
+        assert (
+            client.post(f"/tasks/{task['id']}/assign", json={"terminal_id": "abcd1234"}).status_code
+            == 201
+        )
+
+        # Simulate a concurrent request that read the task before it was assigned
+        with patch.object(task_endpoints.task_service, "get_task", return_value=pending):
+            response = client.post(f"/tasks/{task['id']}/assign", json={"terminal_id": "efgh5678"})
+        assert response.status_code == 400
+        assignments = database.get_task_assignments(task_id=task["id"])
+        assert [a["terminal_id"] for a in assignments] == ["abcd1234"]
+
+    def test_unknown_assignment_is_not_found(self, client):
+        """Test that updating an unknown assignment returns 404."""
+        response = client.put("/assignments/999/fail", json={"error_message": "boom"})
+        assert response.status_code == 404
+
+    def test_terminal_state_roundtrip(self, client):
+        """Test that terminal state is stored and expanded back on read."""
+        body = {
+            "current_task_id": "T-1",
+            "checkpoints": [{"step": 1}, {"step": 2}],
+            "variables": {"name": "value"},
+            "context_data": {"extra": True},
+        }
+        assert client.post("/terminals/abcd1234/state", json=body).status_code == 201
+        client.post("/terminals/abcd1234/state", json={"variables": {"name": "new"}})
+
+        state = client.get("/terminals/abcd1234/state").json()
+        assert state["current_task_id"] == "T-1"
+        assert state["checkpoints"] == [{"step": 1}, {"step": 2}]
+        assert state["context_data"] == {"extra": True}
+        assert state["variables"] == {"name": "new"}
+
+        assert client.delete("/terminals/abcd1234/state").status_code == 200
+        assert client.get("/terminals/abcd1234/state").status_code == 404
+
+
+class TestTaskReadCache:
+    """Test cases for the short-lived cache in front of task reads."""
+
+    def test_reads_are_cached_until_a_write(self, client):
+        """Test that repeated reads hit the database once and writes invalidate them."""
+        task = create_task(client)
+        with patch.object(task_endpoints, "get_task", wraps=task_endpoints.get_task) as mock_get:
+            client.get(f"/tasks/{task['id']}")
+            client.get(f"/tasks/{task['id']}")
+            assert mock_get.call_count == 1
+
+            client.put(f"/tasks/{task['id']}/status", json={"status": "IN_PROGRESS"})
+            assert client.get(f"/tasks/{task['id']}").json()["status"] == "IN_PROGRESS"
+
+    def test_read_racing_a_write_is_not_cached(self, client):
+        """Test that a value read before a concurrent write finished is not stored."""
+        task = create_task(client)
+        real_get_task = task_endpoints.get_task
+
+        def read_then_write(task_id):
+            value = real_get_task(task_id)
+            # A write commits and invalidates while this read is in flight
+            task_endpoints._invalidate_read_cache()
+            return value
+
+        with patch.object(task_endpoints, "get_task", side_effect=read_then_write):
+            assert client.get(f"/tasks/{task['id']}").status_code == 200
+        assert task_endpoints._read_cache == {}
+
+    def test_expired_entry_is_served_stale_when_database_fails(self, client):
+        """Test that a failed refresh falls back to the last value with X-Cache: stale."""
+        create_task(client)
+        assert len(client.get("/tasks").json()) == 1
+
+        with (
+            patch.object(task_endpoints, "TASK_READ_CACHE_TTL", 0),
+            patch.object(
+                task_endpoints, "list_tasks", side_effect=RuntimeError("database is locked")
+            ),
+        ):
+            response = client.get("/tasks")
+            assert response.status_code == 200
+            assert response.headers["X-Cache"] == "stale"
+            assert len(response.json()) == 1
+
+            response = client.get("/tasks?task_type=CODE")
+            assert response.status_code == 500
+            assert response.json()["detail"] == "Failed to list tasks: database is locked"
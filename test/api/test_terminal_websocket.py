@@ -0,0 +1,74 @@
+"""Tests for the terminal WebSocket bridge."""
+
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from cli_agent_orchestrator.api import main
+from cli_agent_orchestrator.api.main import app
+
+_create_subprocess_exec = asyncio.create_subprocess_exec
+
+
+async def fake_attach(*args, **kwargs):
+    """Stand-in for 'tmux attach' that echoes its input back as output."""
+    return await _create_subprocess_exec("sh", "-c", "stty -echo; cat", **kwargs)
+
+
+@pytest.fixture
+def client():
+    """Create a test client attached to a fake window."""
+    with (
+        patch.object(
+            main,
+            "get_terminal_metadata",
+            return_value={"tmux_session": "cao-s", "tmux_window": "w"},
+        ),
+        patch(
+            "cli_agent_orchestrator.clients.tmux_view.asyncio.create_subprocess_exec", fake_attach
+        ),
+        patch.object(main.tmux_client, "send_control_commands"),
+    ):
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+def receive_until(ws, token):
+    output = b""
+    while token not in output:
+        output += ws.receive_bytes()
+    return output
+
+
+class TestTerminalWebSocket:
+    """Test cases for /terminals/{terminal_id}/ws."""
+
+    def test_text_and_binary_input_reach_pty(self, client):
+        """Test that JSON input messages and raw binary frames are both written to the PTY."""
+        with client.websocket_connect("/terminals/abcd1234/ws") as ws:
+            ws.send_text(orjson.dumps({"type": "input", "data": "from-json\n"}).decode())
+            assert b"from-json" in receive_until(ws, b"from-json")
+
+            ws.send_bytes("from-bytes é\n".encode())
+            assert "from-bytes é".encode() in receive_until(ws, "from-bytes é".encode())
+
+    def test_unknown_terminal_is_rejected(self, client):
+        """Test that connecting to a terminal without metadata closes the socket."""
+        with patch.object(main, "get_terminal_metadata", return_value=None):
+            with client.websocket_connect("/terminals/abcd1234/ws") as ws:
+                message = ws.receive()
+        assert message["type"] == "websocket.close"
+
+    def test_terminal_deleted_elsewhere_is_rejected_on_reconnect(self, client):
+        """Test that the window lookup is not pinned once a terminal has been seen."""
+        with client.websocket_connect("/terminals/abcd1234/ws"):
+            pass
+
+        # e.g. `cao shutdown` removed the terminal from another process
+        with patch.object(main, "get_terminal_metadata", return_value=None):
+            with client.websocket_connect("/terminals/abcd1234/ws") as ws:
+                message = ws.receive()
+        assert message["type"] == "websocket.close"
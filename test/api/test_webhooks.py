@@ -0,0 +1,320 @@
+"""Tests for the outbound webhook endpoints."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from cli_agent_orchestrator.api import main
+from cli_agent_orchestrator.api.main import app
+
+
+@pytest.fixture
+def upstream():
+    """Route the app's shared HTTP client to an in-process handler."""
+    state = {"handler": lambda request: httpx.Response(200, text="ok")}
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: state["handler"](request))
+    )
+    with patch.object(main, "WEBHOOK_RETRY_BACKOFF", 0):
+        yield state
+    del app.state.http
+    main._host_breakers.clear()
+    main._host_bulkheads.clear()
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+class TestExecuteWebhook:
+    """Test cases for POST /webhooks/execute."""
+
+    def test_forwards_payload_and_returns_response(self, client, upstream):
+        """Test that the payload is sent as-is and the upstream response is relayed."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["body"] = request.content
+            seen["content_type"] = request.headers["content-type"]
+            return httpx.Response(201, text="created")
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute",
+            json={"webhookUrl": "http://hooks.test/x", "method": "put", "payload": "hi"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status_code": 201,
+            "response_body": "created",
+            "success": True,
+            "truncated": False,
+        }
+        assert seen == {"method": "PUT", "body": b"hi", "content_type": "text/plain"}
+
+    def test_response_body_is_capped(self, client, upstream):
+        """Test that only max_body_bytes of the upstream body are returned."""
+        upstream["handler"] = lambda request: httpx.Response(
+            200, content="é".encode() * 10, headers={"content-type": "text/plain; charset=utf-8"}
+        )
+        response = client.post(
+            "/webhooks/execute",
+            json={"webhookUrl": "http://hooks.test/x", "payload": "hi", "max_body_bytes": 5},
+        )
+
+        # 5 bytes hold two whole characters; the split third one is dropped
+        assert response.json()["response_body"] == "éé"
+        assert response.json()["truncated"] is True
+
+    @pytest.mark.parametrize("body, max_body_bytes", [(b"abcde", 5), (b"", 0)])
+    def test_body_that_fits_exactly_is_not_truncated(self, client, upstream, body, max_body_bytes):
+        """Test that a body of exactly max_body_bytes is returned whole and unflagged."""
+        upstream["handler"] = lambda request: httpx.Response(200, content=body)
+        response = client.post(
+            "/webhooks/execute",
+            json={
+                "webhookUrl": "http://hooks.test/x",
+                "payload": "hi",
+                "max_body_bytes": max_body_bytes,
+            },
+        )
+
+        assert response.json()["response_body"] == body.decode()
+        assert response.json()["truncated"] is False
+
+    def test_passthrough_relays_upstream_response(self, client, upstream):
+        """Test that passthrough returns the upstream status, content type and raw body."""
+        upstream["handler"] = lambda request: httpx.Response(
+            404, content=b'{"error": "missing"}', headers={"content-type": "application/json"}
+        )
+        response = client.post(
+            "/webhooks/execute",
+            json={"webhookUrl": "http://hooks.test/x", "payload": "hi", "passthrough": True},
+        )
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"error": "missing"}
+        assert "X-Body-Truncated" not in response.headers
+
+    def test_passthrough_flags_truncated_body(self, client, upstream):
+        """Test that a passthrough body cut at max_body_bytes is flagged with a header."""
+        upstream["handler"] = lambda request: httpx.Response(
+            200, content=b'{"items": [1, 2, 3]}', headers={"content-type": "application/json"}
+        )
+        response = client.post(
+            "/webhooks/execute",
+            json={
+                "webhookUrl": "http://hooks.test/x",
+                "payload": "hi",
+                "passthrough": True,
+                "max_body_bytes": 8,
+            },
+        )
+
+        assert response.content == b'{"items"'
+        assert response.headers["X-Body-Truncated"] == "true"
+
+    def test_timeout_maps_to_504(self, client, upstream):
+        """Test that an upstream timeout is reported as a gateway timeout."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.status_code == 504
+
+    def test_transient_status_is_retried(self, client, upstream):
+        """Test that a 502 from an idempotent webhook is retried and the next response returned."""
+        statuses = [502, 200]
+        upstream["handler"] = lambda request: httpx.Response(statuses.pop(0), text="ok")
+
+        response = client.post(
+            "/webhooks/execute",
+            json={"webhookUrl": "http://hooks.test/x", "method": "put", "payload": "hi"},
+        )
+        assert response.json()["status_code"] == 200
+        assert statuses == []
+
+    def test_post_is_not_retried_once_it_may_have_run(self, client, upstream):
+        """Test that a POST is sent once on a 502 or lost response, but retried on a 503."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(502, text="bad gateway")
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.json()["status_code"] == 502
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.status_code == 504
+        assert len(calls) == 2
+
+        statuses = [503, 201]
+        upstream["handler"] = lambda request: httpx.Response(statuses.pop(0), text="ok")
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.json()["status_code"] == 201
+
+    def test_client_error_is_not_retried(self, client, upstream):
+        """Test that a 4xx other than 429 is returned after a single attempt."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, text="bad")
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.json()["status_code"] == 400
+        assert len(calls) == 1
+
+    def test_gives_up_after_retry_attempts(self, client, upstream):
+        """Test that a persistently failing webhook returns its last response."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="busy")
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.json() == {
+            "status_code": 503,
+            "response_body": "busy",
+            "success": False,
+            "truncated": False,
+        }
+        assert len(calls) == main.WEBHOOK_RETRY_ATTEMPTS
+
+    def test_deadline_bounds_retries(self, client, upstream):
+        """Test that retries stop once the end-to-end deadline has passed."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.extensions["timeout"]["read"])
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        upstream["handler"] = handler
+        # The first backoff (capped at WEBHOOK_RETRY_MAX_DELAY) outlasts the deadline
+        with (
+            patch.object(main, "WEBHOOK_DEADLINE", 0.2),
+            patch.object(main, "WEBHOOK_RETRY_BACKOFF", 10),
+            patch.object(main.random, "uniform", lambda low, high: high),
+        ):
+            response = client.post(
+                "/webhooks/execute",
+                json={"webhookUrl": "http://hooks.test/x", "method": "get", "payload": "hi"},
+            )
+
+        assert response.status_code == 504
+        assert "deadline" in response.json()["detail"]
+        # The attempt was given no more than the remaining budget
+        assert len(calls) == 1 and calls[0] <= 0.2
+
+    def test_connect_error_maps_to_503(self, client, upstream):
+        """Test that an unreachable webhook is reported as service unavailable."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        upstream["handler"] = handler
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.status_code == 503
+
+    def test_failing_host_trips_circuit(self, client, upstream):
+        """Test that repeated connection failures make later calls to the host fail fast."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.host)
+            raise httpx.ConnectError("refused", request=request)
+
+        upstream["handler"] = handler
+        for _ in range(main.WEBHOOK_BREAKER_FAIL_MAX):
+            client.post(
+                "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+            )
+
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://hooks.test/x", "payload": "hi"}
+        )
+        assert response.status_code == 503
+        assert "Circuit open" in response.json()["detail"]
+        assert len(calls) == main.WEBHOOK_BREAKER_FAIL_MAX
+
+        # Other hosts are unaffected
+        upstream["handler"] = lambda request: httpx.Response(200, text="ok")
+        response = client.post(
+            "/webhooks/execute", json={"webhookUrl": "http://other.test/x", "payload": "hi"}
+        )
+        assert response.status_code == 200
+
+
+class TestOptimizePrompt:
+    """Test cases for POST /prompt/optimize."""
+
+    def test_returns_optimized_prompt(self, client, upstream):
+        """Test that the optimized prompt is read from the n8n response."""
+        upstream["handler"] = lambda request: httpx.Response(
+            200, json=[{"optimized_prompt": "better"}]
+        )
+        response = client.post(
+            "/prompt/optimize", json={"prompt": "draft", "webhook_url": "http://n8n.test/x"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"optimized_prompt": "better", "original_prompt": "draft"}
+
+    @pytest.mark.parametrize(
+        "n8n_response, expected",
+        [
+            ({"body": {"prompt": "echoed"}}, "echoed"),
+            ({"body": "not a dict"}, "draft"),
+            ([], "draft"),
+        ],
+    )
+    def test_fallback_response_shapes(self, client, upstream, n8n_response, expected):
+        """Test the echoed-body shape and falling back to the original prompt."""
+        upstream["handler"] = lambda request: httpx.Response(200, json=n8n_response)
+        response = client.post(
+            "/prompt/optimize", json={"prompt": "draft", "webhook_url": "http://n8n.test/x"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["optimized_prompt"] == expected
+
+    def test_upstream_error_message_is_reported(self, client, upstream):
+        """Test that n8n's error message and hint are surfaced."""
+        upstream["handler"] = lambda request: httpx.Response(
+            404, json={"message": "Unknown webhook", "hint": "Activate the workflow"}
+        )
+        response = client.post(
+            "/prompt/optimize", json={"prompt": "draft", "webhook_url": "http://n8n.test/x"}
+        )
+
+        assert response.status_code == 500
+        assert "Unknown webhook - Activate the workflow" in response.json()["detail"]
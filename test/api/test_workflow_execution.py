@@ -0,0 +1,116 @@
+"""Tests for the session workflow execution endpoints."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cli_agent_orchestrator.api.main import app
+from cli_agent_orchestrator.services import workflow_execution_service
+
+WORKFLOW = {
+    "nodes": [
+        {
+            "id": "node-1",
+            "data": {
+                "type": "agent_spawn",
+                "config": {"agentProfile": "developer", "provider": "q_cli"},
+            },
+        }
+    ]
+}
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def execution_state():
+    """Assign a workflow to session 'cao-s' with node-1 as the running node."""
+    state = workflow_execution_service.create_execution_state("cao-s", "wf-1")
+    state.current_node_id = "node-1"
+    state.node_states["node-1"] = {"status": "running"}
+    yield state
+    workflow_execution_service.cleanup_execution_state("cao-s")
+
+
+class TestStartWorkflowExecution:
+    """Test cases for POST /sessions/{session_name}/workflow/start."""
+
+    def test_spawns_agents_and_records_terminals(self, client, execution_state):
+        """Test that each node's terminal is created and tracked in the execution state."""
+        with patch(
+            "cli_agent_orchestrator.api.main.terminal_service.create_terminal"
+        ) as mock_create:
+            mock_create.return_value = MagicMock(id="abcd1234")
+            response = client.post("/sessions/cao-s/workflow/start", json=WORKFLOW)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "status": "running",
+            "spawned_agents": [
+                {"node_id": "node-1", "terminal_id": "abcd1234", "agent_profile": "developer"}
+            ],
+        }
+        mock_create.assert_called_once_with(
+            provider="q_cli", agent_profile="developer", session_name="cao-s", new_session=False
+        )
+        assert execution_state.spawned_terminals == {"node-1": "abcd1234"}
+
+    def test_create_failure_returns_500(self, client, execution_state):
+        """Test that a terminal creation error is reported."""
+        with patch(
+            "cli_agent_orchestrator.api.main.terminal_service.create_terminal",
+            side_effect=ValueError("Session 'cao-s' not found"),
+        ):
+            response = client.post("/sessions/cao-s/workflow/start", json=WORKFLOW)
+
+        assert response.status_code == 500
+        assert "Session 'cao-s' not found" in response.json()["detail"]
+        assert execution_state.spawned_terminals == {}
+
+    def test_unassigned_session_returns_404(self, client):
+        """Test starting a workflow on a session without one."""
+        response = client.post("/sessions/cao-none/workflow/start", json=WORKFLOW)
+        assert response.status_code == 404
+
+
+class TestWorkflowExecutionState:
+    """Test cases for GET /sessions/{session_name}/workflow/state."""
+
+    def test_returns_state(self, client, execution_state):
+        """Test that the current execution state is returned."""
+        response = client.get("/sessions/cao-s/workflow/state")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "workflow_id": "wf-1",
+            "session_name": "cao-s",
+            "status": "idle",
+            "current_node_id": "node-1",
+            "node_states": {"node-1": {"status": "running"}},
+            "spawned_terminals": {},
+        }
+
+    def test_unassigned_session_returns_404(self, client):
+        """Test reading the state of a session without a workflow."""
+        assert client.get("/sessions/cao-none/workflow/state").status_code == 404
+
+    def test_unchanged_state_returns_304(self, client, execution_state):
+        """Test that a poller with the current ETag gets 304 until the state changes."""
+        etag = client.get("/sessions/cao-s/workflow/state").headers["etag"]
+
+        response = client.get("/sessions/cao-s/workflow/state", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        workflow_execution_service.update_node_state(
+            "cao-s", "node-1", workflow_execution_service.NodeExecutionStatus.COMPLETED
+        )
+        response = client.get("/sessions/cao-s/workflow/state", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["node_states"]["node-1"]["status"] == "completed"
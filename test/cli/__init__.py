@@ -0,0 +1 @@
+"""CLI tests for CLI Agent Orchestrator."""
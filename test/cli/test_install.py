@@ -0,0 +1,55 @@
+"""Tests for the cao install command."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli_agent_orchestrator.cli.commands import install as install_module
+from cli_agent_orchestrator.cli.commands.install import install
+from cli_agent_orchestrator.utils import agent_profiles
+
+LOCAL_MARKDOWN = """---
+name: developer
+description: Local developer agent
+---
+
+You are a local agent.
+"""
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    """Redirect every install destination into a temporary directory."""
+    paths = {
+        "LOCAL_AGENT_STORE_DIR": tmp_path / "agent-store",
+        "AGENT_CONTEXT_DIR": tmp_path / "agent-context",
+        "Q_AGENTS_DIR": tmp_path / "q-agents",
+        "KIRO_AGENTS_DIR": tmp_path / "kiro-agents",
+    }
+    with (
+        patch.multiple(install_module, **paths),
+        patch.object(agent_profiles, "LOCAL_AGENT_STORE_DIR", paths["LOCAL_AGENT_STORE_DIR"]),
+    ):
+        yield paths
+
+
+class TestInstallCommand:
+    """Test cases for cao install."""
+
+    def test_built_in_does_not_overwrite_linked_local_profile(self, dirs):
+        """Test that installing a built-in replaces, not writes through, a linked context file."""
+        # Leave the context file hardlinked to a local profile, as an API install does
+        store_file = dirs["LOCAL_AGENT_STORE_DIR"] / "foo.md"
+        store_file.parent.mkdir(parents=True)
+        store_file.write_text(LOCAL_MARKDOWN)
+        context_file = dirs["AGENT_CONTEXT_DIR"] / "developer.md"
+        context_file.parent.mkdir(parents=True)
+        os.link(store_file, context_file)
+
+        result = CliRunner().invoke(install, ["developer", "--provider", "claude_code"])
+
+        assert "installed successfully" in result.output
+        assert store_file.read_text() == LOCAL_MARKDOWN
+        assert context_file.read_text() != LOCAL_MARKDOWN
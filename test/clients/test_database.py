@@ -0,0 +1,356 @@
+"""Tests for database connection setup."""
+
+import sqlite3
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from cli_agent_orchestrator.clients import database
+from cli_agent_orchestrator.clients.database import _set_sqlite_pragmas, engine, init_db
+from cli_agent_orchestrator.constants import DATABASE_POOL_OVERFLOW, DATABASE_POOL_SIZE
+from cli_agent_orchestrator.models.inbox import MessageStatus
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Point the database helpers at a fresh SQLite file."""
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    event.listen(test_engine, "connect", _set_sqlite_pragmas)
+    database.Base.metadata.create_all(bind=test_engine)
+    database._lookup_cache.clear()
+    with patch.object(database, "SessionLocal", sessionmaker(autoflush=False, bind=test_engine)):
+        yield test_engine
+    database._lookup_cache.clear()
+    test_engine.dispose()
+
+
+def make_nodes(*ids):
+    return [{"id": node_id, "data": "{}"} for node_id in ids]
+
+
+class TestEngine:
+    """Test cases for the SQLite engine and its connections."""
+
+    def test_connection_uses_wal(self, tmp_path):
+        """Test that new connections switch the database to WAL with relaxed sync."""
+        connection = sqlite3.connect(tmp_path / "test.db")
+        try:
+            _set_sqlite_pragmas(connection, None)
+
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # 1 == NORMAL
+            assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+            assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            connection.close()
+
+    def test_pool_covers_worker_threads(self):
+        """Test that the pool can serve every default asyncio.to_thread worker at once."""
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == DATABASE_POOL_SIZE
+        assert DATABASE_POOL_SIZE + DATABASE_POOL_OVERFLOW >= 32
+
+
+class TestInitDb:
+    """Test cases for init_db."""
+
+    def test_adds_indexes_to_existing_tables(self, tmp_path):
+        """Test that indexes declared on a model are created for a table that predates them."""
+        test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+        with test_engine.begin() as conn:
+            database.TaskModel.__table__.create(conn)
+            for index in database.TaskModel.__table__.indexes:
+                index.drop(conn)
+
+        with patch.object(database, "engine", test_engine):
+            init_db()
+            init_db()
+
+        names = {index["name"] for index in inspect(test_engine).get_indexes("tasks")}
+        assert {"ix_tasks_workflow_status", "ix_tasks_status", "ix_tasks_task_type"} <= names
+        test_engine.dispose()
+
+    def test_adds_workflow_foreign_keys_to_existing_tables(self, tmp_path):
+        """Test that node tables created without a foreign key are rebuilt with one."""
+        test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+        with test_engine.begin() as conn:
+            database.WorkflowModel.__table__.create(conn)
+            conn.exec_driver_sql(
+                "CREATE TABLE workflow_nodes (id VARCHAR PRIMARY KEY, "
+                "workflow_id VARCHAR NOT NULL, node_data VARCHAR NOT NULL, "
+                "position_x INTEGER NOT NULL, position_y INTEGER NOT NULL)"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO workflows (id, name, config) VALUES ('wf-1', 'One', '{}')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO workflow_nodes VALUES "
+                "('a', 'wf-1', '{}', 0, 0), ('b', 'gone', '{}', 0, 0)"
+            )
+
+        with patch.object(database, "engine", test_engine):
+            init_db()
+            init_db()
+
+        inspector = inspect(test_engine)
+        assert inspector.get_foreign_keys("workflow_nodes")[0]["referred_table"] == "workflows"
+        assert "ix_workflow_nodes_workflow" in {
+            index["name"] for index in inspector.get_indexes("workflow_nodes")
+        }
+        with test_engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT id FROM workflow_nodes").scalars().all() == ["a"]
+        test_engine.dispose()
+
+    def test_inbox_lookup_uses_index(self, db):
+        """Test that the pending-message lookup seeks the composite inbox index."""
+        with db.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT * FROM inbox WHERE receiver_id = 'r' "
+                "AND status = 'pending' ORDER BY created_at LIMIT 1"
+            ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_inbox_receiver_status_created" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestWorkflows:
+    """Test cases for the workflow helpers."""
+
+    def test_list_workflows_counts_nodes(self, db):
+        """Test that node counts are reported per workflow, including empty ones."""
+        database.create_workflow("wf-1", "One", None, "{}", make_nodes("a", "b"), [])
+        database.create_workflow("wf-2", "Two", None, "{}", [], [])
+
+        counts = {w["id"]: w["node_count"] for w in database.list_workflows()}
+        assert counts == {"wf-1": 2, "wf-2": 0}
+
+    def test_create_and_update_replace_nodes_and_edges(self, db):
+        """Test that nodes and edges are stored on create and replaced wholesale on update."""
+        edge = {"id": "e1", "source": "a", "target": "b", "data": "{}"}
+        database.create_workflow("wf-1", "One", None, "{}", make_nodes("a", "b"), [edge])
+
+        workflow = database.get_workflow("wf-1")
+        assert [n["id"] for n in workflow["nodes"]] == ["a", "b"]
+        assert workflow["edges"][0]["target"] == "b"
+
+        assert database.update_workflow("wf-1", nodes=make_nodes("c"), edges=[])
+        workflow = database.get_workflow("wf-1")
+        assert [n["id"] for n in workflow["nodes"]] == ["c"]
+        assert workflow["edges"] == []
+        assert workflow["version"] == 2
+
+    def test_delete_workflow_cascades(self, db):
+        """Test that deleting a workflow removes its nodes, edges and session assignments."""
+        edge = {"id": "e1", "source": "a", "target": "b"}
+        database.create_workflow("wf-1", "One", None, "{}", make_nodes("a", "b"), [edge])
+        database.create_workflow("wf-2", "Two", None, "{}", make_nodes("c"), [])
+        database.assign_workflow_to_session("cao-a", "wf-1")
+
+        assert database.delete_workflow("wf-1")
+        assert not database.delete_workflow("wf-1")
+        with db.connect() as conn:
+            assert conn.exec_driver_sql("SELECT id FROM workflow_nodes").scalars().all() == ["c"]
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM workflow_edges").scalar() == 0
+        assert database.get_session_workflow("cao-a") is None
+
+    def test_get_workflow_reads_all_parts(self, db):
+        """Test that the workflow, its nodes and its edges come back with their own types."""
+        nodes = [{"id": "a", "data": '{"x": 1}', "position_x": 10, "position_y": 20}]
+        edge = {"id": "e1", "source": "a", "target": "a", "data": '{"k": 2}'}
+        database.create_workflow("wf-1", "One", "desc", '{"c": 3}', nodes, [edge])
+
+        workflow = database.get_workflow("wf-1")
+        assert workflow["name"] == "One"
+        assert workflow["description"] == "desc"
+        assert workflow["config"] == '{"c": 3}'
+        assert isinstance(workflow["created_at"], datetime)
+        assert workflow["version"] == 1
+        assert workflow["nodes"] == [
+            {"id": "a", "data": '{"x": 1}', "position_x": 10, "position_y": 20}
+        ]
+        assert workflow["edges"] == [{"id": "e1", "source": "a", "target": "a", "data": '{"k": 2}'}]
+        assert database.get_workflow("missing") is None
+
+
+class TestSingleStatementUpdates:
+    """Test cases for helpers that update a row without loading it."""
+
+    def test_update_last_active(self, db):
+        """Test that last_active is bumped and a missing terminal reports False."""
+        database.create_terminal("abcdef12", "cao-s", "w", "q_cli")
+        before = database.get_terminal_metadata("abcdef12")["last_active"]
+
+        assert database.update_last_active("abcdef12")
+        assert database.get_terminal_metadata("abcdef12")["last_active"] >= before
+        assert not database.update_last_active("missing")
+
+    def test_update_flow_enabled_keeps_next_run_when_omitted(self, db):
+        """Test that next_run is only overwritten when a value is given."""
+        next_run = datetime(2030, 1, 1)
+        database.create_flow("f", "/tmp/f.md", "* * * * *", "developer", "q_cli", "", next_run)
+
+        assert database.update_flow_enabled("f", False)
+        flow = database.get_flow("f")
+        assert flow.enabled is False
+        assert flow.next_run == next_run
+        assert not database.update_flow_enabled("missing", True)
+
+
+class TestLookups:
+    """Test cases for single-row lookups."""
+
+    def test_cached_lookups_bind_each_call(self, db):
+        """Test that point lookups built from cached statements use the id of each call."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        database.create_terminal("bbbbbbbb", "cao-b", "w", "q_cli")
+
+        assert database.get_terminal_metadata("aaaaaaaa")["tmux_session"] == "cao-a"
+        assert database.get_terminal_metadata("bbbbbbbb")["tmux_session"] == "cao-b"
+        assert database.get_terminal_metadata("missing") is None
+
+    def test_list_terminals_by_session(self, db):
+        """Test that only the session's terminals are listed, as plain dicts."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w1", "q_cli", "developer")
+        database.create_terminal("bbbbbbbb", "cao-b", "w2", "q_cli")
+
+        terminals = database.list_terminals_by_session("cao-a")
+        assert len(terminals) == 1
+        assert terminals[0]["id"] == "aaaaaaaa"
+        assert terminals[0]["agent_profile"] == "developer"
+        assert set(terminals[0]) == {
+            "id",
+            "tmux_session",
+            "tmux_window",
+            "provider",
+            "agent_profile",
+            "last_active",
+        }
+
+    def test_get_session_workflow(self, db):
+        """Test that the assigned workflow id is returned, or None when unassigned."""
+        database.assign_workflow_to_session("cao-a", "wf-1")
+
+        assert database.get_session_workflow("cao-a") == "wf-1"
+        assert database.get_session_workflow("cao-b") is None
+
+    def test_to_dict_uses_attribute_names(self, db):
+        """Test that models convert to dicts keyed by their mapped attribute names."""
+        database.create_task("T-001", "Title", "Spec", "CODE", task_metadata='{"k": 1}')
+
+        task = database.get_task("T-001")
+        assert task["task_metadata"] == '{"k": 1}'
+        assert set(task) == {column.key for column in database.TaskModel.__table__.columns}
+
+
+class TestLookupCache:
+    """Test cases for the in-process lookup cache."""
+
+    def test_terminal_metadata_is_served_from_cache(self, db):
+        """Test that a repeat lookup skips the database and returns an independent copy."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        first = database.get_terminal_metadata("aaaaaaaa")
+        first["provider"] = "mutated"
+
+        with patch.object(database, "SessionLocal") as mock_session:
+            second = database.get_terminal_metadata("aaaaaaaa")
+        mock_session.assert_not_called()
+        assert second["provider"] == "q_cli"
+
+    def test_update_last_active_refreshes_cached_terminal(self, db):
+        """Test that bumping last_active is reflected without another query."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        before = database.get_terminal_metadata("aaaaaaaa")["last_active"]
+        database.update_last_active("aaaaaaaa")
+
+        with patch.object(database, "SessionLocal") as mock_session:
+            after = database.get_terminal_metadata("aaaaaaaa")["last_active"]
+        mock_session.assert_not_called()
+        assert after > before
+
+    def test_writes_evict_cached_entries(self, db):
+        """Test that deletes and updates are visible to the next lookup."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        database.get_terminal_metadata("aaaaaaaa")
+        database.delete_terminals_by_session("cao-a")
+        assert database.get_terminal_metadata("aaaaaaaa") is None
+
+        next_run = datetime(2030, 1, 1)
+        database.create_flow("f", "/tmp/f.md", "* * * * *", "developer", "q_cli", "", next_run)
+        assert database.get_flow("f").enabled is True
+        database.update_flow_enabled("f", False)
+        assert database.get_flow("f").enabled is False
+
+        database.assign_workflow_to_session("cao-a", "wf-1")
+        assert database.get_session_workflow("cao-a") == "wf-1"
+        database.assign_workflow_to_session("cao-a", "wf-2")
+        assert database.get_session_workflow("cao-a") == "wf-2"
+        database.unassign_workflow_from_session("cao-a")
+        assert database.get_session_workflow("cao-a") is None
+
+    def test_read_racing_a_delete_is_not_cached(self, db):
+        """Test that a lookup which started before a delete cannot re-insert the row."""
+        database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        generation = database._lookup_cache_generation
+        stale = database.get_terminal_metadata("aaaaaaaa")
+        database._lookup_cache.clear()
+
+        database.delete_terminal("aaaaaaaa")
+        database._cache_put("terminal", "aaaaaaaa", stale, generation)
+
+        assert database.get_terminal_metadata("aaaaaaaa") is None
+
+    def test_entries_expire(self, db):
+        """Test that a cached lookup is re-read once the TTL has passed."""
+        database.assign_workflow_to_session("cao-a", "wf-1")
+        database.get_session_workflow("cao-a")
+        with db.begin() as conn:
+            conn.exec_driver_sql("UPDATE session_workflows SET workflow_id = 'wf-2'")
+
+        assert database.get_session_workflow("cao-a") == "wf-1"
+        with patch.object(database, "DATABASE_LOOKUP_CACHE_TTL", 0):
+            assert database.get_session_workflow("cao-a") == "wf-2"
+
+
+class TestCreate:
+    """Test cases for the create helpers."""
+
+    def test_create_returns_defaults_without_reading_back(self, db):
+        """Test that created rows come back with their defaults and no follow-up SELECT."""
+        statements = []
+        event.listen(
+            db, "before_cursor_execute", lambda conn, cursor, stmt, *args: statements.append(stmt)
+        )
+
+        task = database.create_task("T-001", "Title", "Spec", "CODE")
+        workflow = database.create_workflow("wf-1", "One", None, "{}", make_nodes("a"), [])
+        state = database.create_terminal_state("aaaaaaaa", context_data="{}")
+        terminal = database.create_terminal("aaaaaaaa", "cao-a", "w", "q_cli")
+        flow = database.create_flow(
+            "f", "/tmp/f.md", "* * * * *", "developer", "q_cli", "", datetime(2030, 1, 1)
+        )
+
+        assert task["status"] == "PENDING" and task["created_at"] is not None
+        assert workflow["version"] == 1 and workflow["created_at"] is not None
+        assert state["created_at"] is not None
+        assert terminal["last_active"] is not None
+        assert flow.enabled is True
+        assert not [stmt for stmt in statements if stmt.lstrip().upper().startswith("SELECT")]
+
+
+class TestInbox:
+    """Test cases for the inbox helpers."""
+
+    def test_claim_pending_message_once(self, db):
+        """Test that a conditional status update succeeds for only the first claimant."""
+        message = database.create_inbox_message("aaaaaaaa", "bbbbbbbb", "hello")
+        claim = (message.id, MessageStatus.DELIVERED)
+
+        assert database.update_message_status(*claim, from_status=MessageStatus.PENDING)
+        assert not database.update_message_status(*claim, from_status=MessageStatus.PENDING)
+        assert database.get_pending_messages("bbbbbbbb") == []
+        assert database.update_message_status(message.id, MessageStatus.FAILED)
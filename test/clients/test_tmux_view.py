@@ -0,0 +1,179 @@
+"""Tests for shared tmux attach views."""
+
+import asyncio
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.clients.tmux_view import TmuxView, TmuxViewRegistry
+
+_create_subprocess_exec = asyncio.create_subprocess_exec
+
+
+def fake_attach(script):
+    """Stand-in for 'tmux attach' that runs a shell script on the view's PTY."""
+
+    async def spawn(*args, **kwargs):
+        spawn.calls += 1
+        return await _create_subprocess_exec("sh", "-c", script, **kwargs)
+
+    spawn.calls = 0
+    return spawn
+
+
+async def read_until(queue, token, timeout=2.0):
+    output = b""
+    while token not in output:
+        frame = await asyncio.wait_for(queue.get(), timeout)
+        assert frame is not None, f"view closed before {token!r} arrived"
+        output += frame
+    return output
+
+
+@pytest.fixture
+def mock_control():
+    with patch(
+        "cli_agent_orchestrator.clients.tmux_view.tmux_client.send_control_commands"
+    ) as mock_send:
+        yield mock_send
+
+
+class TestTmuxView:
+    """Test cases for TmuxView and TmuxViewRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_viewers_share_one_process(self, mock_control):
+        """Test that two viewers of a window share one PTY and both see its output."""
+        spawn = fake_attach("stty -echo; while read line; do echo got-$line; done")
+        registry = TmuxViewRegistry()
+        with patch(
+            "cli_agent_orchestrator.clients.tmux_view.asyncio.create_subprocess_exec", spawn
+        ):
+            view = await registry.get_or_create_view("cao-s", "w", 80, 24)
+            first = view.subscribe()
+            assert await registry.get_or_create_view("cao-s", "w", 80, 24) is view
+            second = view.subscribe()
+
+            view.write(b"hello\n")
+            assert b"got-hello" in await read_until(first, b"got-hello")
+            assert b"got-hello" in await read_until(second, b"got-hello")
+            assert spawn.calls == 1
+
+            await registry.close_all()
+            assert view.closed
+            assert await first.get() is None
+
+    @pytest.mark.asyncio
+    async def test_new_viewer_requests_redraw(self, mock_control):
+        """Test that subscribing asks tmux to repaint the shared client."""
+        with patch(
+            "cli_agent_orchestrator.clients.tmux_view.asyncio.create_subprocess_exec",
+            fake_attach("sleep 5"),
+        ):
+            view = TmuxView("cao-s", "w")
+            await view.start(80, 24)
+            view.subscribe()
+            await view._redraw_task
+            await view.close()
+
+        session_name, command = mock_control.call_args.args
+        assert session_name == "cao-s"
+        assert command.startswith("refresh-client -t /dev/")
+
+    @pytest.mark.asyncio
+    async def test_lagging_viewer_is_resynced(self, mock_control):
+        """Test that a full viewer queue is dropped and a repaint requested."""
+        with patch("cli_agent_orchestrator.clients.tmux_view.WS_SEND_QUEUE_SIZE", 2):
+            view = TmuxView("cao-s", "w")
+            queue = view.subscribe()
+            await view._redraw_task
+            mock_control.reset_mock()
+
+            view._publish(b"a")
+            view._publish(b"b")
+            view._publish(b"c")
+            await view._redraw_task
+
+        assert queue.empty()
+        mock_control.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_redraws_run_off_the_event_loop(self, mock_control):
+        """Test that repaints go through a worker thread and queued requests are merged."""
+        callers = []
+        mock_control.side_effect = lambda *args: callers.append(threading.get_ident())
+        view = TmuxView("cao-s", "w")
+
+        for _ in range(3):
+            view.request_redraw()
+        await view._redraw_task
+
+        assert len(callers) == 1
+        assert callers[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_view_closes_after_last_viewer_lingers(self, mock_control):
+        """Test that the PTY is torn down once the last viewer has been gone for the linger time."""
+        with (
+            patch(
+                "cli_agent_orchestrator.clients.tmux_view.asyncio.create_subprocess_exec",
+                fake_attach("sleep 5"),
+            ),
+            patch("cli_agent_orchestrator.clients.tmux_view.TMUX_VIEW_LINGER", 0.05),
+        ):
+            view = TmuxView("cao-s", "w")
+            await view.start(80, 24)
+            queue = view.subscribe()
+            view.unsubscribe(queue)
+
+            # A viewer returning within the linger window keeps the view alive
+            queue = view.subscribe()
+            await asyncio.sleep(0.1)
+            assert not view.closed
+
+            view.unsubscribe(queue)
+            await asyncio.sleep(0.3)
+            assert view.closed
+
+    @pytest.mark.asyncio
+    async def test_expired_view_is_not_handed_out(self, mock_control):
+        """Test that an expired view is closed and unregistered before its teardown runs."""
+        with patch(
+            "cli_agent_orchestrator.clients.tmux_view.asyncio.create_subprocess_exec",
+            fake_attach("sleep 5"),
+        ):
+            registry = TmuxViewRegistry()
+            view = await registry.get_or_create_view("cao-s", "w", 80, 24)
+            queue = view.subscribe()
+            view.unsubscribe(queue)
+
+            view._linger_expired()
+            assert view.closed
+            assert await registry.get_or_create_view("cao-s", "w", 80, 24) is not view
+
+            await registry.close_all()
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_queued_input_is_written_together(self, mock_control):
+        """Test that keystrokes queued while the writer is busy go out in one write."""
+        view = TmuxView("cao-s", "w")
+        master_fd, slave_fd = os.openpty()
+        view._master_fd = master_fd
+        try:
+            for key in (b"a", b"b", b"c"):
+                view.write(key)
+            with patch(
+                "cli_agent_orchestrator.clients.tmux_view.os.write", side_effect=os.write
+            ) as mock_write:
+                writer = asyncio.create_task(view._write_loop())
+                await asyncio.sleep(0.05)
+                writer.cancel()
+
+            mock_write.assert_called_once()
+            assert bytes(mock_write.call_args.args[1]) == b"abc"
+        finally:
+            os.close(master_fd)
+            os.close(slave_fd)
@@ -0,0 +1 @@
+"""Utility tests for CLI Agent Orchestrator."""
@@ -0,0 +1,88 @@
+"""Tests for agent profile utilities."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.utils import agent_profiles
+from cli_agent_orchestrator.utils.agent_profiles import (
+    list_installed_agents,
+    load_agent_profile,
+    read_agent_content,
+)
+
+
+@pytest.fixture
+def local_store(tmp_path):
+    """Point the local agent store at a temporary directory."""
+    with patch.object(agent_profiles, "LOCAL_AGENT_STORE_DIR", tmp_path):
+        yield tmp_path
+
+
+class TestReadAgentContent:
+    """Test cases for read_agent_content."""
+
+    def test_local_profile_takes_precedence(self, local_store):
+        """Test that a local profile shadows the built-in one."""
+        (local_store / "developer.md").write_text("local developer")
+
+        assert read_agent_content("developer").content == "local developer"
+
+    def test_builtin_profile(self, local_store):
+        """Test falling back to the built-in agent store."""
+        agent = read_agent_content("developer")
+
+        assert agent is not None
+        assert "name: developer" in agent.content
+        assert agent.last_modified is None
+
+    def test_missing_profile_returns_none(self, local_store):
+        """Test that unknown agents return None."""
+        assert read_agent_content("does-not-exist") is None
+
+    def test_local_profile_cache_invalidated_on_change(self, local_store):
+        """Test that rewriting a local profile is picked up."""
+        profile = local_store / "custom.md"
+        profile.write_text("v1")
+        first = read_agent_content("custom")
+        assert first.content == "v1"
+
+        profile.write_text("v2")
+        stat = profile.stat()
+        os.utime(profile, (stat.st_atime, stat.st_mtime + 10))
+
+        second = read_agent_content("custom")
+        assert second.content == "v2"
+        assert second.etag != first.etag
+
+
+class TestLoadAgentProfile:
+    """Test cases for load_agent_profile and list_installed_agents caching."""
+
+    def test_profile_reparsed_after_edit(self, local_store):
+        """Test that a cached profile is reused until the file changes."""
+        profile = local_store / "custom.md"
+        profile.write_text("---\nname: custom\ndescription: v1\n---\nprompt")
+        first = load_agent_profile("custom")
+        assert load_agent_profile("custom") is first
+
+        profile.write_text("---\nname: custom\ndescription: second\n---\nprompt")
+        assert load_agent_profile("custom").description == "second"
+
+    def test_missing_profile_raises(self, local_store):
+        """Test that unknown agents raise RuntimeError."""
+        with pytest.raises(RuntimeError, match="not found"):
+            load_agent_profile("does-not-exist")
+
+    def test_new_local_agent_is_listed(self, local_store):
+        """Test that adding a profile to the local store updates the cached listing."""
+        assert "custom" not in list_installed_agents()
+
+        (local_store / "custom.md").write_text("custom")
+        stat = local_store.stat()
+        os.utime(local_store, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        agents = list_installed_agents()
+        assert "custom" in agents
+        assert "developer" in agents
@@ -0,0 +1,67 @@
+"""Tests for the circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+@pytest.fixture
+def clock():
+    """Control time.monotonic as seen by the breaker."""
+    now = [100.0]
+    with patch(
+        "cli_agent_orchestrator.utils.circuit_breaker.time.monotonic", side_effect=lambda: now[0]
+    ):
+        yield now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that fail_max consecutive failures open the circuit."""
+        breaker = CircuitBreaker(fail_max=3, reset_timeout=10)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self, clock):
+        """Test that a success in between failures keeps the circuit closed."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=10)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_trial(self, clock):
+        """Test that one trial call is admitted after reset_timeout and decides the state."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=10)
+        breaker.record_failure()
+
+        clock[0] += 10
+        breaker.before_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+        # Only one trial at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        clock[0] += 10
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()